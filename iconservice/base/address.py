@@ -30,6 +30,9 @@ ICON_CONTRACT_ADDRESS_PREFIX = 'cx'
 ICON_EOA_ADDRESS_BYTES_SIZE = 20
 ICON_CONTRACT_ADDRESS_BYTES_SIZE = 21
 
+# Upper bound of the number of interned Address objects
+ADDRESS_INTERN_TABLE_MAX_SIZE = 65536
+
 
 def is_icon_address_valid(address: str) -> bool:
     """Check whether address is in icon address format or not
@@ -86,9 +89,42 @@ class AddressPrefix(IntEnum):
         raise InvalidParamsException('Invalid address prefix')
 
 
+class _AddressInternTable(object):
+    """Shares one Address object among the same addresses
+
+    Hot addresses (treasury, governance, popular tokens and so on) are converted
+    from strings and bytes over and over again.
+    Every operation on the table is a single dict operation which is atomic in CPython
+    so that the table can be used by invoke, query and validate threads without a lock.
+    The table is cleared when it is full instead of evicting entries one by one.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self._max_size = max_size
+        self._table = {}
+
+    def get(self, key):
+        return self._table.get(key)
+
+    def put(self, key, address: 'Address') -> None:
+        if len(self._table) >= self._max_size:
+            self._table.clear()
+        self._table[key] = address
+
+    def clear(self) -> None:
+        self._table.clear()
+
+    def __len__(self) -> int:
+        return len(self._table)
+
+
 class Address(object):
     """Address class
+
+    Address is immutable, so its hash value and bytes form are computed only once
+    and the same Address objects can be shared through an intern table.
     """
+    __slots__ = ('__prefix', '__body', '__bytes', '__hash')
 
     def __init__(self,
                  address_prefix: AddressPrefix,
@@ -111,6 +147,10 @@ class Address(object):
         self.__prefix = address_prefix
         self.__body = address_body
 
+        prefixed_body = address_prefix.to_bytes(1, DATA_BYTE_ORDER) + address_body
+        self.__bytes = address_body if address_prefix == AddressPrefix.EOA else prefixed_body
+        self.__hash = hash(prefixed_body)
+
     @property
     def prefix(self) -> AddressPrefix:
         """Returns address prefix part
@@ -132,10 +172,13 @@ class Address(object):
 
         :return: bool
         """
+        if self is other:
+            return True
+
         return \
             isinstance(other, Address) \
-            and self.__prefix == other.prefix \
-            and self.__body == other.body
+            and self.__body == other.__body \
+            and self.__prefix == other.__prefix
 
     def __ne__(self, other) -> bool:
         """operator != overriding
@@ -158,7 +201,7 @@ class Address(object):
 
         :return: hash value
         """
-        return hash(self.__prefix.to_bytes(1, DATA_BYTE_ORDER) + self.__body)
+        return self.__hash
 
     @property
     def is_contract(self) -> bool:
@@ -166,7 +209,7 @@ class Address(object):
 
         :return: True(contract) False(Not contract)
         """
-        return self.prefix == AddressPrefix.CONTRACT
+        return self.__prefix == AddressPrefix.CONTRACT
 
     @staticmethod
     def from_string(address: str):
@@ -185,6 +228,22 @@ class Address(object):
 
         return Address(address_prefix, address_body)
 
+    @staticmethod
+    def from_string_interned(address: str) -> 'Address':
+        """Returns the interned Address object for 42-char address
+
+        An address string found in the intern table has been validated already.
+
+        :param address: 42-char address string
+        :return: (Address)
+        """
+        interned_address = _address_intern_table.get(address)
+        if interned_address is None:
+            interned_address = Address.from_string(address)
+            _address_intern_table.put(address, interned_address)
+
+        return interned_address
+
     @staticmethod
     def from_data(prefix: AddressPrefix, data: bytes):
         hash_value = hashlib.sha3_256(data).digest()
@@ -194,31 +253,39 @@ class Address(object):
     def from_bytes(buf: bytes) -> 'Address':
         """Create Address object from bytes data
 
+        Returns the interned Address object for the same bytes
+
         :param buf: (bytes) bytes data including Address information
         :return: (Address) Address object
         """
+        # bytearray and memoryview are not hashable, so they are not interned
+        is_interned: bool = isinstance(buf, bytes)
+        if is_interned:
+            interned_address = _address_intern_table.get(buf)
+            if interned_address is not None:
+                return interned_address
+
         buf_size = len(buf)
 
         prefix = AddressPrefix.EOA
+        body = buf
         if buf_size != ICON_EOA_ADDRESS_BYTES_SIZE:
             prefix_byte = buf[0:1]
             prefix_int = int.from_bytes(prefix_byte, DATA_BYTE_ORDER)
             prefix = AddressPrefix(prefix_int)
-            buf = buf[1:]
-        return Address(prefix, buf)
+            body = buf[1:]
+
+        address = Address(prefix, body)
+        if is_interned:
+            _address_intern_table.put(buf, address)
+        return address
 
     def to_bytes(self) -> bytes:
         """Convert Address object to bytes
 
         :return: data including information of Address object
         """
-        body_bytes = self.body
-        if self.prefix != AddressPrefix.EOA:
-            prefix_byte = self.prefix.value.to_bytes(1, DATA_BYTE_ORDER)
-            address_bytes = prefix_byte + body_bytes
-        else:
-            address_bytes = body_bytes
-        return address_bytes
+        return self.__bytes
 
     @staticmethod
     def from_prefix_and_int(prefix: 'AddressPrefix', num: int):
@@ -229,6 +296,9 @@ class Address(object):
         return Address(prefix, b'\x00' * zero_size + num_bytes)
 
 
+_address_intern_table = _AddressInternTable(ADDRESS_INTERN_TABLE_MAX_SIZE)
+
+
 class MalformedAddress(Address):
     """This class only exists to support an invalid format address which was created by legacy bug
     """
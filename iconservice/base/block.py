@@ -21,6 +21,8 @@ from typing import Optional
 class Block(object):
     """Block Information included in IconScoreContext
     """
+    __slots__ = ('_height', '_hash', '_timestamp', '_prev_hash')
+
     _VERSION = 0
     # leveldb account value structure (bigendian, 1 + 32 + 32 + 32 + 32 bytes)
     # version(1)
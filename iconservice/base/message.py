@@ -23,6 +23,7 @@ if TYPE_CHECKING:
 class Message(object):
     """Data which is sent to receipt through icx_sendTransaction json-rpc api
     """
+    __slots__ = ('sender', 'value')
 
     def __init__(self, sender: Optional['Address']=None, value: int=0) -> None:
         """Constructor
@@ -23,6 +23,7 @@ if TYPE_CHECKING:
 class Transaction(object):
     """Contains transaction info
     """
+    __slots__ = ('_hash', '_index', '_origin', '_timestamp', '_nonce')
 
     def __init__(self,
                  tx_hash: Optional[bytes] = None,
@@ -190,7 +190,7 @@ class TypeConverter:
     @staticmethod
     def _convert_value_address(value: str) -> 'Address':
         if isinstance(value, str):
-            return Address.from_string(value)
+            return Address.from_string_interned(value)
         else:
             raise InvalidParamsException(f'TypeConvert Exception address value :{value}, type: {type(value)}')
 
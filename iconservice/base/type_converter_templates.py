@@ -102,6 +102,7 @@ class ConstantKeys:
     TRANSACTIONS = "transactions"
 
     FILTER = "filter"
+    PENDING = "pending"
 
     ICX_CALL = "icx_call"
     ICX_GET_BALANCE = "icx_getBalance"
@@ -181,11 +182,13 @@ type_convert_templates[ParamType.ICX_CALL] = {
     ConstantKeys.FROM: ValueType.ADDRESS,
     ConstantKeys.TO: ValueType.ADDRESS,
     ConstantKeys.DATA_TYPE: ValueType.STRING,
-    ConstantKeys.DATA: ValueType.LATER
+    ConstantKeys.DATA: ValueType.LATER,
+    ConstantKeys.PENDING: ValueType.BOOL
 }
 type_convert_templates[ParamType.ICX_GET_BALANCE] = {
     ConstantKeys.VERSION: ValueType.INT,
-    ConstantKeys.ADDRESS: ValueType.ADDRESS_OR_MALFORMED_ADDRESS
+    ConstantKeys.ADDRESS: ValueType.ADDRESS_OR_MALFORMED_ADDRESS,
+    ConstantKeys.PENDING: ValueType.BOOL
 }
 type_convert_templates[ParamType.ICX_GET_TOTAL_SUPPLY] = {
     ConstantKeys.VERSION: ValueType.INT
@@ -16,16 +16,77 @@
 
 
 import hashlib
+from bisect import bisect_left
 from collections import OrderedDict
+from itertools import islice
 from typing import TYPE_CHECKING, Optional
 
 if TYPE_CHECKING:
     from ..base.block import Block
 
 
+def keys_in_range(sorted_keys: list,
+                  prefix: Optional[bytes] = None,
+                  start: Optional[bytes] = None,
+                  stop: Optional[bytes] = None) -> list:
+    """Returns the keys which start with prefix or are in [start, stop)
+
+    :param sorted_keys: keys in the key order
+    :param prefix: key prefix
+    :param start: the first key. It can't be used with prefix
+    :param stop: the key after the last one. It can't be used with prefix
+    :return: keys in the key order
+    """
+    if prefix is not None:
+        begin = bisect_left(sorted_keys, prefix)
+        end = begin
+        while end < len(sorted_keys) and sorted_keys[end].startswith(prefix):
+            end += 1
+    else:
+        begin = 0 if start is None else bisect_left(sorted_keys, start)
+        end = len(sorted_keys) if stop is None else bisect_left(sorted_keys, stop)
+
+    return sorted_keys[begin:end]
+
+
 class Batch(OrderedDict):
     def __init__(self):
         super().__init__()
+        # (the number of keys sorted, keys in the key order)
+        self._sorted_keys = (0, [])
+
+    def sorted_keys(self) -> list:
+        """Returns the keys in the key order
+
+        Keys are kept in the order of insertion and a removal resets the sorted keys,
+        so only the keys added since the last call are sorted and merged.
+        """
+        count, keys = self._sorted_keys
+        if count < len(self):
+            keys = keys + list(islice(reversed(self), len(self) - count))
+            keys.sort()
+            self._sorted_keys = (len(keys), keys)
+
+        return keys
+
+    def keys_in_range(self,
+                      prefix: Optional[bytes] = None,
+                      start: Optional[bytes] = None,
+                      stop: Optional[bytes] = None) -> list:
+        """Returns the keys which start with prefix or are in [start, stop) in the key order
+
+        Except for sorting the keys added since the last call,
+        its cost depends on the number of the keys returned, not on the size of the batch.
+        """
+        return keys_in_range(self.sorted_keys(), prefix, start, stop)
+
+    def __delitem__(self, key: bytes) -> None:
+        self._sorted_keys = (0, [])
+        super().__delitem__(key)
+
+    def clear(self) -> None:
+        self._sorted_keys = (0, [])
+        super().clear()
 
     def digest(self) -> bytes:
         """Create sha3_256 hash value with included updated states
@@ -58,6 +119,9 @@ class TransactionBatch(Batch):
     key: Score Address
     value: IconScoreBatch
     """
+    # The maximum number of StateDB values cached in read_cache
+    MAX_READ_CACHE_SIZE = 4096
+
     def __init__(self, tx_hash: Optional[bytes]=None) -> None:
         """Constructor
 
@@ -65,9 +129,14 @@ class TransactionBatch(Batch):
         """
         super().__init__()
         self.hash = tx_hash
+        # StateDB values read during a transaction (key: value or None)
+        # StateDB is not changed until commit, so they are valid while the transaction lasts.
+        # It is not a part of the changed states.
+        self.read_cache = {}
 
     def clear(self):
         self.hash = None
+        self.read_cache.clear()
         super().clear()
 
 
@@ -77,14 +146,21 @@ class BlockBatch(Batch):
     key: Address
     value: IconScoreBatch
     """
-    def __init__(self, block: Optional['Block'] = None):
+    def __init__(self,
+                 block: Optional['Block'] = None,
+                 prev_block_batch: Optional['BlockBatch'] = None):
         """Constructor
 
         :param block: block info
+        :param prev_block_batch: the batch of the parent block if it has not been committed yet
         """
         super().__init__()
         self.block = block
+        # The states of the uncommitted ancestors are read through it.
+        # It is not a part of the changed states.
+        self.prev_block_batch = prev_block_batch
 
     def clear(self) -> None:
         self.block = None
+        self.prev_block_batch = None
         super().clear()
@@ -14,7 +14,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Optional, Iterator, Tuple
 
 import plyvel
 
@@ -24,6 +24,7 @@ from iconservice.icon_constant import ICON_DB_LOG_TAG
 from iconservice.iconscore.icon_score_context import ContextGetter
 from iconservice.iconscore.icon_score_context import IconScoreContextType
 from iconservice.iconscore.icon_score_context import IconScoreFuncType
+from iconservice.database.write_behind import BlockBatchWriter
 
 if TYPE_CHECKING:
     from iconservice.iconscore.icon_score_context import IconScoreContext
@@ -37,6 +38,33 @@ def _get_context_type(context: 'IconScoreContext') -> 'IconScoreContextType':
         return context.type
 
 
+def _is_batch_readable_on_context(context: 'IconScoreContext') -> bool:
+    """Check if the states in the batches of a given context are read over StateDB
+
+    A query context has batches when it is made on the states of a precommitted block.
+
+    :param context:
+    :return:
+    """
+    context_type = _get_context_type(context)
+
+    return context_type == IconScoreContextType.INVOKE or \
+        (context_type == IconScoreContextType.QUERY and context.block_batch is not None)
+
+
+def _is_read_ahead_allowed_on_context(context: 'IconScoreContext') -> bool:
+    """Check if values can be read from StateDB ahead of their use on a given context
+
+    It is allowed if the writes on the context are made in its batches, where they can be looked up,
+    or if no write can be made on it.
+
+    :param context:
+    :return:
+    """
+    return _get_context_type(context) == IconScoreContextType.INVOKE or \
+        not _is_db_writable_on_context(context)
+
+
 def _is_db_writable_on_context(context: 'IconScoreContext'):
     """Check if db is writable on a given context
 
@@ -54,6 +82,31 @@ def _is_db_writable_on_context(context: 'IconScoreContext'):
         func_type != IconScoreFuncType.READONLY
 
 
+def _merge_overlay(db_iterator: Iterator[Tuple[bytes, bytes]],
+                   overlay: dict) -> Iterator[Tuple[bytes, bytes]]:
+    overlay_keys = sorted(overlay)
+    index = 0
+
+    for key, value in db_iterator:
+        while index < len(overlay_keys) and overlay_keys[index] < key:
+            overlay_key = overlay_keys[index]
+            index += 1
+            if overlay[overlay_key] is not None:
+                yield overlay_key, overlay[overlay_key]
+
+        if index < len(overlay_keys) and overlay_keys[index] == key:
+            index += 1
+            value = overlay[key]
+            if value is None:
+                continue
+
+        yield key, value
+
+    for overlay_key in overlay_keys[index:]:
+        if overlay[overlay_key] is not None:
+            yield overlay_key, overlay[overlay_key]
+
+
 class KeyValueDatabase(object):
     @staticmethod
     def from_path(path: str,
@@ -73,6 +126,36 @@ class KeyValueDatabase(object):
         :param db: plyvel db instance
         """
         self._db = db
+        self._writer: Optional['BlockBatchWriter'] = None
+
+    @property
+    def writer(self) -> Optional['BlockBatchWriter']:
+        return self._writer
+
+    def start_write_behind(self, max_queue_size: int) -> None:
+        """Makes all the following writes be done on a writer thread
+
+        The states which have not been written yet are read from the writer.
+        See BlockBatchWriter for the rules.
+
+        :param max_queue_size: the number of the writes which can be pending
+        """
+        if self._writer is not None:
+            return
+
+        self._writer = BlockBatchWriter(self._write_states, max_queue_size)
+        self._writer.start()
+
+    def stop_write_behind(self) -> None:
+        """Writes all the pending states and stops the writer thread
+        """
+        if self._writer is None:
+            return
+
+        writer = self._writer
+        writer.stop()
+        self._writer = None
+        writer.flush()
 
     def get(self, key: bytes) -> bytes:
         """Get value from db using key
@@ -80,6 +163,11 @@ class KeyValueDatabase(object):
         :param key: db key
         :return: value indicated by key otherwise None
         """
+        if self._writer is not None:
+            is_pending, value = self._writer.lookup(key)
+            if is_pending:
+                return value
+
         return self._db.get(key)
 
     def put(self, key: bytes, value: bytes) -> None:
@@ -88,6 +176,10 @@ class KeyValueDatabase(object):
         :param key: (bytes): db key
         :param value: (bytes): db에 저장할 데이터
         """
+        if self._writer is not None:
+            self._writer.submit({key: value})
+            return
+
         self._db.put(key, value)
 
     def delete(self, key: bytes) -> None:
@@ -95,14 +187,21 @@ class KeyValueDatabase(object):
 
         :param key: delete the row indicated by key.
         """
+        if self._writer is not None:
+            self._writer.submit({key: None})
+            return
+
         self._db.delete(key)
 
     def close(self) -> None:
         """Close db
         """
-        if self._db:
-            self._db.close()
-            self._db = None
+        try:
+            self.stop_write_behind()
+        finally:
+            if self._db:
+                self._db.close()
+                self._db = None
 
     def get_sub_db(self, key: bytes):
         """Get Prefixed db
@@ -111,24 +210,62 @@ class KeyValueDatabase(object):
         """
         return KeyValueDatabase(self._db.prefixed_db(key))
 
-    def iterator(self) -> iter:
-        return self._db.iterator()
+    def iterator(self,
+                 prefix: Optional[bytes] = None,
+                 start: Optional[bytes] = None,
+                 stop: Optional[bytes] = None) -> iter:
+        """
+        :param prefix: iterates only the keys which start with prefix
+        :param start: iterates only the keys >= start. It can't be used with prefix
+        :param stop: iterates only the keys < stop. It can't be used with prefix
+        """
+        if self._writer is None:
+            return self._db.iterator(prefix=prefix, start=start, stop=stop)
+
+        # The pending states are copied before the iterator is created
+        # not to miss the ones written in the meantime
+        overlay = self._writer.pending_states(prefix, start, stop)
+        db_iterator = self._db.iterator(prefix=prefix, start=start, stop=stop)
+
+        if len(overlay) == 0:
+            return db_iterator
+        return _merge_overlay(db_iterator, overlay)
 
-    def write_batch(self, states: dict) -> None:
+    def write_batch(self, states: dict, sync: bool = False) -> None:
         """bulk data modification
 
+        All the states are written atomically.
+        states is handed over without being copied, so it should not be modified afterwards.
+
         :param states: key:value pairs
             key and value should be bytes type
+            a falsy value deletes the key and is replaced with None in place
+        :param sync: if True, returns after the states are flushed to the disk.
+            On write-behind, it waits for all the pending states to be written
+            and raises DatabaseException if the writer has failed
         """
         if states is None or len(states) == 0:
             return
 
-        with self._db.write_batch() as wb:
+        for key, value in states.items():
+            if not value and value is not None:
+                states[key] = None
+
+        if self._writer is not None:
+            self._writer.submit(states, sync)
+            if sync:
+                self._writer.flush()
+            return
+
+        self._write_states(states, sync)
+
+    def _write_states(self, states: dict, sync: bool) -> None:
+        with self._db.write_batch(transaction=True, sync=sync) as wb:
             for key, value in states.items():
-                if value:
-                    wb.put(key, value)
-                else:
+                if value is None:
                     wb.delete(key)
+                else:
+                    wb.put(key, value)
 
 
 class DatabaseObserver(object):
@@ -208,9 +345,7 @@ class ContextDatabase(object):
         :param key:
         :return: value
         """
-        context_type = _get_context_type(context)
-
-        if context_type == IconScoreContextType.INVOKE:
+        if _is_batch_readable_on_context(context):
             return self.get_from_batch(context, key)
         else:
             return self.key_value_db.get(key)
@@ -223,7 +358,9 @@ class ContextDatabase(object):
         Search order
         1. TransactionBatch
         2. BlockBatch
-        3. StateDB
+        3. BlockBatches of the uncommitted ancestor blocks
+        4. StateDB values already read in the transaction
+        5. StateDB
 
         :param context:
         :param key:
@@ -237,12 +374,89 @@ class ContextDatabase(object):
         if key in tx_batch:
             return tx_batch[key]
 
-        # get value from block_batch
-        if key in block_batch:
-            return block_batch[key]
+        # get value from block_batch and the ones of the uncommitted ancestors
+        while block_batch is not None:
+            if key in block_batch:
+                return block_batch[key]
+            block_batch = block_batch.prev_block_batch
+
+        read_cache: dict = tx_batch.read_cache
+        if key in read_cache:
+            return read_cache[key]
 
         # get value from state_db
-        return self.key_value_db.get(key)
+        value = self.key_value_db.get(key)
+        if len(read_cache) >= tx_batch.MAX_READ_CACHE_SIZE:
+            read_cache.clear()
+        read_cache[key] = value
+        return value
+
+    def iterator(self,
+                 context: Optional['IconScoreContext'],
+                 prefix: Optional[bytes] = None,
+                 start: Optional[bytes] = None,
+                 stop: Optional[bytes] = None) -> Iterator[Tuple[bytes, bytes]]:
+        """Iterates the key-value pairs whose keys start with prefix
+        or are in [start, stop) in the key order
+
+        On invoke and pending query, the states in TransactionBatch and BlockBatch are merged
+        into the ones in StateDB and deleted keys are skipped.
+
+        :param context:
+        :param prefix: key prefix
+        :param start: the first key. It can't be used with prefix
+        :param stop: the key after the last one. It can't be used with prefix
+        :return: (key, value) iterator
+        """
+        db_iterator = self.key_value_db.iterator(prefix=prefix, start=start, stop=stop)
+
+        # The overlay is copied so that the batches can be changed during iteration.
+        # Only the keys in the range are looked up in each batch.
+        overlay = {}
+        for batch in reversed(self._get_batches(context)):
+            for key in batch.keys_in_range(prefix, start, stop):
+                overlay[key] = batch[key]
+
+        if len(overlay) == 0:
+            return db_iterator
+        return _merge_overlay(db_iterator, overlay)
+
+    def is_changed_in_range(self,
+                            context: Optional['IconScoreContext'],
+                            start: Optional[bytes] = None,
+                            stop: Optional[bytes] = None) -> bool:
+        """Returns whether any of the batches readable on context has a key in [start, stop)
+
+        :param context:
+        :param start: the first key
+        :param stop: the key after the last one
+        """
+        return any(len(batch.keys_in_range(start=start, stop=stop)) > 0
+                   for batch in self._get_batches(context))
+
+    def is_changed(self, context: Optional['IconScoreContext'], key: bytes) -> bool:
+        """Returns whether any of the batches readable on context has the key
+
+        :param context:
+        :param key:
+        """
+        return any(key in batch for batch in self._get_batches(context))
+
+    @staticmethod
+    def _get_batches(context: Optional['IconScoreContext']) -> list:
+        """Returns the batches from the transaction to the oldest uncommitted ancestor
+
+        It is empty if the batches are not readable on context.
+        """
+        if not _is_batch_readable_on_context(context):
+            return []
+
+        batches = [context.tx_batch]
+        block_batch = context.block_batch
+        while block_batch is not None:
+            batches.append(block_batch)
+            block_batch = block_batch.prev_block_batch
+        return batches
 
     def put(self,
             context: Optional['IconScoreContext'],
@@ -294,13 +508,14 @@ class ContextDatabase(object):
 
     def write_batch(self,
                     context: 'IconScoreContext',
-                    states: dict):
+                    states: dict,
+                    sync: bool = False):
 
         if not _is_db_writable_on_context(context):
             raise DatabaseException(
                 'write_batch is not allowed on readonly context')
 
-        return self.key_value_db.write_batch(states)
+        return self.key_value_db.write_batch(states, sync=sync)
 
     @staticmethod
     def from_path(path: str,
@@ -314,6 +529,9 @@ class IconScoreDatabase(ContextGetter):
 
     IconScore can access its states only through IconScoreDatabase
     """
+    # Joins the prefixes of the sub dbs and their keys
+    _SEPARATOR = b'|'
+
     def __init__(self,
                  address: 'Address',
                  context_db: 'ContextDatabase',
@@ -329,6 +547,11 @@ class IconScoreDatabase(ContextGetter):
         self._context_db = context_db
         self._observer: DatabaseObserver = None
 
+        # Every key of this db starts with it
+        self._key_prefix: bytes = self._make_key_prefix(address, prefix)
+        # key prefix: depth of the containers declared on this db and its sub dbs
+        self._containers = {}
+
     def get(self, key: bytes) -> bytes:
         hashed_key = self._hash_key(key)
         value = self._context_db.get(self._context, hashed_key)
@@ -338,14 +561,79 @@ class IconScoreDatabase(ContextGetter):
 
     def put(self, key: bytes, value: bytes):
         hashed_key = self._hash_key(key)
+        context = self._context
         if self._observer:
-            old_value = self._context_db.get(self._context, hashed_key)
+            # Steps are charged before writing, so the old value is looked up first.
+            # On invoke, a value read before in the transaction is not read from StateDB again.
+            old_value = self._context_db.get(context, hashed_key)
             if value:
-                self._observer.on_put(self._context, key, old_value, value)
+                self._observer.on_put(context, key, old_value, value)
             elif old_value:
                 # If new value is None, then deletes the field
-                self._observer.on_delete(self._context, key, old_value)
-        self._context_db.put(self._context, hashed_key, value)
+                self._observer.on_delete(context, key, old_value)
+        self._context_db.put(context, hashed_key, value)
+
+    def iterator(self, key_prefix: bytes = b'') -> Iterator[Tuple[bytes, bytes]]:
+        """Iterates the key-value pairs of this db in the key order
+
+        Every key which starts with the prefix of this db is returned,
+        including the ones which contain the separator.
+        The keys of a sub db are returned as well, joined with the prefix of the sub db by the separator.
+        declare_container() keeps the containers from sharing a range with each other.
+        Each pair returned is charged like a get.
+
+        :param key_prefix: iterates only the keys which start with key_prefix
+        :return: (key, value) iterator. Keys are the ones passed to put()
+        """
+        db_prefix: bytes = self._key_prefix
+        context = self._context
+
+        for hashed_key, value in self._context_db.iterator(context, db_prefix + key_prefix):
+            key = hashed_key[len(db_prefix):]
+            if self._observer:
+                self._observer.on_get(context, key, value)
+            yield key, value
+
+    def get_many(self, keys: list) -> Iterator[bytes]:
+        """Returns the values of keys read in one pass over the key range which they span
+
+        Each value is charged like a get when it is returned,
+        so the values which are not consumed are not charged.
+        It is efficient when few other keys are stored between the given ones.
+        If the states in the range have been changed in the batches,
+        the values are read one by one instead of merging the batches into the range.
+        A value read ahead is not returned if its key has been changed in the batches
+        before it is consumed. On the contexts which write to StateDB directly, every value is read when consumed.
+
+        :param keys: keys passed to put()
+        :return: value iterator in the order of keys. A value is None if its key is not found
+        """
+        if len(keys) == 0:
+            return
+
+        hashed_keys = [self._hash_key(key) for key in keys]
+        context = self._context
+
+        start: bytes = min(hashed_keys)
+        # b'\x00' makes the stop key the smallest one after the last key
+        stop: bytes = max(hashed_keys) + b'\x00'
+
+        context_db = self._context_db
+        if not _is_read_ahead_allowed_on_context(context) or \
+                context_db.is_changed_in_range(context, start, stop):
+            values = None
+        else:
+            values = dict(context_db.key_value_db.iterator(start=start, stop=stop))
+
+        for key, hashed_key in zip(keys, hashed_keys):
+            # The key can be changed through another db object while the values are consumed
+            if values is None or context_db.is_changed(context, hashed_key):
+                value = context_db.get(context, hashed_key)
+            else:
+                value = values.get(hashed_key)
+            if self._observer:
+                self._observer.on_get(context, key, value)
+            yield value
 
     def get_sub_db(self, prefix: bytes) -> 'IconScoreDatabase':
         if prefix is None:
@@ -354,23 +642,55 @@ class IconScoreDatabase(ContextGetter):
                 'prefix is None in IconScoreDatabase.get_sub_db()')
 
         if self._prefix is not None:
-            prefix = b'|'.join([self._prefix, prefix])
+            prefix = self._SEPARATOR.join([self._prefix, prefix])
 
         icon_score_database = IconScoreDatabase(
             self.address, self._context_db, prefix)
 
         icon_score_database.set_observer(self._observer)
+        icon_score_database._containers = self._containers
 
         return icon_score_database
 
+    def declare_container(self, prefix: bytes, depth: int) -> 'IconScoreDatabase':
+        """Returns the sub db of a container after checking that it doesn't overlap the others
+
+        A container overlaps another one declared on the dbs of the same SCORE
+        if it has the same prefix and a different depth,
+        or if its prefix followed by the separator starts the prefix of the other one.
+        Their keys would be stored in the same range.
+
+        :param prefix: prefix of the container passed to get_sub_db()
+        :param depth: the number of the nested levels of the container
+        :return: the sub db of the container
+        """
+        sub_db = self.get_sub_db(prefix)
+        key_prefix: bytes = sub_db._key_prefix
+
+        declared_depth: Optional[int] = self._containers.get(key_prefix)
+        if declared_depth == depth:
+            return sub_db
+        if declared_depth is not None:
+            raise DatabaseException(
+                f'Container is declared with another depth: {prefix} ({declared_depth} != {depth})')
+
+        # Copied as the containers can be declared on other threads
+        for other_key_prefix in list(self._containers):
+            if key_prefix.startswith(other_key_prefix) or other_key_prefix.startswith(key_prefix):
+                raise DatabaseException(f'Container overlaps another one: {prefix}')
+
+        self._containers[key_prefix] = depth
+        return sub_db
+
     def delete(self, key: bytes):
         hashed_key = self._hash_key(key)
+        context = self._context
         if self._observer:
-            old_value = self._context_db.get(self._context, hashed_key)
+            old_value = self._context_db.get(context, hashed_key)
             # If old value is None, won't fire the callback
             if old_value:
-                self._observer.on_delete(self._context, key, old_value)
-        self._context_db.delete(self._context, hashed_key)
+                self._observer.on_delete(context, key, old_value)
+        self._context_db.delete(context, hashed_key)
 
     def close(self):
         self._context_db.close(self._context)
@@ -385,9 +705,13 @@ class IconScoreDatabase(ContextGetter):
         :params key: key passed by SCORE
         :return: key bytes
         """
-        data = [self.address.to_bytes()]
-        if self._prefix is not None:
-            data.append(self._prefix)
-        data.append(key)
+        return self._key_prefix + key
+
+    @staticmethod
+    def _make_key_prefix(address: 'Address', prefix: Optional[bytes]) -> bytes:
+        data = [address.to_bytes()]
+        if prefix is not None:
+            data.append(prefix)
+        data.append(b'')
 
-        return b'|'.join(data)
+        return IconScoreDatabase._SEPARATOR.join(data)
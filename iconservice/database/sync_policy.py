@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+
+
+class DatabaseSyncPolicy(object):
+    """Decides which block commits are written to StateDB with sync
+
+    A block is written atomically in any case, so StateDB never gets ahead of the last block info.
+    A block written without sync can be lost by an OS crash or a power failure,
+    so up to interval_blocks - 1 blocks (or the blocks committed during interval_ms)
+    may have to be invoked and committed again after restart.
+    On write-behind, a block written with sync is written with all the blocks pending before it
+    when the commit returns. The blocks written without sync after it can be lost by a process crash as well.
+    """
+
+    def __init__(self, interval_blocks: int = 0, interval_ms: int = 0, unsynced_blocks: int = 0) -> None:
+        """Constructor
+
+        :param interval_blocks: a block is written with sync every interval_blocks blocks.
+            1 means every block and 0 means never.
+        :param interval_ms: a block is written with sync if interval_ms has passed since the last sync.
+            0 disables it.
+        :param unsynced_blocks: the number of the blocks written without sync before
+        """
+        self._interval_blocks = max(interval_blocks, 0)
+        self._interval_ms = max(interval_ms, 0)
+        self._unsynced_blocks = max(unsynced_blocks, 0)
+        self._last_sync_time = time.monotonic()
+
+    @property
+    def unsynced_blocks(self) -> int:
+        """The number of the blocks written without sync since the last sync
+        """
+        return self._unsynced_blocks
+
+    def is_sync_required(self) -> bool:
+        """Returns whether the next block should be written with sync
+        """
+        if 0 < self._interval_blocks <= self._unsynced_blocks + 1:
+            return True
+
+        if self._interval_ms > 0:
+            elapsed_ms = (time.monotonic() - self._last_sync_time) * 1000
+            return elapsed_ms >= self._interval_ms
+
+        return False
+
+    def on_write(self, sync: bool) -> None:
+        """Records a block written to StateDB
+
+        :param sync: whether the block has been written with sync
+        """
+        if sync:
+            self._unsynced_blocks = 0
+            self._last_sync_time = time.monotonic()
+        else:
+            self._unsynced_blocks += 1
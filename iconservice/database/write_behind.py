@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+from collections import deque
+from threading import Condition, Thread
+from typing import Optional, Tuple
+
+from iconcommons.logger import Logger
+from .batch import keys_in_range
+from ..base.exception import DatabaseException
+from ..icon_constant import ICON_DB_LOG_TAG
+
+
+class BlockBatchWriter(object):
+    """Writes the states handed over by commit to StateDB on a writer thread
+
+    Rules
+    - Read-your-writes: the states stay visible through lookup() and pending_states()
+      until they have been written to StateDB, so a reader sees either of them.
+    - Ordering: the states are written in the order they have been submitted.
+    - Crash-safety: the states submitted but not written yet are lost by a crash,
+      even a process crash. As each block is written with its block info atomically,
+      StateDB is left at an earlier block and the lost blocks are to be committed again.
+      KeyValueDatabase.write_batch() flushes the queue on a write with sync,
+      so up to max_queue_size blocks written without sync can be lost this way.
+    - Failure: once a write fails, nothing is written any more
+      and the following submit() and flush() raise DatabaseException.
+    """
+
+    def __init__(self, write_func: callable, max_queue_size: int = 8) -> None:
+        """Constructor
+
+        :param write_func: write_func(states: dict, sync: bool) writes the states to StateDB
+        :param max_queue_size: submit() waits while this number of batches are pending
+        """
+        self._write_func = write_func
+        self._max_queue_size = max(max_queue_size, 1)
+
+        # [states, sync, keys of states in the key order or None] pending in the order of submission
+        self._queue = deque()
+        self._condition = Condition()
+        self._thread: Optional['Thread'] = None
+        self._running = False
+        self._error: Optional[BaseException] = None
+
+        self._written_count = 0
+        self._last_write_latency_ms = 0.0
+        self._max_write_latency_ms = 0.0
+
+    @property
+    def queue_depth(self) -> int:
+        """The number of batches which have not been written yet
+        """
+        with self._condition:
+            return len(self._queue)
+
+    @property
+    def metrics(self) -> dict:
+        with self._condition:
+            return {
+                'queueDepth': len(self._queue),
+                'writtenCount': self._written_count,
+                'lastWriteLatencyMs': self._last_write_latency_ms,
+                'maxWriteLatencyMs': self._max_write_latency_ms
+            }
+
+    def start(self) -> None:
+        with self._condition:
+            if self._running:
+                return
+            self._running = True
+
+        self._thread = Thread(target=self._run, name='BlockBatchWriter', daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stops the writer thread after writing all the pending states
+        """
+        with self._condition:
+            if not self._running:
+                return
+            self._running = False
+            self._condition.notify_all()
+
+        self._thread.join()
+        self._thread = None
+
+    def submit(self, states: dict, sync: bool = False) -> None:
+        """Hands over the states to the writer thread
+
+        :param states: key:value pairs. None deletes the key
+        :param sync: whether to write them with sync
+        """
+        with self._condition:
+            while len(self._queue) >= self._max_queue_size and self._error is None:
+                self._condition.wait()
+            self._check_error()
+
+            self._queue.append([states, sync, None])
+            self._condition.notify_all()
+
+    def flush(self) -> None:
+        """Waits until all the pending states are written
+        """
+        with self._condition:
+            while len(self._queue) > 0 and self._error is None:
+                self._condition.wait()
+            self._check_error()
+
+    def lookup(self, key: bytes) -> Tuple[bool, Optional[bytes]]:
+        """Finds the latest pending value of a key
+
+        :param key:
+        :return: (True, value) if the key is pending otherwise (False, None)
+            value is None if the key is to be deleted
+        """
+        with self._condition:
+            for states, _, _ in reversed(self._queue):
+                if key in states:
+                    return True, states[key]
+
+        return False, None
+
+    def pending_states(self,
+                       prefix: Optional[bytes] = None,
+                       start: Optional[bytes] = None,
+                       stop: Optional[bytes] = None) -> dict:
+        """Returns the pending states merged in the order of submission
+
+        If a range is given, the keys of each pending batch are sorted once
+        and only the ones in the range are looked up.
+
+        :param prefix: returns only the keys which start with prefix
+        :param start: returns only the keys >= start. It can't be used with prefix
+        :param stop: returns only the keys < stop. It can't be used with prefix
+        """
+        with self._condition:
+            entries = list(self._queue)
+
+        merged = {}
+        for entry in entries:
+            states = entry[0]
+            if prefix is None and start is None and stop is None:
+                merged.update(states)
+                continue
+
+            if entry[2] is None:
+                # The states are not changed after submitted
+                entry[2] = sorted(states)
+            for key in keys_in_range(entry[2], prefix, start, stop):
+                merged[key] = states[key]
+
+        return merged
+
+    def _check_error(self) -> None:
+        if self._error is not None:
+            raise DatabaseException(f'Failed to write states to StateDB: {self._error}')
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while len(self._queue) == 0 and self._running:
+                    self._condition.wait()
+                if len(self._queue) == 0:
+                    return
+                states, sync, _ = self._queue[0]
+
+            start_time = time.monotonic()
+            try:
+                self._write_func(states, sync)
+            except BaseException as e:
+                Logger.error(f'Failed to write states to StateDB: {e}', ICON_DB_LOG_TAG)
+                with self._condition:
+                    self._error = e
+                    self._condition.notify_all()
+                return
+            latency_ms = (time.monotonic() - start_time) * 1000
+
+            # The states are removed from the queue after written, so they are always visible to readers
+            with self._condition:
+                self._queue.popleft()
+                self._written_count += 1
+                self._last_write_latency_ms = latency_ms
+                self._max_write_latency_ms = max(self._max_write_latency_ms, latency_ms)
+                self._condition.notify_all()
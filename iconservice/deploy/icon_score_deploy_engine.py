@@ -16,7 +16,7 @@
 from collections import namedtuple
 from os import path, symlink, makedirs
 from shutil import copytree
-from typing import TYPE_CHECKING, Callable
+from typing import TYPE_CHECKING, Callable, Union, Optional
 
 from iconcommons import Logger
 from . import DeployType
@@ -29,10 +29,12 @@ from ..base.message import Message
 from ..base.exception import InvalidParamsException, ServerErrorException
 from ..base.type_converter import TypeConverter
 from ..icon_constant import IconDeployFlag, ICON_DEPLOY_LOG_TAG, DEFAULT_BYTE_SIZE
+from ..utils import sha3_256
 
 if TYPE_CHECKING:
     from ..iconscore.icon_score_context import IconScoreContext
     from .icon_score_deploy_storage import IconScoreDeployTXParams
+    from .icon_score_package_staging import IconScorePackageStaging
 
 
 class IconScoreDeployEngine(object):
@@ -52,20 +54,24 @@ class IconScoreDeployEngine(object):
         self._icon_score_deployer = None
         self._icon_builtin_score_loader = None
         self._icon_score_manager = None
+        self._package_staging = None
 
     def open(self,
              score_root_path: str,
              flag: int,
-             icon_deploy_storage: 'IconScoreDeployStorage') -> None:
+             icon_deploy_storage: 'IconScoreDeployStorage',
+             package_staging: Optional['IconScorePackageStaging'] = None) -> None:
         """open
 
         :param score_root_path:
         :param flag: flags composed by IconScoreDeployEngine
         :param icon_deploy_storage:
+        :param package_staging: packages extracted ahead of invoke
         """
         self._flag = flag
         self._icon_score_deploy_storage = icon_deploy_storage
         self._icon_score_deployer: IconScoreDeployer = IconScoreDeployer(score_root_path)
+        self._package_staging = package_staging
 
     @property
     def icon_deploy_storage(self):
@@ -112,6 +118,25 @@ class IconScoreDeployEngine(object):
             Logger.warning('Failed to write deploy info and tx params', ICON_DEPLOY_LOG_TAG)
             raise e
 
+    def stage(self, tx_hash: bytes, data: dict) -> None:
+        """Extracts and validates the package of a deploy tx ahead of invoke
+
+        It is called on the validate thread.
+        A package which fails here is not rejected; it fails again on invoke.
+
+        :param tx_hash: deploy tx hash
+        :param data: data of a deploy tx
+        """
+        package_staging = self._package_staging
+        if package_staging is None or data.get('contentType') != 'application/zip' or \
+                not package_staging.is_stageable(tx_hash):
+            return
+
+        try:
+            package_staging.stage(bytes.fromhex(data['content'][2:]), tx_hash)
+        except BaseException as e:
+            Logger.warning(f'Failed to stage a SCORE package: {e}', ICON_DEPLOY_LOG_TAG)
+
     def _check_audit_ignore(self, context: 'IconScoreContext', icon_score_address: Address):
         is_built_score = IconBuiltinScoreLoader.is_builtin_score(icon_score_address)
         is_owner = context.tx.origin == self._icon_score_deploy_storage.get_score_owner(context, icon_score_address)
@@ -150,13 +175,14 @@ class IconScoreDeployEngine(object):
         if content_type == 'application/tbears':
             if not self._is_flag_on(IconDeployFlag.ENABLE_TBEARS_MODE):
                 raise InvalidParamsException(f"can't symlink deploy")
+            content = data.get('content')
         elif content_type == 'application/zip':
-            data['content'] = bytes.fromhex(data['content'][2:])
+            content = bytes.fromhex(data['content'][2:])
         else:
             raise InvalidParamsException(
                 f'Invalid contentType: {content_type}')
 
-        self._on_deploy(context, tx_params)
+        self._on_deploy(context, tx_params, content)
 
     def _score_deploy_for_builtin(self, context: 'IconScoreContext',
                                   icon_score_address: 'Address',
@@ -226,20 +252,21 @@ class IconScoreDeployEngine(object):
 
     def _on_deploy(self,
                    context: 'IconScoreContext',
-                   tx_params: 'IconScoreDeployTXParams') -> None:
+                   tx_params: 'IconScoreDeployTXParams',
+                   content: Union[str, bytes]) -> None:
         """
         load score on memory
         write file system
         call on_deploy(install, update)
 
         :param tx_params: use deploy_data, score_address, tx_hash, deploy_type from IconScoreDeployTxParams
+        :param content: zip content (application/zip) or score path (application/tbears)
         :return:
         """
 
         data = tx_params.deploy_data
         score_address = tx_params.score_address
         content_type: str = data.get('contentType')
-        content: bytes = data.get('content')
         params: dict = data.get('params', {})
 
         _, next_tx_hash =\
@@ -260,10 +287,13 @@ class IconScoreDeployEngine(object):
             except FileExistsError:
                 pass
         else:
-            self._icon_score_deployer.deploy(
-                address=score_address,
-                data=content,
-                tx_hash=next_tx_hash)
+            install_path = self._icon_score_deployer.make_install_path(score_address, next_tx_hash)
+            if self._package_staging is None or \
+                    not self._package_staging.install(sha3_256(content), install_path):
+                self._icon_score_deployer.deploy(
+                    address=score_address,
+                    data=content,
+                    tx_hash=next_tx_hash)
 
         backup_msg = context.msg
         backup_tx = context.tx
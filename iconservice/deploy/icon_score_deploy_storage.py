@@ -15,7 +15,7 @@
 
 import json
 from struct import pack, unpack
-from typing import TYPE_CHECKING, Optional, Tuple
+from typing import TYPE_CHECKING, Optional, Tuple, Iterator
 
 from . import DeployType, DeployState
 from ..base.address import Address, ICON_EOA_ADDRESS_BYTES_SIZE, ICON_CONTRACT_ADDRESS_BYTES_SIZE
@@ -299,6 +299,16 @@ class IconScoreDeployStorage(object):
         else:
             return None
 
+    def get_active_deploy_infos(self) -> Iterator['IconScoreDeployInfo']:
+        """Iterates the deploy infos of the active scores in the committed state
+
+        :return: deploy infos in the key order
+        """
+        for _, value in self._db.key_value_db.iterator(prefix=self._DEPLOY_STORAGE_DEPLOY_INFO_PREFIX):
+            deploy_info = IconScoreDeployInfo.from_bytes(value)
+            if deploy_info.deploy_state == DeployState.ACTIVE:
+                yield deploy_info
+
     def _put_deploy_tx_params(self, context: 'IconScoreContext', deploy_tx_params: 'IconScoreDeployTXParams') -> None:
         """
 
@@ -17,17 +17,35 @@ import io
 import os
 import zipfile
 import shutil
+from typing import Callable, List, Tuple
 
 from iconservice.base.address import Address
 from iconservice.base.exception import ScoreInstallException, ScoreInstallExtractException
+from iconservice.icon_constant import MAX_SCORE_FILE_SIZE, MAX_SCORE_PACKAGE_SIZE
+
+# (zip_info, file_path, parent_directory)
+_ZipEntry = Tuple['zipfile.ZipInfo', str, str]
 
 
 class IconScoreDeployer(object):
     """Score installer.
     """
 
-    def __init__(self, score_root_path: str) -> None:
+    CHUNK_SIZE = 64 * 1024
+
+    def __init__(self,
+                 score_root_path: str,
+                 max_file_size: int = MAX_SCORE_FILE_SIZE,
+                 max_package_size: int = MAX_SCORE_PACKAGE_SIZE) -> None:
+        """Constructor
+
+        :param score_root_path:
+        :param max_file_size: max decompressed size of a file in a package
+        :param max_package_size: max decompressed size of all files in a package
+        """
         self.score_root_path = score_root_path
+        self._max_file_size = max_file_size
+        self._max_package_size = max_package_size
 
     def deploy(self,
                address: 'Address',
@@ -41,9 +59,7 @@ class IconScoreDeployer(object):
         :return:
         """
 
-        score_root_path = os.path.join(self.score_root_path, address.to_bytes().hex())
-        converted_tx_hash = f'0x{bytes.hex(tx_hash)}'
-        install_path = os.path.join(score_root_path, converted_tx_hash)
+        install_path = self.make_install_path(address, tx_hash)
 
         try:
             if os.path.isfile(install_path):
@@ -55,58 +71,149 @@ class IconScoreDeployer(object):
             if not os.path.exists(install_path):
                 os.makedirs(install_path)
 
-            file_info_generator = IconScoreDeployer._extract_files_gen(data)
-            for name, file_info, parent_directory in file_info_generator:
-                if not os.path.exists(os.path.join(install_path, parent_directory)):
-                    os.makedirs(os.path.join(install_path, parent_directory))
-                with file_info as file_info_context, open(os.path.join(install_path, name), 'wb') as dest:
-                    contents = file_info_context.read()
-                    dest.write(contents)
+            self.extract(data, install_path)
         except BaseException as e:
             shutil.rmtree(install_path, ignore_errors=True)
             raise e
 
-    @staticmethod
-    def _extract_files_gen(data: bytes):
-        """Yield (filename, file_information, parent_directory_name) tuple.
+    def make_install_path(self, address: 'Address', tx_hash: bytes) -> str:
+        score_root_path = os.path.join(self.score_root_path, address.to_bytes().hex())
+        converted_tx_hash = f'0x{bytes.hex(tx_hash)}'
+        return os.path.join(score_root_path, converted_tx_hash)
+
+    def extract(self, data: bytes, dest_path: str) -> int:
+        """Extracts a zip into an existing directory and flushes it to disk
 
         :param data: The byte value of the zip file.
-        :return:
+        :param dest_path:
+        :return: the total size of the extracted files
+        """
+        total_size: int = self._extract(data, dest_path)
+        self._fsync_tree(dest_path)
+        return total_size
+
+    def _extract(self, data: bytes, install_path: str) -> int:
+        """Streams the files of a zip into install_path
+
+        Files are copied in CHUNK_SIZE pieces, so memory use doesn't depend on their sizes.
+        Sizes are checked against the limits both as declared in the zip and as actually decompressed.
+
+        :param data: The byte value of the zip file.
+        :param install_path:
+        :return: the total size of the extracted files
+        """
+        with self._wrap_extract_error(zipfile.ZipFile, io.BytesIO(data)) as memory_zip:
+            entries = self._wrap_extract_error(self._get_entries, memory_zip)
+            self._check_declared_sizes(entries)
+
+            # Creates all directories before writing any file
+            parent_directories = {parent_directory for _, _, parent_directory in entries if parent_directory}
+            for parent_directory in sorted(parent_directories):
+                os.makedirs(os.path.join(install_path, parent_directory), exist_ok=True)
+
+            total_size = 0
+            for zip_info, file_path, _ in entries:
+                src = self._wrap_extract_error(memory_zip.open, zip_info)
+                with src, open(os.path.join(install_path, file_path), 'wb') as dest:
+                    total_size += self._copy(src, dest, file_path, total_size)
+
+        return total_size
+
+    @staticmethod
+    def _wrap_extract_error(func: Callable, *args):
+        """Calls func converting errors on reading a zip to ScoreInstallExtractException
         """
         try:
-            with zipfile.ZipFile(io.BytesIO(data)) as memory_zip:
-                memory_zip_infolist = memory_zip.infolist()
-                memory_zip_files_path_gen = (path.filename for path in memory_zip_infolist)
-                common_path_len = len(os.path.commonpath(memory_zip_files_path_gen))
-                start_index = common_path_len
-                if common_path_len == 0:
-                    start_index = -1
-                for zip_info in memory_zip.infolist():
-                    with memory_zip.open(zip_info) as file:
-                        file_path = zip_info.filename[start_index + 1:]
-                        file_name_start_index = file_path.rfind('/')
-                        parent_directory = file_path[:file_name_start_index]
-                        if file_path.find('__MACOSX') != -1:
-                            continue
-                        if file_path.find('__pycache__') != -1:
-                            continue
-                        if file_name_start_index == len(file_path) - 1:
-                            # continue when 'file_path' is a directory.
-                            continue
-                        if file_path.startswith('.') or file_path.find('/.') != -1:
-                            # continue when 'file_path' is hidden directory or hidden file.
-                            continue
-
-                        if file_name_start_index == -1:
-                            yield file_path, file, ''
-                        else:
-                            yield file_path, file, parent_directory
+            return func(*args)
         except zipfile.BadZipFile:
             raise ScoreInstallExtractException("Bad zip file.")
         except zipfile.LargeZipFile:
             raise ScoreInstallExtractException("Large zip file.")
         except Exception as e:
-            raise ScoreInstallExtractException(f'extract_files_gen error -> exception: {e}')
+            raise ScoreInstallExtractException(f'extract error -> exception: {e}')
+
+    def _check_declared_sizes(self, entries: List['_ZipEntry']) -> None:
+        total_size = 0
+        for zip_info, file_path, _ in entries:
+            if zip_info.file_size > self._max_file_size:
+                raise ScoreInstallExtractException(f'Too large file: {file_path}')
+            total_size += zip_info.file_size
+        if total_size > self._max_package_size:
+            raise ScoreInstallExtractException(f'Too large package: {total_size}')
+
+    def _copy(self, src: 'io.BufferedIOBase', dest: 'io.BufferedIOBase', file_path: str, total_size: int) -> int:
+        """Copies src to dest in chunks
+
+        The declared size in a zip can't be trusted, so the limits are checked again while copying.
+
+        :return: the number of bytes copied
+        """
+        size = 0
+        while True:
+            chunk = src.read(self.CHUNK_SIZE)
+            if not chunk:
+                return size
+
+            size += len(chunk)
+            if size > self._max_file_size:
+                raise ScoreInstallExtractException(f'Too large file: {file_path}')
+            if total_size + size > self._max_package_size:
+                raise ScoreInstallExtractException(f'Too large package: {total_size + size}')
+            dest.write(chunk)
+
+    @staticmethod
+    def _fsync_tree(install_path: str) -> None:
+        """Flushes an extracted tree to disk once, files first and then directories
+        """
+        for directory, _, file_names in os.walk(install_path, topdown=False):
+            for file_name in file_names:
+                fd = os.open(os.path.join(directory, file_name), os.O_RDONLY)
+                try:
+                    os.fsync(fd)
+                finally:
+                    os.close(fd)
+
+            fd = os.open(directory, os.O_RDONLY)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+
+    @staticmethod
+    def _get_entries(memory_zip: 'zipfile.ZipFile') -> List['_ZipEntry']:
+        """Returns the files to install in a zip except directories, hidden files and caches
+
+        :param memory_zip:
+        :return: [(zip_info, file_path, parent_directory)]
+        """
+        memory_zip_infolist = memory_zip.infolist()
+        memory_zip_files_path_gen = (path.filename for path in memory_zip_infolist)
+        common_path_len = len(os.path.commonpath(memory_zip_files_path_gen))
+        start_index = common_path_len
+        if common_path_len == 0:
+            start_index = -1
+
+        entries = []
+        for zip_info in memory_zip_infolist:
+            file_path = zip_info.filename[start_index + 1:]
+            file_name_start_index = file_path.rfind('/')
+            parent_directory = file_path[:file_name_start_index]
+            if file_path.find('__MACOSX') != -1:
+                continue
+            if file_path.find('__pycache__') != -1:
+                continue
+            if file_name_start_index == len(file_path) - 1:
+                # continue when 'file_path' is a directory.
+                continue
+            if file_path.startswith('.') or file_path.find('/.') != -1:
+                # continue when 'file_path' is hidden directory or hidden file.
+                continue
+
+            if file_name_start_index == -1:
+                entries.append((zip_info, file_path, ''))
+            else:
+                entries.append((zip_info, file_path, parent_directory))
+        return entries
 
     @staticmethod
     def remove_existing_score(archive_path: str) -> None:
@@ -0,0 +1,236 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import shutil
+import tempfile
+import time
+from collections import OrderedDict, namedtuple
+from threading import Lock
+from typing import TYPE_CHECKING, Optional
+
+from ..icon_constant import MAX_SCORE_PACKAGE_SIZE
+from ..iconscore.score_package_validator import ScorePackageValidator
+from ..utils import sha3_256
+
+if TYPE_CHECKING:
+    from .icon_score_deployer import IconScoreDeployer
+
+DEFAULT_MAX_STAGED_BYTES = 2 * MAX_SCORE_PACKAGE_SIZE
+DEFAULT_MAX_STAGED_BYTES_PER_SECOND = MAX_SCORE_PACKAGE_SIZE // 4
+
+# path: staged directory, size: total size of its files, tx_hashes: deploy txs which staged it
+_StagedPackage = namedtuple('_StagedPackage', 'path, size, tx_hashes')
+
+
+class IconScorePackageStaging(object):
+    """Content-addressed cache of SCORE packages which are extracted ahead of invoke
+
+    Deploy packages are extracted (and validated) on the validate thread
+    into score_root_path/staging/<content_hash>.
+    When the deploy is invoked, the staged tree is renamed to its install path
+    instead of being extracted on the invoke thread.
+
+    Staging is done before any fee is charged, so it is bounded by bytes:
+    the oldest staged packages are removed above max_bytes on disk
+    and packages are not staged while more than max_bytes_per_second have been extracted.
+    Those packages are extracted on invoke.
+    """
+
+    _STAGING_DIR = 'staging'
+
+    def __init__(self,
+                 score_root_path: str,
+                 deployer: 'IconScoreDeployer',
+                 validate_package: bool,
+                 max_bytes: int = DEFAULT_MAX_STAGED_BYTES,
+                 max_bytes_per_second: int = DEFAULT_MAX_STAGED_BYTES_PER_SECOND) -> None:
+        """Constructor
+
+        :param score_root_path:
+        :param deployer: extracts packages
+        :param validate_package: whether to run ScorePackageValidator on staged packages
+        :param max_bytes: the oldest staged packages are removed above this total size
+        :param max_bytes_per_second: the rate of extracting packages. It is allowed to burst for a second.
+        """
+        self._staging_path = os.path.join(score_root_path, self._STAGING_DIR)
+        self._deployer = deployer
+        self._validate_package = validate_package
+        self._max_bytes = max_bytes
+        self._max_bytes_per_second = max_bytes_per_second
+
+        # content_hash: _StagedPackage
+        self._staged = OrderedDict()
+        self._staged_bytes = 0
+        # tx_hash: content_hash
+        self._staged_tx_hashes = {}
+        # bytes which can be extracted now
+        self._budget = max_bytes_per_second
+        self._budget_time = time.monotonic()
+        # install paths of packages validated while staged
+        self._validated_paths = set()
+        self._lock = Lock()
+
+        # mkdtemp() creates a directory only for its owner.
+        # Staged packages get the mode which makedirs() gives to the ones extracted on invoke.
+        umask = os.umask(0)
+        os.umask(umask)
+        self._dir_mode = 0o777 & ~umask
+
+        # Packages staged before a restart are not known, so they are removed
+        shutil.rmtree(self._staging_path, ignore_errors=True)
+        os.makedirs(self._staging_path, exist_ok=True)
+
+    @property
+    def staging_path(self) -> str:
+        return self._staging_path
+
+    def is_staged(self, content_hash: bytes) -> bool:
+        with self._lock:
+            return content_hash in self._staged
+
+    def is_stageable(self, tx_hash: bytes) -> bool:
+        """Returns whether the package of a deploy tx should be staged
+
+        It is False if the tx has staged it already or if the extract rate is exceeded,
+        so that the content is not decoded and hashed for nothing.
+
+        :param tx_hash: deploy tx hash
+        """
+        with self._lock:
+            return tx_hash not in self._staged_tx_hashes and self._refill_budget() > 0
+
+    def stage(self, content: bytes, tx_hash: Optional[bytes] = None) -> Optional[bytes]:
+        """Extracts and validates a package unless it has been staged already
+
+        :param content: zip content
+        :param tx_hash: deploy tx hash
+        :return: content_hash or None if the extract rate is exceeded
+        """
+        content_hash: bytes = sha3_256(content)
+        with self._lock:
+            if content_hash in self._staged:
+                self._staged.move_to_end(content_hash)
+                self._add_tx_hash(content_hash, tx_hash)
+                return content_hash
+
+            if self._refill_budget() <= 0:
+                return None
+
+        tmp_path = tempfile.mkdtemp(prefix='tmp', dir=self._staging_path)
+        size = 0
+        try:
+            os.chmod(tmp_path, self._dir_mode)
+            size = self._deployer.extract(content, tmp_path)
+            if self._validate_package:
+                ScorePackageValidator.validate_path(tmp_path)
+        except BaseException as e:
+            shutil.rmtree(tmp_path, ignore_errors=True)
+            raise e
+        finally:
+            with self._lock:
+                # The bytes extracted by a failed package are spent as well
+                self._budget -= size
+
+        staged_path = os.path.join(self._staging_path, content_hash.hex())
+        with self._lock:
+            if content_hash in self._staged:
+                shutil.rmtree(tmp_path, ignore_errors=True)
+                self._add_tx_hash(content_hash, tx_hash)
+                return content_hash
+
+            os.rename(tmp_path, staged_path)
+            self._staged[content_hash] = _StagedPackage(staged_path, size, set())
+            self._staged_bytes += size
+            self._add_tx_hash(content_hash, tx_hash)
+
+            while self._staged_bytes > self._max_bytes and len(self._staged) > 1:
+                evicted_hash = next(iter(self._staged))
+                shutil.rmtree(self._remove(evicted_hash).path, ignore_errors=True)
+
+        return content_hash
+
+    def install(self, content_hash: Optional[bytes], install_path: str) -> bool:
+        """Moves a staged package to install_path
+
+        :param content_hash:
+        :param install_path: score_root_path/<address>/<tx_hash>
+        :return: True if installed, False if the package is not staged or install_path exists
+        """
+        if content_hash is None:
+            return False
+
+        with self._lock:
+            if content_hash not in self._staged or os.path.exists(install_path):
+                return False
+
+            staged_path = self._remove(content_hash).path
+            parent_path = os.path.dirname(install_path)
+            os.makedirs(parent_path, exist_ok=True)
+            os.rename(staged_path, install_path)
+            self._fsync_directory(parent_path)
+
+            if self._validate_package:
+                self._validated_paths.add(os.path.normpath(install_path))
+
+        return True
+
+    def pop_validated(self, score_path: str) -> bool:
+        """Returns whether the package at score_path was validated while staged
+
+        It returns True only once per installed package.
+        """
+        score_path = os.path.normpath(score_path)
+        with self._lock:
+            if score_path in self._validated_paths:
+                self._validated_paths.remove(score_path)
+                return True
+        return False
+
+    def _refill_budget(self) -> int:
+        """Adds the bytes which can be extracted since the last refill up to a second's worth
+
+        It is called with the lock held.
+
+        :return: the bytes which can be extracted now
+        """
+        now = time.monotonic()
+        refill = int((now - self._budget_time) * self._max_bytes_per_second)
+        self._budget = min(self._budget + refill, self._max_bytes_per_second)
+        self._budget_time = now
+        return self._budget
+
+    def _add_tx_hash(self, content_hash: bytes, tx_hash: Optional[bytes]) -> None:
+        if tx_hash is not None:
+            self._staged[content_hash].tx_hashes.add(tx_hash)
+            self._staged_tx_hashes[tx_hash] = content_hash
+
+    def _remove(self, content_hash: bytes) -> '_StagedPackage':
+        """Forgets a staged package. It is called with the lock held.
+        """
+        staged_package: '_StagedPackage' = self._staged.pop(content_hash)
+        self._staged_bytes -= staged_package.size
+        for tx_hash in staged_package.tx_hashes:
+            del self._staged_tx_hashes[tx_hash]
+        return staged_package
+
+    @staticmethod
+    def _fsync_directory(path: str) -> None:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
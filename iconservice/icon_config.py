@@ -24,6 +24,10 @@ default_icon_config = {
     ConfigKey.AMQP_KEY: "7100",
     ConfigKey.AMQP_TARGET: "127.0.0.1",
     ConfigKey.BUILTIN_SCORE_OWNER: "hxebf3a409845cd09dcb5af31ed5be5e34e2af9433",
+    ConfigKey.SCORE_WARM_UP: False,
+    ConfigKey.DB_SYNC_INTERVAL_BLOCKS: 0,
+    ConfigKey.DB_SYNC_INTERVAL_MS: 0,
+    ConfigKey.DB_WRITE_BEHIND_QUEUE_SIZE: 0,
     ConfigKey.SERVICE: {
         ConfigKey.SERVICE_FEE: False,
         ConfigKey.SERVICE_AUDIT: False,
@@ -32,6 +32,9 @@ DATA_BYTE_ORDER = 'big'  # big endian
 FIXED_FEE = 10 ** 16
 # Max data field size
 MAX_DATA_SIZE = 512 * 1024
+# Max decompressed size of a file and of all files in a SCORE package
+MAX_SCORE_FILE_SIZE = 16 * 1024 * 1024
+MAX_SCORE_PACKAGE_SIZE = 64 * 1024 * 1024
 
 ICON_DEX_DB_NAME = 'icon_dex'
 
@@ -59,6 +62,19 @@ class ConfigKey:
     AMQP_TARGET = 'amqpTarget'
     CONFIG = 'config'
     TBEARS_MODE = 'tbearsMode'
+    LOG = 'log'
+    SCORE_WARM_UP = 'scoreWarmUp'
+    DB_SYNC_INTERVAL_BLOCKS = 'dbSyncIntervalBlocks'
+    DB_SYNC_INTERVAL_MS = 'dbSyncIntervalMs'
+    DB_WRITE_BEHIND_QUEUE_SIZE = 'dbWriteBehindQueueSize'
+
+
+class ResponseFormat:
+    """Formats of invoke responses which can be negotiated per channel
+    """
+    JSON = 'json'
+    # see iconscore/icon_score_result_codec.py
+    BINARY_V1 = 'binary/1'
 
 
 class EnableThreadFlag(IntFlag):
@@ -21,12 +21,14 @@ from typing import Any, TYPE_CHECKING
 from iconcommons.logger import Logger
 from iconservice.base.address import Address
 from iconservice.base.block import Block
-from iconservice.base.exception import ExceptionCode, IconServiceBaseException
+from iconservice.base.exception import ExceptionCode, IconServiceBaseException, InvalidParamsException
 from iconservice.base.type_converter import TypeConverter, ParamType
 from iconservice.icon_constant import ICON_INNER_LOG_TAG, ICON_SERVICE_LOG_TAG, \
-    EnableThreadFlag, ENABLE_THREAD_FLAG
+    EnableThreadFlag, ENABLE_THREAD_FLAG, ResponseFormat, ConfigKey
 from iconservice.icon_service_engine import IconServiceEngine
-from iconservice.utils import check_error_response, to_camel_case
+from iconservice.iconscore.icon_score_result_codec import encode_invoke_response, make_invoke_json_response
+from iconservice.utils import check_error_response
+from iconservice.utils.structured_logger import structured_logger
 
 if TYPE_CHECKING:
     from earlgrey import RobustConnection
@@ -36,11 +38,15 @@ THREAD_INVOKE = 'invoke'
 THREAD_QUERY = 'query'
 THREAD_VALIDATE = 'validate'
 
+SUPPORTED_RESPONSE_FORMATS = (ResponseFormat.JSON, ResponseFormat.BINARY_V1)
+
 
 class IconScoreInnerTask(object):
     def __init__(self, conf: 'IconConfig'):
         self._conf = conf
         self._thread_flag = ENABLE_THREAD_FLAG
+        # Invoke responses are JSON unless the channel negotiates another format
+        self._response_format = ResponseFormat.JSON
 
         self._icon_service_engine = IconServiceEngine()
         self._open()
@@ -51,6 +57,8 @@ class IconScoreInnerTask(object):
 
     def _open(self):
         Logger.info("icon_score_service open", ICON_INNER_LOG_TAG)
+        structured_logger.load_config(self._conf.get(ConfigKey.LOG, {}))
+        structured_logger.start()
         self._icon_service_engine.open(self._conf)
 
     def _is_thread_flag_on(self, flag: 'EnableThreadFlag') -> bool:
@@ -70,15 +78,51 @@ class IconScoreInnerTask(object):
         if self._icon_service_engine:
             self._icon_service_engine.close()
             self._icon_service_engine = None
+        structured_logger.stop()
         MessageQueueService.loop.stop()
 
     @message_queue_task
     async def close(self):
         self._close()
 
+    @message_queue_task
+    async def negotiate_response_format(self, request: dict):
+        structured_logger.info(ICON_INNER_LOG_TAG, 'negotiate_response_format request', request=request)
+        return self._negotiate_response_format(request)
+
+    def _negotiate_response_format(self, request: dict):
+        """Chooses the format of invoke responses on this channel
+
+        :param request: {'formats': formats supported by the client in order of preference}
+        :return: {'format': the chosen format}
+        """
+        response = None
+        try:
+            formats = request.get('formats')
+            if not isinstance(formats, list):
+                raise InvalidParamsException(f'Invalid formats: {formats}')
+
+            response_format = ResponseFormat.JSON
+            for candidate in formats:
+                if candidate in SUPPORTED_RESPONSE_FORMATS:
+                    response_format = candidate
+                    break
+
+            self._response_format = response_format
+            response = MakeResponse.make_response({'format': response_format})
+        except IconServiceBaseException as icon_e:
+            self._log_exception(icon_e, ICON_SERVICE_LOG_TAG)
+            response = MakeResponse.make_error_response(icon_e.code, icon_e.message)
+        except Exception as e:
+            self._log_exception(e, ICON_SERVICE_LOG_TAG)
+            response = MakeResponse.make_error_response(ExceptionCode.SERVER_ERROR, str(e))
+        finally:
+            structured_logger.info(ICON_INNER_LOG_TAG, 'negotiate_response_format response', response=response)
+            return response
+
     @message_queue_task
     async def invoke(self, request: dict):
-        Logger.info(f'invoke request with {request}', ICON_INNER_LOG_TAG)
+        structured_logger.info(ICON_INNER_LOG_TAG, 'invoke request', request=request)
         if self._is_thread_flag_on(EnableThreadFlag.Invoke):
             loop = get_event_loop()
             return await loop.run_in_executor(self._thread_pool[THREAD_INVOKE],
@@ -103,13 +147,10 @@ class IconScoreInnerTask(object):
             tx_results, state_root_hash = self._icon_service_engine.invoke(
                 block=block, tx_requests=converted_tx_requests)
 
-            convert_tx_results = \
-                {bytes.hex(tx_result.tx_hash): tx_result.to_dict(to_camel_case) for tx_result in tx_results}
-            results = {
-                'txResults': convert_tx_results,
-                'stateRootHash': bytes.hex(state_root_hash)
-            }
-            response = MakeResponse.make_response(results)
+            if self._response_format == ResponseFormat.BINARY_V1:
+                response = encode_invoke_response(tx_results, state_root_hash)
+            else:
+                response = make_invoke_json_response(tx_results, state_root_hash)
         except IconServiceBaseException as icon_e:
             self._log_exception(icon_e, ICON_SERVICE_LOG_TAG)
             response = MakeResponse.make_error_response(icon_e.code, icon_e.message)
@@ -117,12 +158,16 @@ class IconScoreInnerTask(object):
             self._log_exception(e, ICON_SERVICE_LOG_TAG)
             response = MakeResponse.make_error_response(ExceptionCode.SERVER_ERROR, str(e))
         finally:
-            Logger.info(f'invoke response with {response}', ICON_INNER_LOG_TAG)
+            if isinstance(response, bytes):
+                structured_logger.info(ICON_INNER_LOG_TAG, 'invoke response',
+                                       size=len(response), format=self._response_format)
+            else:
+                structured_logger.info(ICON_INNER_LOG_TAG, 'invoke response', response=response)
             return response
 
     @message_queue_task
     async def query(self, request: dict):
-        Logger.info(f'query request with {request}', ICON_INNER_LOG_TAG)
+        structured_logger.info(ICON_INNER_LOG_TAG, 'query request', request=request)
         if self._is_thread_flag_on(EnableThreadFlag.Query):
             loop = get_event_loop()
             return await loop.run_in_executor(self._thread_pool[THREAD_QUERY],
@@ -149,12 +194,12 @@ class IconScoreInnerTask(object):
             self._log_exception(e, ICON_SERVICE_LOG_TAG)
             response = MakeResponse.make_error_response(ExceptionCode.SERVER_ERROR, str(e))
         finally:
-            Logger.info(f'query response with {response}', ICON_INNER_LOG_TAG)
+            structured_logger.info(ICON_INNER_LOG_TAG, 'query response', response=response)
             return response
 
     @message_queue_task
     async def write_precommit_state(self, request: dict):
-        Logger.info(f'write_precommit_state request with {request}', ICON_INNER_LOG_TAG)
+        structured_logger.info(ICON_INNER_LOG_TAG, 'write_precommit_state request', request=request)
         if self._is_thread_flag_on(EnableThreadFlag.Invoke):
             loop = get_event_loop()
             return await loop.run_in_executor(self._thread_pool[THREAD_INVOKE],
@@ -177,12 +222,12 @@ class IconScoreInnerTask(object):
             self._log_exception(e, ICON_SERVICE_LOG_TAG)
             response = MakeResponse.make_error_response(ExceptionCode.SERVER_ERROR, str(e))
         finally:
-            Logger.info(f'write_precommit_state response with {response}', ICON_INNER_LOG_TAG)
+            structured_logger.info(ICON_INNER_LOG_TAG, 'write_precommit_state response', response=response)
             return response
 
     @message_queue_task
     async def remove_precommit_state(self, request: dict):
-        Logger.info(f'remove_precommit_state request with {request}', ICON_INNER_LOG_TAG)
+        structured_logger.info(ICON_INNER_LOG_TAG, 'remove_precommit_state request', request=request)
         if self._is_thread_flag_on(EnableThreadFlag.Invoke):
             loop = get_event_loop()
             return await loop.run_in_executor(self._thread_pool[THREAD_INVOKE],
@@ -205,12 +250,12 @@ class IconScoreInnerTask(object):
             self._log_exception(e, ICON_SERVICE_LOG_TAG)
             response = MakeResponse.make_error_response(ExceptionCode.SERVER_ERROR, str(e))
         finally:
-            Logger.info(f'remove_precommit_state response with {response}', ICON_INNER_LOG_TAG)
+            structured_logger.info(ICON_INNER_LOG_TAG, 'remove_precommit_state response', response=response)
             return response
 
     @message_queue_task
     async def validate_transaction(self, request: dict):
-        Logger.info(f'pre_validate_check request with {request}', ICON_INNER_LOG_TAG)
+        structured_logger.info(ICON_INNER_LOG_TAG, 'pre_validate_check request', request=request)
         if self._is_thread_flag_on(EnableThreadFlag.Validate):
             loop = get_event_loop()
             return await loop.run_in_executor(self._thread_pool[THREAD_VALIDATE],
@@ -232,7 +277,7 @@ class IconScoreInnerTask(object):
             self._log_exception(e, ICON_SERVICE_LOG_TAG)
             response = MakeResponse.make_error_response(ExceptionCode.SERVER_ERROR, str(e))
         finally:
-            Logger.info(f'pre_validate_check response with {response}', ICON_INNER_LOG_TAG)
+            structured_logger.info(ICON_INNER_LOG_TAG, 'pre_validate_check response', response=response)
             return response
 
     @message_queue_task
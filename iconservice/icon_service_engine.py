@@ -14,8 +14,8 @@
 # limitations under the License.
 
 
-from math import ceil
 from os import makedirs
+from threading import Condition
 from typing import TYPE_CHECKING, List, Any, Optional
 
 from iconcommons.logger import Logger
@@ -25,38 +25,41 @@ from .base.address import ZERO_SCORE_ADDRESS, \
     GOVERNANCE_SCORE_ADDRESS
 from .base.block import Block
 from .base.exception import ExceptionCode, RevertException, ScoreErrorException
-from .base.exception import IconServiceBaseException, ServerErrorException
+from .base.exception import IconServiceBaseException, ServerErrorException, DatabaseException
 from .base.message import Message
 from .base.transaction import Transaction
 from .database.batch import BlockBatch, TransactionBatch
 from .database.factory import ContextDatabaseFactory
+from .database.sync_policy import DatabaseSyncPolicy
 from .deploy.icon_builtin_score_loader import IconBuiltinScoreLoader
 from .deploy.icon_score_deploy_engine import IconScoreDeployEngine
 from .deploy.icon_score_deploy_storage import IconScoreDeployStorage
+from .deploy.icon_score_deployer import IconScoreDeployer
+from .deploy.icon_score_package_staging import IconScorePackageStaging
 from .deploy.icon_score_manager import IconScoreManager
 from .icon_constant import ICON_DEX_DB_NAME, ICON_SERVICE_LOG_TAG, \
     IconServiceFlag, IconDeployFlag, ConfigKey, IconScoreLoaderFlag
 from .iconscore.icon_pre_validator import IconPreValidator
 from .iconscore.icon_score_context import IconScoreContext, ContextContainer
 from .iconscore.icon_score_context import IconScoreContextFactory
-from .iconscore.icon_score_context import IconScoreContextType
+from .iconscore.icon_score_context import IconScoreContextType, IconScoreFuncType
 from .iconscore.icon_score_engine import IconScoreEngine
 from .iconscore.icon_score_loader import IconScoreLoader
 from .iconscore.icon_score_mapper import IconScoreMapper
 from .iconscore.icon_score_result import TransactionResult
-from .iconscore.icon_score_step import IconScoreStepCounterFactory, StepType
+from .iconscore.icon_score_step import IconScoreStepCounterFactory, StepType, get_data_size
 from .iconscore.icon_score_trace import Trace, TraceType
+from .iconscore.icon_score_warm_up import IconScoreWarmUp
 from .iconscore.internal_call import InternalCall
 from .icx.icx_account import AccountType
 from .icx.icx_engine import IcxEngine
 from .icx.icx_storage import IcxStorage
 from .precommit_data_manager import PrecommitData, PrecommitDataManager
-from .utils import byte_length_of_int
-from .utils import is_lowercase_hex_string
 from .utils.bloom import BloomFilter
+from .utils.structured_logger import failure_sampler
 
 if TYPE_CHECKING:
-    from .iconscore.icon_score_step import IconScoreStepCounter
+    from .iconscore.icon_score_step import IconScoreStepCounter, DataSize
     from .iconscore.icon_score_event_log import EventLog
     from .builtin_scores.governance.governance import Governance
     from iconcommons.icon_config import IconConfig
@@ -69,6 +72,13 @@ class IconServiceEngine(ContextContainer):
     It is contained in IconInnerService.
     """
 
+    # Queries which can be made on the states of the newest precommitted block
+    _PENDING_QUERY_METHODS = ('icx_getBalance', 'icx_call')
+    # How many times a pending query is made again if a block is committed meanwhile
+    _MAX_PENDING_QUERY_RETRIES = 3
+    # How long a pending query waits for a block being written to StateDB in seconds
+    _PENDING_QUERY_WAIT_TIMEOUT = 1.0
+
     def __init__(self) -> None:
         """Constructor
 
@@ -78,6 +88,7 @@ class IconServiceEngine(ContextContainer):
         self._flag = None
         self._context_factory = None
         self._icon_score_loader = None
+        self._icon_score_package_staging = None
         self._icx_context_db = None
         self._icx_storage = None
         self._icx_engine = None
@@ -87,6 +98,11 @@ class IconServiceEngine(ContextContainer):
         self._step_counter_factory = None
         self._icon_pre_validator = None
         self._icon_score_deploy_storage = None
+        self._icon_score_warm_up = None
+        self._db_sync_policy = None
+        # Odd while a block is being written to StateDB. It is changed and read with _state_condition.
+        self._state_version = 0
+        self._state_condition = Condition()
 
         # JSON-RPC handlers
         self._handlers = {
@@ -126,7 +142,13 @@ class IconServiceEngine(ContextContainer):
         icon_score_loader_flags = IconScoreLoaderFlag.NONE
         if self._is_flag_on(IconServiceFlag.scorePackageValidator):
             icon_score_loader_flags |= IconScoreLoaderFlag.ENABLE_SCORE_PACKAGE_VALIDATOR
-        self._icon_score_loader = IconScoreLoader(score_root_path, flag=icon_score_loader_flags)
+        self._icon_score_package_staging = IconScorePackageStaging(
+            score_root_path,
+            IconScoreDeployer(score_root_path),
+            validate_package=self._is_flag_on(IconServiceFlag.scorePackageValidator))
+        self._icon_score_loader = IconScoreLoader(score_root_path,
+                                                  flag=icon_score_loader_flags,
+                                                  package_staging=self._icon_score_package_staging)
 
         self._icx_engine = IcxEngine()
         self._icon_score_engine = IconScoreEngine()
@@ -136,6 +158,10 @@ class IconServiceEngine(ContextContainer):
 
         self._icx_context_db = \
             ContextDatabaseFactory.create_by_name(ICON_DEX_DB_NAME)
+        write_behind_queue_size: int = self._conf.get(ConfigKey.DB_WRITE_BEHIND_QUEUE_SIZE, 0)
+        if write_behind_queue_size > 0:
+            # Committed blocks are written on a writer thread while the next block is invoked
+            self._icx_context_db.key_value_db.start_write_behind(write_behind_queue_size)
         # self._icx_context_db.address = ICX_ENGINE_ADDRESS
         self._icx_storage = IcxStorage(self._icx_context_db)
         self._icon_score_deploy_storage = IconScoreDeployStorage(
@@ -161,13 +187,54 @@ class IconServiceEngine(ContextContainer):
         self._icon_score_deploy_engine.open(
             score_root_path=score_root_path,
             flag=self._make_deploy_engine_flag(),
-            icon_deploy_storage=self._icon_score_deploy_storage)
+            icon_deploy_storage=self._icon_score_deploy_storage,
+            package_staging=self._icon_score_package_staging)
 
         self._load_builtin_scores()
         self._init_global_value_by_governance_score()
 
+        self._db_sync_policy = DatabaseSyncPolicy(
+            interval_blocks=self._conf.get(ConfigKey.DB_SYNC_INTERVAL_BLOCKS, 0),
+            interval_ms=self._conf.get(ConfigKey.DB_SYNC_INTERVAL_MS, 0),
+            unsynced_blocks=self._check_last_block())
         self._precommit_data_manager.last_block = self._icx_storage.last_block
 
+        if self._conf.get(ConfigKey.SCORE_WARM_UP, False):
+            self._icon_score_warm_up = IconScoreWarmUp(
+                self._context_factory, self._icon_score_deploy_storage, self._icon_score_mapper)
+            self._icon_score_warm_up.start()
+
+    def _check_last_block(self) -> int:
+        """Checks the block which StateDB has been recovered to against the last block written with sync
+
+        A block and its states are written atomically, so StateDB is consistent with the last block.
+        The blocks written without sync after the synced block can still be lost by an OS crash
+        and have to be invoked and committed again.
+
+        :return: the number of the blocks written without sync after the synced block
+        """
+        block = self._icx_storage.last_block
+        synced_block = self._icx_storage.synced_block
+        if block is None:
+            if synced_block is not None:
+                raise DatabaseException(f'No last block: synced_block({synced_block})')
+            Logger.info('No block has been committed', ICON_SERVICE_LOG_TAG)
+            return 0
+
+        if synced_block is None:
+            # Written by a version which did not record the synced block
+            unsynced_blocks = block.height + 1
+        elif block.height < synced_block.height or \
+                (block.height == synced_block.height and block.hash != synced_block.hash):
+            raise DatabaseException(
+                f'Last block is behind the synced block: last_block({block}) synced_block({synced_block})')
+        else:
+            unsynced_blocks = block.height - synced_block.height
+
+        Logger.info(f'Last block: height({block.height}) hash({block.hash.hex()}) '
+                    f'unsynced_blocks({unsynced_blocks})', ICON_SERVICE_LOG_TAG)
+        return unsynced_blocks
+
     def _make_deploy_engine_flag(self) -> int:
         flags = IconDeployFlag.NONE.value
         if self._is_flag_on(IconServiceFlag.audit):
@@ -203,13 +270,21 @@ class IconServiceEngine(ContextContainer):
         finally:
             self._pop_context()
 
-    def _init_global_value_by_governance_score(self):
+    def _init_global_value_by_governance_score(self,
+                                               prev_block_batch: Optional['BlockBatch'] = None,
+                                               prev_score_mapper: Optional['IconScoreMapper'] = None):
         """Initialize step_counter_factory with parameters
         managed by governance SCORE
 
+        :param prev_block_batch: the states of the parent block which has not been committed yet
+        :param prev_score_mapper: the scores deployed in the parent block which has not been committed yet
         :return:
         """
-        context = self._context_factory.create(IconScoreContextType.QUERY)
+        if prev_block_batch is None:
+            context = self._context_factory.create(IconScoreContextType.QUERY)
+        else:
+            # Reads the parameters through the states of the uncommitted parent
+            context = self._create_parent_state_context(prev_block_batch, prev_score_mapper)
 
         # Clarifies that This Context does not count steps
         context.step_counter = None
@@ -254,6 +329,23 @@ class IconServiceEngine(ContextContainer):
 
         self._context_factory.destroy(context)
 
+    def _create_parent_state_context(self,
+                                     prev_block_batch: 'BlockBatch',
+                                     prev_score_mapper: Optional['IconScoreMapper']) -> 'IconScoreContext':
+        """Creates a readonly context on the states which a block is invoked on top of,
+        that is, StateDB and the states of its uncommitted ancestors
+
+        :param prev_block_batch: the states of the parent block which has not been committed yet
+        :param prev_score_mapper: the scores deployed in the parent block
+        :return: context which should be destroyed after use
+        """
+        context = self._context_factory.create(IconScoreContextType.INVOKE)
+        context.func_type = IconScoreFuncType.READONLY
+        context.block_batch = BlockBatch(prev_block_batch.block, prev_block_batch)
+        context.tx_batch = TransactionBatch()
+        context.new_icon_score_mapper = IconScoreMapper(prev_mapper=prev_score_mapper)
+        return context
+
     def _validate_deploy_whitelist(
             self, context: 'IconScoreContext', params: dict):
         data_type = params.get('dataType')
@@ -300,9 +392,14 @@ class IconServiceEngine(ContextContainer):
         """Free all resources occupied by IconServiceEngine
         including db, memory and so on
         """
+        if self._icon_score_warm_up is not None:
+            self._icon_score_warm_up.stop()
+
         context = self._context_factory.create(IconScoreContextType.DIRECT)
         self._push_context(context)
         try:
+            if self._db_sync_policy is not None and self._db_sync_policy.unsynced_blocks > 0:
+                self._icx_storage.sync_block_info(context)
             self._icx_engine.close()
             self._icon_score_mapper.close()
         finally:
@@ -323,13 +420,31 @@ class IconServiceEngine(ContextContainer):
         # Check for block validation before invoke
         self._precommit_data_manager.validate_block_to_invoke(block)
 
-        self._init_global_value_by_governance_score()
+        # The same block may be requested again. It is not invoked again unless its transactions differ
+        tx_digest: bytes = self._precommit_data_manager.make_tx_digest(tx_requests)
+        precommit_data: Optional['PrecommitData'] = \
+            self._precommit_data_manager.get_invoked(block, tx_digest)
+        if precommit_data is not None:
+            Logger.info(f'Block already invoked: {block.hash.hex()}', ICON_SERVICE_LOG_TAG)
+            self._precommit_data_manager.count_reused()
+            return precommit_data.block_result, precommit_data.state_root_hash
+
+        # The precommit data made from different transactions are replaced with the descendants
+        if self._precommit_data_manager.get(block.hash) is not None:
+            self.rollback(block)
+
+        # The block is invoked on top of its parent if the parent has not been committed yet
+        parent: Optional['PrecommitData'] = self._precommit_data_manager.get_parent(block)
+        prev_block_batch = None if parent is None else parent.block_batch
+        prev_score_mapper = None if parent is None else parent.score_mapper
+
+        self._init_global_value_by_governance_score(prev_block_batch, prev_score_mapper)
 
         context = self._context_factory.create(IconScoreContextType.INVOKE)
         context.block = block
-        context.block_batch = BlockBatch(Block.from_block(block))
+        context.block_batch = BlockBatch(Block.from_block(block), prev_block_batch)
         context.tx_batch = TransactionBatch()
-        context.new_icon_score_mapper = IconScoreMapper()
+        context.new_icon_score_mapper = IconScoreMapper(prev_mapper=prev_score_mapper)
         block_result = []
 
         if block.height == 0:
@@ -348,12 +463,12 @@ class IconServiceEngine(ContextContainer):
         # Save precommit data
         # It will be written to levelDB on commit
         precommit_data = PrecommitData(
-            context.block_batch, block_result, context.new_icon_score_mapper)
+            context.block_batch, block_result, context.new_icon_score_mapper, tx_digest)
         self._precommit_data_manager.push(precommit_data)
 
         self._context_factory.destroy(context)
 
-        return block_result, precommit_data.block_batch.digest()
+        return block_result, precommit_data.state_root_hash
 
     @staticmethod
     def _is_genesis_block(
@@ -467,12 +582,67 @@ class IconServiceEngine(ContextContainer):
         * icx_getTotalSupply
         * icx_call
 
+        icx_getBalance and icx_call with 'pending' are made on the states
+        of the newest precommitted block.
+
+        :param method:
+        :param params:
+        :return: the result of query
+        """
+        if params and params.get('pending', False) and method in self._PENDING_QUERY_METHODS:
+            return self._query_pending(method, params)
+
+        return self._query(method, params)
+
+    def _query_pending(self, method: str, params: dict) -> Any:
+        """Makes a query on the states of the newest precommitted block over StateDB
+
+        The precommitted block is not changed by commit or rollback,
+        but StateDB is changed by commit. So the query is made again
+        if a block has been committed while it was made.
+        Waiting too long for a block being written counts as a retry as well.
+
+        :param method:
+        :param params:
+        :return: the result of query
+        """
+        for _ in range(self._MAX_PENDING_QUERY_RETRIES):
+            with self._state_condition:
+                # Waits for the block being written to StateDB
+                if not self._state_condition.wait_for(lambda: self._state_version % 2 == 0,
+                                                      self._PENDING_QUERY_WAIT_TIMEOUT):
+                    continue
+                state_version: int = self._state_version
+
+            precommit_data: Optional['PrecommitData'] = self._precommit_data_manager.get_newest()
+            if precommit_data is None:
+                return self._query(method, params)
+
+            ret = self._query(method, params, precommit_data)
+            with self._state_condition:
+                if state_version == self._state_version:
+                    return ret
+
+        raise ServerErrorException('Pending states have been changed during the query')
+
+    def _query(self,
+               method: str,
+               params: dict,
+               precommit_data: Optional['PrecommitData'] = None) -> Any:
+        """
         :param method:
         :param params:
+        :param precommit_data: the query is made on the last block if it is None
         :return: the result of query
         """
         context = self._context_factory.create(IconScoreContextType.QUERY)
-        context.block = self._icx_storage.last_block
+        if precommit_data is None:
+            context.block = self._icx_storage.last_block
+        else:
+            context.block = precommit_data.block
+            context.block_batch = precommit_data.block_batch
+            context.tx_batch = TransactionBatch()
+            context.new_icon_score_mapper = precommit_data.score_mapper
         step_limit = self._step_counter_factory.get_max_step_limit(context.type)
 
         if params:
@@ -512,15 +682,14 @@ class IconServiceEngine(ContextContainer):
         minimum_step = \
             self._step_counter_factory.get_step_cost(StepType.DEFAULT)
 
+        data_size: 'DataSize' = get_data_size(params.get('data'))
         if 'data' in params:
             # minimum_step is the sum of
             # default STEP cost and input STEP costs if data field exists
-            data = params['data']
-            input_size = self._get_byte_length(data)
-            minimum_step += input_size * \
+            minimum_step += data_size.byte_length * \
                 self._step_counter_factory.get_step_cost(StepType.INPUT)
 
-        self._icon_pre_validator.execute(params, step_price, minimum_step)
+        self._icon_pre_validator.execute(params, step_price, minimum_step, data_size)
 
         context = self._context_factory.create(IconScoreContextType.QUERY)
         self._validate_score_blacklist(context, params)
@@ -528,6 +697,17 @@ class IconServiceEngine(ContextContainer):
             self._validate_deploy_whitelist(context, params)
         self._context_factory.destroy(context)
 
+        if params.get('dataType') == 'deploy':
+            # Moves extracting the package off the invoke thread
+            # only if the step limit covers what the deploy is charged for its content on invoke
+            deploy_step_type = StepType.CONTRACT_CREATE if params['to'] == ZERO_SCORE_ADDRESS \
+                else StepType.CONTRACT_UPDATE
+            deploy_step = minimum_step + \
+                self._step_counter_factory.get_step_cost(deploy_step_type) + \
+                data_size.content_byte_length * self._step_counter_factory.get_step_cost(StepType.CONTRACT_SET)
+            if params.get('stepLimit', 0) >= deploy_step:
+                self._icon_score_deploy_engine.stage(params['txHash'], params['data'])
+
     def _call(self,
               context: 'IconScoreContext',
               method: str,
@@ -598,6 +778,25 @@ class IconServiceEngine(ContextContainer):
                                              data_type,
                                              data)
 
+    def _check_out_of_balance(self, context: 'IconScoreContext', params: dict) -> None:
+        """Checks the balance on the states which the block is invoked on top of
+
+        :param context: invoke context
+        :param params: params of icx_sendTransaction JSON-RPC request
+        """
+        step_price: int = context.step_counter.step_price
+        parent: Optional['PrecommitData'] = self._precommit_data_manager.get_parent(context.block)
+        if parent is None:
+            self._icon_pre_validator.execute_to_check_out_of_balance(params, step_price=step_price)
+            return
+
+        parent_state_context = self._create_parent_state_context(parent.block_batch, parent.score_mapper)
+        try:
+            self._icon_pre_validator.execute_to_check_out_of_balance(
+                params, step_price=step_price, context=parent_state_context)
+        finally:
+            self._context_factory.destroy(parent_state_context)
+
     def _handle_icx_send_transaction(self,
                                      context: 'IconScoreContext',
                                      params: dict) -> 'TransactionResult':
@@ -617,19 +816,17 @@ class IconServiceEngine(ContextContainer):
             tx_result.to = to
 
             # Check if from account can charge a tx fee
-            self._icon_pre_validator.execute_to_check_out_of_balance(
-                params,
-                step_price=context.step_counter.step_price)
+            self._check_out_of_balance(context, params)
 
             # Every send_transaction are calculated DEFAULT STEP at first
             context.step_counter.apply_step(StepType.DEFAULT, 1)
-            input_size = self._get_byte_length(params.get('data', None))
+            data_size: 'DataSize' = get_data_size(params.get('data', None))
 
-            context.step_counter.apply_step(StepType.INPUT, input_size)
+            context.step_counter.apply_step(StepType.INPUT, data_size.byte_length)
             self._transfer_coin(context, params)
 
             if to.is_contract:
-                tx_result.score_address = self._handle_score_invoke(context, to, params)
+                tx_result.score_address = self._handle_score_invoke(context, to, params, data_size)
 
             tx_result.status = TransactionResult.SUCCESS
         except BaseException as e:
@@ -659,29 +856,6 @@ class IconServiceEngine(ContextContainer):
 
         return tx_result
 
-    def _get_byte_length(self, data) -> int:
-        size = 0
-        if data:
-            if isinstance(data, dict):
-                for v in data.values():
-                    size += self._get_byte_length(v)
-            elif isinstance(data, list):
-                for v in data:
-                    size += self._get_byte_length(v)
-            elif isinstance(data, str):
-                # If the value is hexstring, it is calculated as bytes otherwise
-                # string
-                data_body = data[2:] if data.startswith('0x') else data
-                if is_lowercase_hex_string(data_body):
-                    size += ceil(len(data_body) / 2)
-                else:
-                    size += len(data.encode('utf-8'))
-            else:
-                # int and bool
-                if isinstance(data, int):
-                    size += byte_length_of_int(data)
-        return size
-
     def _transfer_coin(self,
                        context: 'IconScoreContext',
                        params: dict) -> None:
@@ -749,12 +923,14 @@ class IconServiceEngine(ContextContainer):
     def _handle_score_invoke(self,
                              context: 'IconScoreContext',
                              to: 'Address',
-                             params: dict) -> Optional['Address']:
+                             params: dict,
+                             data_size: 'DataSize') -> Optional['Address']:
         """Handle score invocation
 
         :param context:
         :param to: a recipient address
         :param params:
+        :param data_size: sizes of params['data'] already computed for StepType.INPUT
         :return: SCORE address if 'deploy' command. otherwise None
         """
         data_type: str = params.get('dataType')
@@ -783,8 +959,7 @@ class IconServiceEngine(ContextContainer):
                 score_address = to
                 context.step_counter.apply_step(StepType.CONTRACT_UPDATE, 1)
 
-            data_size = self._get_byte_length(data.get('content', None))
-            context.step_counter.apply_step(StepType.CONTRACT_SET, data_size)
+            context.step_counter.apply_step(StepType.CONTRACT_SET, data_size.content_byte_length)
 
             self._icon_score_deploy_engine.invoke(
                 context=context,
@@ -802,25 +977,34 @@ class IconServiceEngine(ContextContainer):
             e: BaseException) -> TransactionResult.Failure:
         """
         Gets `Failure` from an exception
+
+        Repeated identical failures are sampled so that a block full of
+        the same failing tx doesn't log a stack trace per tx.
+
         :param e: exception
         :return: a Failure
         """
 
         if isinstance(e, IconServiceBaseException):
-            if e.code == ExceptionCode.SCORE_ERROR or isinstance(e, ScoreErrorException):
-                Logger.warning(e.message, ICON_SERVICE_LOG_TAG)
-            else:
-                Logger.exception(e.message, ICON_SERVICE_LOG_TAG)
-
             code = e.code
             message = e.message
         else:
-            Logger.exception(e, ICON_SERVICE_LOG_TAG)
-            Logger.error(e, ICON_SERVICE_LOG_TAG)
-
             code = ExceptionCode.SERVER_ERROR
             message = str(e)
 
+        count = failure_sampler.sample((type(e), code, message))
+        if count > 0:
+            log_message = message if count == 1 else f'{message} (repeated {count} times)'
+
+            if isinstance(e, IconServiceBaseException):
+                if e.code == ExceptionCode.SCORE_ERROR or isinstance(e, ScoreErrorException):
+                    Logger.warning(log_message, ICON_SERVICE_LOG_TAG)
+                else:
+                    Logger.exception(log_message, ICON_SERVICE_LOG_TAG)
+            else:
+                Logger.exception(log_message, ICON_SERVICE_LOG_TAG)
+                Logger.error(log_message, ICON_SERVICE_LOG_TAG)
+
         return TransactionResult.Failure(code, message)
 
     @staticmethod
@@ -860,6 +1044,13 @@ class IconServiceEngine(ContextContainer):
         if not bool(params) or params.get('filter'):
             last_block_status = self._make_last_block_status()
             response['lastBlock'] = last_block_status
+            response['precommitReusedCount'] = self._precommit_data_manager.reused_count
+            if self._db_sync_policy is not None:
+                response['dbUnsyncedBlocks'] = self._db_sync_policy.unsynced_blocks
+
+            writer = self._icx_context_db.key_value_db.writer
+            if writer is not None:
+                response['dbWriter'] = writer.metrics
         return response
 
     def _make_last_block_status(self) -> Optional[dict]:
@@ -906,11 +1097,22 @@ class IconServiceEngine(ContextContainer):
         if new_icon_score_mapper:
             self._icon_score_mapper.update(new_icon_score_mapper)
 
-        self._icx_context_db.write_batch(
-            context=context, states=block_batch)
-
-        self._icx_storage.put_block_info(context, block_batch.block)
-        self._precommit_data_manager.commit(block_batch.block)
+        # The states and the last block info are written at once
+        # so that StateDB never gets ahead of the last block info
+        sync: bool = self._db_sync_policy.is_sync_required()
+        with self._state_condition:
+            self._state_version += 1
+        try:
+            self._icx_storage.commit_block(context, block_batch, sync=sync)
+        finally:
+            with self._state_condition:
+                self._state_version += 1
+                self._state_condition.notify_all()
+        self._db_sync_policy.on_write(sync)
+
+        for discarded in self._precommit_data_manager.commit(block_batch.block):
+            if discarded.score_mapper:
+                self._icon_score_mapper.discard(discarded.score_mapper)
         self._context_factory.destroy(context)
 
     def rollback(self, block: 'Block') -> None:
@@ -918,5 +1120,9 @@ class IconServiceEngine(ContextContainer):
         in context.block_batch and IconScoreEngine
         """
         # Check for block validation before rollback
-        self._precommit_data_manager.validate_precommit_block(block)
-        self._precommit_data_manager.rollback(block)
+        self._precommit_data_manager.validate_block_to_rollback(block)
+
+        # The blocks invoked on top of it are rolled back as well
+        for precommit_data in self._precommit_data_manager.rollback(block):
+            if precommit_data.score_mapper:
+                self._icon_score_mapper.discard(precommit_data.score_mapper)
@@ -166,14 +166,36 @@ class ContainerUtil(object):
 
 
 class DictDB(object):
+    # The maximum number of nested DictDB views cached in a DictDB
+    MAX_CACHED_VIEWS = 1024
 
-    def __init__(self, var_key: str, db: 'IconScoreDatabase', value_type: type, depth: int=1) -> None:
+    def __init__(self,
+                 var_key: str,
+                 db: 'IconScoreDatabase',
+                 value_type: type,
+                 depth: int=1,
+                 key_type: type=bytes) -> None:
+        """Constructor
+
+        :param var_key:
+        :param db:
+        :param value_type:
+        :param depth:
+        :param key_type: type of the keys returned by keys() and items()
+        """
 
         prefix: bytes = ContainerUtil.create_db_prefix(type(self), var_key)
-        self._db = db.get_sub_db(prefix)
+        # DatabaseException is raised if it overlaps another DictDB of the SCORE
+        self.__init_db(db.declare_container(prefix, depth), value_type, depth, key_type)
+
+    def __init_db(self, db: 'IconScoreDatabase', value_type: type, depth: int, key_type: type) -> None:
+        self._db = db
 
         self.__value_type = value_type
         self.__depth = depth
+        self.__key_type = key_type
+        # encoded key: nested DictDB (depth > 1 only)
+        self.__views = {}
 
     def remove(self, key: K) -> None:
         self.__remove(key)
@@ -191,7 +213,25 @@ class DictDB(object):
         if self.__depth == 1:
             return ContainerUtil.decode_object(self._db.get(ContainerUtil.encode_key(key)), self.__value_type)
         else:
-            return DictDB(key, self._db, self.__value_type, self.__depth - 1)
+            return self.__get_view(key)
+
+    def __get_view(self, key: K) -> 'DictDB':
+        """Returns the nested DictDB of key
+
+        Views are cached by their encoded keys.
+        They keep no state but the db prefix, so a cached view is always valid.
+        """
+        encoded_key: bytes = ContainerUtil.encode_key(key)
+        view = self.__views.get(encoded_key)
+        if view is None:
+            if len(self.__views) >= self.MAX_CACHED_VIEWS:
+                self.__views.clear()
+            # Views are not declared, as the keys of a dict can share a range with each other
+            view = DictDB.__new__(DictDB)
+            view.__init_db(self._db.get_sub_db(ContainerUtil.create_db_prefix(DictDB, encoded_key)),
+                           self.__value_type, self.__depth - 1, self.__key_type)
+            self.__views[encoded_key] = view
+        return view
 
     def __delitem__(self, key):
         self.__remove(key)
@@ -202,6 +242,27 @@ class DictDB(object):
         value = self._db.get(ContainerUtil.encode_key(key))
         return value is not None
 
+    def keys(self) -> iter:
+        """Iterates the keys in the order of their encoded bytes
+
+        Each key is charged like a get of its value.
+        """
+        return (key for key, _ in self.items())
+
+    def items(self) -> iter:
+        """Iterates the (key, value) pairs in the order of the encoded keys
+
+        Each pair is charged like a get.
+        In a nested dict, the keys under an outer key b'a|b' are stored in the range of b'a',
+        so they are returned by the dict of b'a' as b'b|' followed by the key.
+        """
+        if self.__depth != 1:
+            raise ContainerDBException(f'DictDB depth mismatch')
+
+        return ((ContainerUtil.decode_object(key, self.__key_type),
+                 ContainerUtil.decode_object(value, self.__value_type))
+                for key, value in self._db.iterator())
+
     def __remove(self, key: K) -> None:
         if self.__depth != 1:
             raise ContainerDBException(f'DictDB depth mismatch')
@@ -211,14 +272,18 @@ class DictDB(object):
 class ArrayDB(Iterator):
     __SIZE = 'size'
     __SIZE_BYTE_KEY = ContainerUtil.encode_key(__SIZE)
+    # The number of elements read at once during iteration
+    BULK_READ_SIZE = 128
 
     def __init__(self, var_key: str, db: 'IconScoreDatabase', value_type: type) -> None:
         prefix: bytes = ContainerUtil.create_db_prefix(type(self), var_key)
         self._db = db.get_sub_db(prefix)
 
         self.__size = self.__get_size()
-        self.__index = 0
         self.__value_type = value_type
+        self.__values: Optional[iter] = None
+        # Changed on every write so that values read ahead are not returned after it
+        self.__version = 0
 
     def put(self, value: V) -> None:
         byte_value = ContainerUtil.encode_value(value)
@@ -241,16 +306,32 @@ class ArrayDB(Iterator):
         return self[index]
 
     def __iter__(self):
-        self.__index = 0
+        self.__values = self.__iter_values()
         return self
 
     def __next__(self) -> V:
-        if self.__index < self.__size:
-            index = self.__index
-            self.__index += 1
-            return self[index]
-        else:
-            raise StopIteration
+        if self.__values is None:
+            self.__values = self.__iter_values()
+        return next(self.__values)
+
+    def __iter_values(self) -> iter:
+        """Reads the elements in chunks of contiguous indexes with the same encoded key length
+
+        The keys of a chunk are adjacent in the db, so each chunk is read in one pass.
+        Every element is charged like a get when it is returned.
+        """
+        index = 0
+        while index < self.__size:
+            key_length = len(ContainerUtil.encode_key(index))
+            # the first index whose encoded key is longer
+            stop = min(self.__size, index + self.BULK_READ_SIZE, 1 << (8 * key_length - 1))
+
+            version = self.__version
+            values = self._db.get_many([ContainerUtil.encode_key(i) for i in range(index, stop)])
+            while index < stop and version == self.__version:
+                value = next(values)
+                index += 1
+                yield ContainerUtil.decode_object(value, self.__value_type)
 
     def __len__(self):
         return self.__size
@@ -259,6 +340,7 @@ class ArrayDB(Iterator):
         return ContainerUtil.decode_object(self._db.get(ArrayDB.__SIZE_BYTE_KEY), int)
 
     def __set_size(self) -> None:
+        self.__version += 1
         sub_db = self._db
         byte_value = ContainerUtil.encode_value(self.__size)
         sub_db.put(ArrayDB.__SIZE_BYTE_KEY, byte_value)
@@ -266,6 +348,7 @@ class ArrayDB(Iterator):
     def __setitem__(self, index: int, value: V) -> None:
         if index >= self.__size:
             raise ContainerDBException(f'ArrayDB out of range')
+        self.__version += 1
         sub_db = self._db
         byte_value = ContainerUtil.encode_value(value)
         sub_db.put(ContainerUtil.encode_key(index), byte_value)
@@ -281,7 +364,7 @@ class ArrayDB(Iterator):
             return ContainerUtil.decode_object(sub_db.get(index_byte_key), self.__value_type)
 
     def __contains__(self, item: V):
-        for e in self:
+        for e in self.__iter_values():
             if e == item:
                 return True
         return False
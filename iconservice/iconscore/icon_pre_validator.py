@@ -14,17 +14,20 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 from ..base.address import Address, ZERO_SCORE_ADDRESS, generate_score_address
 from ..base.exception import InvalidRequestException, InvalidParamsException
 from ..icon_constant import FIXED_FEE, MAX_DATA_SIZE
+from .icon_score_step import get_data_size
 
 
 if TYPE_CHECKING:
     from ..deploy.icon_score_manager import IconScoreManager
     from ..deploy.icon_score_deploy_storage import IconScoreDeployStorage
     from ..icx.icx_engine import IcxEngine
+    from .icon_score_step import DataSize
+    from .icon_score_context import IconScoreContext
 
 
 class IconPreValidator:
@@ -44,7 +47,11 @@ class IconPreValidator:
         self._score_manager = score_manager
         self._deploy_storage = deploy_storage
 
-    def execute(self, params: dict, step_price: int, minimum_step: int) -> None:
+    def execute(self,
+                params: dict,
+                step_price: int,
+                minimum_step: int,
+                data_size: Optional['DataSize'] = None) -> None:
         """Validate a transaction on icx_sendTransaction
         If failed to validate a tx, raise an exception
 
@@ -54,9 +61,10 @@ class IconPreValidator:
         :param params: params of icx_sendTransaction JSON-RPC request
         :param step_price:
         :param minimum_step: minimum step
+        :param data_size: sizes of params['data'] if already computed
         """
 
-        self._check_data_size(params)
+        self._check_data_size(params, data_size)
 
         value: int = params.get('value', 0)
         if value < 0:
@@ -69,15 +77,21 @@ class IconPreValidator:
             self._validate_transaction_v3(params, step_price, minimum_step)
 
     def execute_to_check_out_of_balance(
-            self, params: dict, step_price: int) -> None:
+            self, params: dict, step_price: int, context: Optional['IconScoreContext'] = None) -> None:
+        """
+        :param params: params of icx_sendTransaction JSON-RPC request
+        :param step_price:
+        :param context: the balance is read on it. If it is None, the balance is read from StateDB
+        """
         version: int = params.get('version', 2)
 
         if version < 3:
-            self._check_from_can_charge_fee_v2(params)
+            self._check_from_can_charge_fee_v2(params, context)
         else:
-            self._check_from_can_charge_fee_v3(params, step_price)
+            self._check_from_can_charge_fee_v3(params, step_price, context)
 
-    def _check_data_size(self, params: dict):
+    @staticmethod
+    def _check_data_size(params: dict, data_size: Optional['DataSize'] = None):
         """
         Validates transaction data size whether total character length is less than MAX_DATA_SIZE
         If the property is a key-value object, counts key length and value length.
@@ -87,31 +101,17 @@ class IconPreValidator:
         But the field of 'data' has not been converted (TypeConvert marks it as LATER)
 
         :param params: params of icx_sendTransaction JSON-RPC request
+        :param data_size: sizes of params['data'] if already computed
         """
 
         if 'data' in params:
-            data = params['data']
-            size = self._get_character_length(data)
+            if data_size is None:
+                data_size = get_data_size(params['data'])
 
-            if size > MAX_DATA_SIZE:
+            if data_size.character_length > MAX_DATA_SIZE:
                 raise InvalidRequestException(f'The data field is too big')
 
-    def _get_character_length(self, data) -> int:
-        size = 0
-        if data:
-            if isinstance(data, dict):
-                for k, v in data.items():
-                    size += len(k)
-                    size += self._get_character_length(v)
-            elif isinstance(data, list):
-                for v in data:
-                    size += self._get_character_length(v)
-            elif isinstance(data, str):
-                size += len(data)
-
-        return size
-
-    def _check_from_can_charge_fee_v2(self, params: dict):
+    def _check_from_can_charge_fee_v2(self, params: dict, context: Optional['IconScoreContext'] = None):
         fee: int = params['fee']
         if fee != FIXED_FEE:
             raise InvalidRequestException(f'Invalid fee: {fee}')
@@ -119,7 +119,7 @@ class IconPreValidator:
         from_: 'Address' = params['from']
         value: int = params.get('value', 0)
 
-        self._check_balance(from_, value, fee)
+        self._check_balance(from_, value, fee, context)
 
     def _validate_transaction_v2(self, params: dict):
         """Validate transfer transaction based on protocol v2
@@ -164,14 +164,17 @@ class IconPreValidator:
         if step_limit < minimum_step:
             raise InvalidRequestException('Step limit too low')
 
-    def _check_from_can_charge_fee_v3(self, params: dict, step_price: int):
+    def _check_from_can_charge_fee_v3(self,
+                                      params: dict,
+                                      step_price: int,
+                                      context: Optional['IconScoreContext'] = None):
         from_: 'Address' = params['from']
         value: int = params.get('value', 0)
 
         step_limit = params.get('stepLimit', 0)
         fee = step_limit * step_price
 
-        self._check_balance(from_, value, fee)
+        self._check_balance(from_, value, fee, context)
 
     def _validate_call_transaction(self, params: dict):
         """Validate call transaction
@@ -250,8 +253,12 @@ class IconPreValidator:
         except BaseException as e:
             raise e
 
-    def _check_balance(self, from_: 'Address', value: int, fee: int):
-        balance = self._icx.get_balance(None, from_)
+    def _check_balance(self,
+                       from_: 'Address',
+                       value: int,
+                       fee: int,
+                       context: Optional['IconScoreContext'] = None):
+        balance = self._icx.get_balance(context, from_)
 
         if balance < value + fee:
             raise InvalidRequestException(f'Out of balance: balance({balance}) < value({value}) + fee({value})')
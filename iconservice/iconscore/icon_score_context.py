@@ -182,9 +182,11 @@ class IconScoreContext(object):
     def get_icon_score(self, address: 'Address') -> Optional['IconScoreBase']:
         score = None
 
-        if self.type == IconScoreContextType.INVOKE:
-            if self.new_icon_score_mapper is not None:
-                score = self.new_icon_score_mapper.get(address)
+        # The scores deployed in uncommitted blocks are looked up first on invoke and pending query
+        if self.new_icon_score_mapper is not None:
+            icon_score_info = self.new_icon_score_mapper.get(address)
+            if icon_score_info is not None:
+                score = icon_score_info.icon_score
         if score is None:
             score = self._get_icon_score(address)
 
@@ -33,6 +33,7 @@ INDEXED_ARGS_LIMIT = 3
 class EventLog(object):
     """ A DataClass of a event log.
     """
+    __slots__ = ('score_address', 'indexed', 'data')
 
     def __init__(
             self,
@@ -51,7 +52,9 @@ class EventLog(object):
         self.data: 'List[BaseType]' = data
 
     def __str__(self) -> str:
-        return '\n'.join([f'{k}: {v}' for k, v in self.__dict__.items()])
+        return f'score_address: {self.score_address}\n' \
+            f'indexed: {self.indexed}\n' \
+            f'data: {self.data}'
 
     def to_dict(self, casing: Optional = None) -> dict:
         """
@@ -59,12 +62,14 @@ class EventLog(object):
         :return: a dict
         """
         new_dict = {}
-        for key, value in self.__dict__.items():
-            if value is None:
-                # Excludes properties which have `None` value
-                continue
 
-            new_dict[casing(key) if casing else key] = value
+        # Excludes properties which have `None` value
+        if self.score_address is not None:
+            new_dict[casing('score_address') if casing else 'score_address'] = self.score_address
+        if self.indexed is not None:
+            new_dict[casing('indexed') if casing else 'indexed'] = self.indexed
+        if self.data is not None:
+            new_dict[casing('data') if casing else 'data'] = self.data
 
         return new_dict
 
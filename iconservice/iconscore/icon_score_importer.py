@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import re
+import sys
+from importlib.abc import MetaPathFinder
+from importlib.machinery import ModuleSpec, SourceFileLoader
+from importlib.util import spec_from_file_location
+from os import path
+from threading import Lock
+from typing import Optional
+
+# A SCORE package is imported as <address>.<tx_hash> where <address> is a directory in score_root_path
+_SCORE_ADDRESS_DIR = re.compile(r'^[0-9a-f]{42}$')
+
+_INIT_FILE = '__init__.py'
+_SOURCE_SUFFIX = '.py'
+
+
+class IconScoreMetaPathFinder(MetaPathFinder):
+    """Finds SCORE modules directly in the score root paths
+
+    Modules are looked up with a few stat calls in the directory of their parent package,
+    so no directory listing is cached and importlib.invalidate_caches() is not needed
+    after a SCORE is deployed. Score root paths are not added to sys.path.
+
+    Source files are loaded by SourceFileLoader which caches their bytecode in __pycache__.
+    """
+
+    def __init__(self) -> None:
+        self._score_root_paths = []
+        self._lock = Lock()
+
+    def add_score_root_path(self, score_root_path: str) -> None:
+        """Adds a score root path which is searched before the ones added already
+
+        :param score_root_path:
+        """
+        score_root_path = path.abspath(score_root_path)
+        with self._lock:
+            score_root_paths = [score_root_path]
+            score_root_paths.extend(p for p in self._score_root_paths if p != score_root_path)
+            self._score_root_paths = score_root_paths
+
+    def find_spec(self, fullname: str, search_path: Optional[list] = None, target=None) -> Optional['ModuleSpec']:
+        names = fullname.split('.')
+        if not _SCORE_ADDRESS_DIR.match(names[0]):
+            return None
+
+        if len(names) == 1:
+            address_paths = [path.join(score_root_path, fullname) for score_root_path in self._score_root_paths]
+            address_paths = [address_path for address_path in address_paths if path.isdir(address_path)]
+            return self._make_namespace_spec(fullname, address_paths) if address_paths else None
+
+        if len(names) == 2:
+            # An address package imported earlier may have been searched in other score root paths
+            search_path = [path.join(score_root_path, names[0]) for score_root_path in self._score_root_paths]
+        elif search_path is None:
+            return None
+
+        name = names[-1]
+        for parent_path in search_path:
+            module_path = path.join(parent_path, name)
+
+            init_path = path.join(module_path, _INIT_FILE)
+            if path.isfile(init_path):
+                return spec_from_file_location(fullname, init_path,
+                                               loader=SourceFileLoader(fullname, init_path),
+                                               submodule_search_locations=[module_path])
+
+            source_path = module_path + _SOURCE_SUFFIX
+            if path.isfile(source_path):
+                return spec_from_file_location(fullname, source_path,
+                                               loader=SourceFileLoader(fullname, source_path))
+
+            if path.isdir(module_path):
+                return self._make_namespace_spec(fullname, [module_path])
+
+        return None
+
+    @staticmethod
+    def _make_namespace_spec(fullname: str, module_paths: list) -> 'ModuleSpec':
+        spec = ModuleSpec(fullname, None, is_package=True)
+        spec.submodule_search_locations = module_paths
+        return spec
+
+
+_finder = IconScoreMetaPathFinder()
+
+
+def install_score_finder(score_root_path: str) -> None:
+    """Makes SCORE packages in score_root_path importable
+
+    :param score_root_path:
+    """
+    _finder.add_score_root_path(score_root_path)
+    if _finder not in sys.meta_path:
+        sys.meta_path.insert(0, _finder)
@@ -14,19 +14,22 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import importlib.util
+import importlib
 import json
 import sys
 from os import path
+from threading import Lock
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 from iconcommons import Logger
+from .icon_score_importer import install_score_finder
 from .score_package_validator import ScorePackageValidator
 from ..icon_constant import IconScoreLoaderFlag
 
 if TYPE_CHECKING:
     from ..base.address import Address
+    from ..deploy.icon_score_package_staging import IconScorePackageStaging
 
 
 class IconScoreLoader(object):
@@ -34,11 +37,23 @@ class IconScoreLoader(object):
     _MAIN_SCORE = 'main_score'
     _MAIN_FILE = 'main_file'
 
-    def __init__(self, score_root_path: str, flag: int):
+    def __init__(self,
+                 score_root_path: str,
+                 flag: int,
+                 package_staging: Optional['IconScorePackageStaging'] = None):
+        """Constructor
+
+        :param score_root_path:
+        :param flag:
+        :param package_staging: packages validated while staged are not validated again on load
+        """
         self._score_root_path = score_root_path
         self._flag = flag
-        if score_root_path not in sys.path:
-            sys.path.append(score_root_path)
+        self._package_staging = package_staging
+        # import names (address.tx_hash) of the loaded score packages
+        self._loaded_packages = set()
+        self._lock = Lock()
+        install_score_finder(score_root_path)
 
     def _is_flag_on(self, flag: 'IconScoreLoaderFlag') -> bool:
         return (self._flag & flag) == flag
@@ -57,19 +72,97 @@ class IconScoreLoader(object):
         converted_tx_hash = f'0x{bytes.hex(tx_hash)}'
         return path.join(self._score_root_path, score_addr.to_bytes().hex(), converted_tx_hash)
 
+    @property
+    def loaded_packages(self) -> set:
+        with self._lock:
+            return set(self._loaded_packages)
+
     def load_score(self, score_path: str) -> callable:
         score_package_info = self._load_json(score_path)
         pkg_root_import: str = self._make_pkg_root_import(score_path)
 
-        if self._is_flag_on(IconScoreLoaderFlag.ENABLE_SCORE_PACKAGE_VALIDATOR):
-            ScorePackageValidator().validator(score_path, pkg_root_import)
+        # Validation imports the package as well, so it is tracked before that
+        with self._lock:
+            self._loaded_packages.add(pkg_root_import)
+
+        try:
+            if self._is_flag_on(IconScoreLoaderFlag.ENABLE_SCORE_PACKAGE_VALIDATOR):
+                self._validate_package(score_path, pkg_root_import)
 
-        # in order for the new module to be noticed by the import system
-        importlib.invalidate_caches()
-        mod = importlib.import_module(f".{score_package_info[self._MAIN_FILE]}", pkg_root_import)
+            mod = importlib.import_module(f".{score_package_info[self._MAIN_FILE]}", pkg_root_import)
+        except BaseException as e:
+            # The modules imported by a failed load are not used
+            self._unload_packages(pkg_root_import.split('.')[0], [pkg_root_import])
+            raise e
 
         return getattr(mod, score_package_info[self._MAIN_SCORE])
 
+    def unload_score(self, score_addr: 'Address', tx_hash: Optional[bytes] = None) -> None:
+        """Removes the modules of a score package from sys.modules
+
+        Score objects created already keep working with the modules they refer to.
+        If the package is loaded again, it is imported anew.
+
+        :param score_addr:
+        :param tx_hash: all the loaded packages of score_addr are unloaded if it is None
+        """
+        address_import: str = score_addr.to_bytes().hex()
+        if tx_hash is None:
+            prefix = f'{address_import}.'
+        else:
+            prefix = f'{address_import}.0x{bytes.hex(tx_hash)}'
+
+        with self._lock:
+            pkg_root_imports = [name for name in self._loaded_packages if name.startswith(prefix)]
+        if pkg_root_imports:
+            self._unload_packages(address_import, pkg_root_imports)
+
+    def _unload_packages(self, address_import: str, pkg_root_imports: list) -> None:
+        """Stops tracking score packages of an address and removes their modules
+
+        :param address_import: import name of the address
+        :param pkg_root_imports: import names of the packages (address.tx_hash)
+        """
+        with self._lock:
+            self._loaded_packages.difference_update(pkg_root_imports)
+            is_address_loaded = any(name.startswith(f'{address_import}.') for name in self._loaded_packages)
+
+        for pkg_root_import in pkg_root_imports:
+            self._remove_modules(pkg_root_import)
+
+        address_module = sys.modules.get(address_import)
+        if address_module is None:
+            return
+        if is_address_loaded:
+            for pkg_root_import in pkg_root_imports:
+                module_name = pkg_root_import[len(address_import) + 1:]
+                if hasattr(address_module, module_name):
+                    delattr(address_module, module_name)
+        else:
+            sys.modules.pop(address_import, None)
+
+    @staticmethod
+    def _remove_modules(pkg_root_import: str) -> None:
+        prefix = f'{pkg_root_import}.'
+        for name in [name for name in list(sys.modules) if name == pkg_root_import or name.startswith(prefix)]:
+            sys.modules.pop(name, None)
+
+    def _validate_package(self, score_path: str, pkg_root_import: str) -> None:
+        """Validates the package unless a verdict for the same files has been saved
+        """
+        if self._is_validated_on_staging(score_path):
+            ScorePackageValidator.save_verdict(score_path)
+            return
+
+        if ScorePackageValidator.is_validated(score_path):
+            return
+
+        ScorePackageValidator().validator(score_path, pkg_root_import)
+        ScorePackageValidator.save_verdict(score_path)
+
+    def _is_validated_on_staging(self, score_path: str) -> bool:
+        return self._package_staging is not None and self._package_staging.pop_validated(score_path)
+
     def _make_pkg_root_import(self, score_path: str) -> str:
         """
         score_root_path: .../.score
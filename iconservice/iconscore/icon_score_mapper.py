@@ -45,12 +45,17 @@ class IconScoreMapper(object):
     icon_score_loader: 'IconScoreLoader' = None
     deploy_storage: 'IconScoreDeployStorage' = None
 
-    def __init__(self, is_lock: bool = False) -> None:
+    def __init__(self, is_lock: bool = False, prev_mapper: Optional['IconScoreMapper'] = None) -> None:
         """Constructor
+
+        :param is_lock:
+        :param prev_mapper: the scores deployed in the parent block which has not been committed yet
         """
         self._score_mapper = IconScoreMapperObject()
         self._lock = Lock()
         self._is_lock = is_lock
+        # get() falls back to it
+        self.prev_mapper = prev_mapper
 
     def __contains__(self, address: 'Address'):
         if self._is_lock:
@@ -62,23 +67,79 @@ class IconScoreMapper(object):
     def __setitem__(self, key, value):
         if self._is_lock:
             with self._lock:
-                self._score_mapper[key] = value
+                self._put(key, value)
         else:
+            self._put(key, value)
+
+    def put_if_absent(self, key, value) -> bool:
+        """Puts score info unless the mapper has one for the address already
+
+        If value is not put, the package loaded for it is unloaded
+        unless it is the same package as the one in the mapper.
+
+        :return: True if value is put
+        """
+        if self._is_lock:
+            with self._lock:
+                return self._put_if_absent(key, value)
+        else:
+            return self._put_if_absent(key, value)
+
+    def _put_if_absent(self, key, value) -> bool:
+        info = self._score_mapper.get(key)
+        if info is None:
             self._score_mapper[key] = value
+            return True
+
+        if info.tx_hash != value.tx_hash:
+            self._unload_score(key, value.tx_hash)
+        return False
 
     def get(self, key):
         if self._is_lock:
             with self._lock:
-                return self._score_mapper.get(key)
+                info = self._score_mapper.get(key)
         else:
-            return self._score_mapper.get(key)
+            info = self._score_mapper.get(key)
+
+        if info is None and self.prev_mapper is not None:
+            return self.prev_mapper.get(key)
+        return info
 
     def update(self, mapper: 'IconScoreMapper'):
         if self._is_lock:
             with self._lock:
-                self._score_mapper.update(mapper._score_mapper)
+                self._update(mapper)
         else:
-            self._score_mapper.update(mapper._score_mapper)
+            self._update(mapper)
+
+    def _update(self, mapper: 'IconScoreMapper'):
+        for key, value in mapper._score_mapper.items():
+            self._put(key, value)
+
+    def _put(self, address: 'Address', info: 'IconScoreInfo'):
+        """Puts score info and unloads the score version which it supersedes
+        """
+        prev_info = self._score_mapper.get(address)
+        self._score_mapper[address] = info
+        if prev_info is not None and prev_info.tx_hash != info.tx_hash:
+            self._unload_score(address, prev_info.tx_hash)
+
+    def discard(self, mapper: 'IconScoreMapper'):
+        """Unloads the scores of a mapper which will not be committed
+
+        :param mapper: new_icon_score_mapper of a block which is rolled back or not chosen
+        """
+        for address, info in mapper._score_mapper.items():
+            current_info = self.get(address)
+            if current_info is None or current_info.tx_hash != info.tx_hash:
+                self._unload_score(address, info.tx_hash)
+
+    @classmethod
+    def _unload_score(cls, address: 'Address', tx_hash: Optional[bytes] = None):
+        if cls.icon_score_loader is None:
+            return
+        cls.icon_score_loader.unload_score(address, tx_hash)
 
     def close(self):
         for addr, info in self._score_mapper.items():
@@ -193,6 +254,8 @@ class IconScoreMapper(object):
         else:
             target_path = os.path.join(score_root_path, bytes.hex(address.to_bytes()), converted_tx_hash)
 
+        cls._unload_score(address, None if converted_tx_hash is None else bytes.fromhex(converted_tx_hash[2:]))
+
         try:
             rmtree(target_path)
         except Exception as e:
@@ -28,11 +28,16 @@ if TYPE_CHECKING:
 class TransactionResult(object):
     """ A DataClass of a transaction result.
     """
+    __slots__ = ('tx_hash', 'block_height', 'block_hash', 'tx_index', 'to', 'score_address',
+                 'step_used', 'step_price', 'cumulative_step_used', 'event_logs', 'logs_bloom',
+                 'status', 'failure', 'traces')
 
     SUCCESS = 1
     FAILURE = 0
 
     class Failure(object):
+        __slots__ = ('code', 'message')
+
         def __init__(self, code: int, message: str):
             self.code = int(code)
             self.message = str(message)
@@ -82,35 +87,50 @@ class TransactionResult(object):
         self.traces = None
 
     def __str__(self) -> str:
-        return '\n'.join([f'{k}: {v}' for k, v in self.__dict__.items()])
+        return '\n'.join([f'{k}: {getattr(self, k)}' for k in self.__slots__])
 
     def to_dict(self, casing: Optional = None) -> dict:
         """
         Returns properties as `dict`
+        Traces are excluded from dict property
+
         :return: a dict
         """
+        event_logs = self.event_logs
+        if event_logs is not None:
+            event_logs = [v.to_dict(casing) for v in event_logs if isinstance(v, EventLog)]
+
+        logs_bloom = self.logs_bloom
+        if isinstance(logs_bloom, BloomFilter):
+            logs_bloom = int(logs_bloom).to_bytes(256, byteorder=DATA_BYTE_ORDER)
+
+        failure = None
+        if self.failure and self.status == self.FAILURE:
+            failure = {
+                'code': self.failure.code,
+                'message': self.failure.message
+            }
+
+        properties = (
+            ('tx_hash', self.tx_hash),
+            ('block_height', self.block_height),
+            ('block_hash', self.block_hash),
+            ('tx_index', self.tx_index),
+            ('to', self.to),
+            ('score_address', self.score_address),
+            ('step_used', self.step_used),
+            ('step_price', self.step_price),
+            ('cumulative_step_used', self.cumulative_step_used),
+            ('event_logs', event_logs),
+            ('logs_bloom', logs_bloom),
+            ('status', self.status),
+            ('failure', failure)
+        )
+
         new_dict = {}
-        for key, value in self.__dict__.items():
+        for key, value in properties:
             # Excludes properties which have `None` value
-            if value is None:
-                continue
-
-            new_key = casing(key) if casing else key
-            if key == 'event_logs':
-                new_dict[new_key] = [v.to_dict(casing) for v in value if
-                                     isinstance(v, EventLog)]
-            elif isinstance(value, BloomFilter):
-                new_dict[new_key] = int(value).to_bytes(256, byteorder=DATA_BYTE_ORDER)
-            elif key == 'failure' and value:
-                if self.status == self.FAILURE:
-                    new_dict[new_key] = {
-                        'code': value.code,
-                        'message': value.message
-                    }
-            elif key == 'traces':
-                # traces are excluded from dict property
-                continue
-            else:
-                new_dict[new_key] = value
+            if value is not None:
+                new_dict[casing(key) if casing else key] = value
 
         return new_dict
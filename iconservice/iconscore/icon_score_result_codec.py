@@ -0,0 +1,371 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Encodings of invoke responses
+
+JSON: the camelCase dict of hex strings, made in one pass by make_invoke_json_response()
+
+Binary: an opt-in alternative to JSON
+which is negotiated per channel (see IconScoreInnerTask.negotiate_response_format)
+
+Binary layout (version 1, big endian)
+    magic(4) | version(1) | state_root_hash(value) | tx_count(4)
+    | { record_length(4) | record }...
+
+    record: the values below in order
+        tx_hash, block_height, block_hash, tx_index, to, score_address,
+        step_used, step_price, cumulative_step_used, event_logs,
+        logs_bloom, status, failure
+    event log: [score_address, indexed, data]
+    failure: [code, message] or None
+
+    value: tag(1) | payload
+        NONE, FALSE, TRUE: no payload
+        INT: length(1) | signed integer
+        BIG_INT: length(4) | signed integer (longer than 255 bytes)
+        BYTES, STR(utf-8): length(4) | data
+        ADDRESS: prefix(1) | length(1) | body
+        LIST: count(4) | value...
+"""
+
+from struct import Struct
+from typing import List, Any, Tuple
+
+from .icon_score_event_log import EventLog
+from .icon_score_result import TransactionResult
+from ..base.address import Address, AddressPrefix
+from ..base.exception import InvalidParamsException
+from ..base.type_converter import TypeConverter
+from ..icon_constant import DATA_BYTE_ORDER
+from ..utils import byte_length_of_int
+from ..utils.bloom import BloomFilter
+
+BINARY_RESPONSE_MAGIC = b'ISRB'
+BINARY_RESPONSE_VERSION = 1
+
+_TAG_NONE = 0
+_TAG_FALSE = 1
+_TAG_TRUE = 2
+_TAG_INT = 3
+_TAG_BYTES = 4
+_TAG_STR = 5
+_TAG_ADDRESS = 6
+_TAG_LIST = 7
+_TAG_BIG_INT = 8
+
+_MAX_UINT8 = 0xff
+
+_header_struct = Struct(f'>{len(BINARY_RESPONSE_MAGIC)}sB')
+_uint32_struct = Struct('>I')
+_tag_uint8_struct = Struct('>BB')
+_tag_uint32_struct = Struct('>BI')
+_address_struct = Struct('>BBB')
+
+# camelCase keys of a transaction result in the order of a record
+_TX_RESULT_KEYS = ('txHash', 'blockHeight', 'blockHash', 'txIndex', 'to', 'scoreAddress',
+                   'stepUsed', 'stepPrice', 'cumulativeStepUsed', 'eventLogs',
+                   'logsBloom', 'status', 'failure')
+_EVENT_LOG_KEYS = ('scoreAddress', 'indexed', 'data')
+
+
+def make_invoke_json_response(tx_results: List['TransactionResult'], state_root_hash: bytes) -> dict:
+    """Makes the JSON response of invoke in one pass
+
+    The response is identical to MakeResponse.make_response() of TransactionResult.to_dict(to_camel_case)
+    but camelCase keys are static and values are formatted to hex strings directly.
+    Unlike TypeConverter.convert_type_reverse(), values in the results are not modified.
+
+    :param tx_results: transaction results in a block
+    :param state_root_hash: state root hash of the block
+    :return: JSON response
+    """
+    return {
+        'txResults': {bytes.hex(tx_result.tx_hash): _tx_result_to_json(tx_result) for tx_result in tx_results},
+        'stateRootHash': bytes.hex(state_root_hash)
+    }
+
+
+def encode_invoke_response(tx_results: List['TransactionResult'], state_root_hash: bytes) -> bytes:
+    """Encodes the results of invoke to bytes
+
+    :param tx_results: transaction results in a block
+    :param state_root_hash: state root hash of the block
+    :return: binary response
+    """
+    buf = bytearray(_header_struct.pack(BINARY_RESPONSE_MAGIC, BINARY_RESPONSE_VERSION))
+    _encode_value(buf, state_root_hash)
+    buf += _uint32_struct.pack(len(tx_results))
+
+    record = bytearray()
+    for tx_result in tx_results:
+        record.clear()
+        _encode_tx_result(record, tx_result)
+        buf += _uint32_struct.pack(len(record))
+        buf += record
+
+    return bytes(buf)
+
+
+def decode_invoke_response(data: bytes) -> dict:
+    """Reference decoder of a binary response
+
+    Returns the same dict as the JSON response before hex-encoding
+    so TypeConverter.convert_type_reverse() makes it identical to the JSON response
+
+    :param data: binary response
+    :return: {'txResults': {tx hash in hex: camelCase dict}, 'stateRootHash': hex}
+    """
+    view = memoryview(data)
+    magic, version = _header_struct.unpack_from(view, 0)
+    if magic != BINARY_RESPONSE_MAGIC:
+        raise InvalidParamsException('Invalid binary response')
+    if version != BINARY_RESPONSE_VERSION:
+        raise InvalidParamsException(f'Unsupported binary response version: {version}')
+
+    offset = _header_struct.size
+    state_root_hash, offset = _decode_value(view, offset)
+    tx_count, = _uint32_struct.unpack_from(view, offset)
+    offset += _uint32_struct.size
+
+    tx_results = {}
+    for _ in range(tx_count):
+        record_length, = _uint32_struct.unpack_from(view, offset)
+        offset += _uint32_struct.size
+        record_end = offset + record_length
+
+        tx_result = {}
+        for key in _TX_RESULT_KEYS:
+            value, offset = _decode_value(view, offset)
+            if value is None:
+                continue
+            if key == 'eventLogs':
+                value = [_to_event_log_dict(event_log) for event_log in value]
+            elif key == 'failure':
+                value = {'code': value[0], 'message': value[1]}
+            tx_result[key] = value
+
+        if offset != record_end:
+            raise InvalidParamsException('Invalid binary response record length')
+        tx_results[bytes.hex(tx_result['txHash'])] = tx_result
+
+    return {
+        'txResults': tx_results,
+        'stateRootHash': bytes.hex(state_root_hash)
+    }
+
+
+def _tx_result_to_json(tx_result: 'TransactionResult') -> dict:
+    """Formats a transaction result with the same rules as TransactionResult.to_dict()
+    """
+    event_logs = tx_result.event_logs
+    if event_logs is not None:
+        event_logs = [_event_log_to_json(v) for v in event_logs if isinstance(v, EventLog)]
+
+    logs_bloom = tx_result.logs_bloom
+    if isinstance(logs_bloom, BloomFilter):
+        # The same as the hex string of a 256-byte big endian bloom
+        logs_bloom = f'0x{int(logs_bloom):0512x}'
+    elif logs_bloom is not None:
+        logs_bloom = _value_to_json(logs_bloom)
+
+    failure = None
+    if tx_result.failure and tx_result.status == TransactionResult.FAILURE:
+        failure = {
+            'code': _value_to_json(tx_result.failure.code),
+            'message': _value_to_json(tx_result.failure.message)
+        }
+
+    new_dict = {}
+    value = tx_result.tx_hash
+    if value is not None:
+        new_dict['txHash'] = _hash_to_json(value)
+    value = tx_result.block_height
+    if value is not None:
+        new_dict['blockHeight'] = _value_to_json(value)
+    value = tx_result.block_hash
+    if value is not None:
+        new_dict['blockHash'] = _hash_to_json(value)
+    value = tx_result.tx_index
+    if value is not None:
+        new_dict['txIndex'] = _value_to_json(value)
+    value = tx_result.to
+    if value is not None:
+        new_dict['to'] = _value_to_json(value)
+    value = tx_result.score_address
+    if value is not None:
+        new_dict['scoreAddress'] = _value_to_json(value)
+    value = tx_result.step_used
+    if value is not None:
+        new_dict['stepUsed'] = _value_to_json(value)
+    value = tx_result.step_price
+    if value is not None:
+        new_dict['stepPrice'] = _value_to_json(value)
+    value = tx_result.cumulative_step_used
+    if value is not None:
+        new_dict['cumulativeStepUsed'] = _value_to_json(value)
+    if event_logs is not None:
+        new_dict['eventLogs'] = event_logs
+    if logs_bloom is not None:
+        new_dict['logsBloom'] = logs_bloom
+    value = tx_result.status
+    if value is not None:
+        new_dict['status'] = _value_to_json(value)
+    if failure is not None:
+        new_dict['failure'] = failure
+
+    return new_dict
+
+
+def _event_log_to_json(event_log: 'EventLog') -> dict:
+    """Formats an event log with the same rules as EventLog.to_dict()
+    """
+    new_dict = {}
+    if event_log.score_address is not None:
+        new_dict['scoreAddress'] = _value_to_json(event_log.score_address)
+    if event_log.indexed is not None:
+        new_dict['indexed'] = _value_to_json(event_log.indexed)
+    if event_log.data is not None:
+        new_dict['data'] = _value_to_json(event_log.data)
+
+    return new_dict
+
+
+def _hash_to_json(value: Any) -> Any:
+    # Hashes are formatted without '0x' prefix
+    if isinstance(value, bytes):
+        return bytes.hex(value)
+    return _value_to_json(value)
+
+
+def _value_to_json(value: Any) -> Any:
+    value_type = type(value)
+    if value_type is int:
+        return hex(value)
+    if value_type is str:
+        return value
+    if value_type is Address:
+        return str(value)
+    if value_type is bytes:
+        return f'0x{bytes.hex(value)}'
+    if value_type is list:
+        return [_value_to_json(v) for v in value]
+    if value is None:
+        return None
+
+    # bool, MalformedAddress and so on
+    return TypeConverter.convert_type_reverse(value)
+
+
+def _encode_tx_result(buf: bytearray, tx_result: 'TransactionResult') -> None:
+    """Encodes a transaction result with the same rules as TransactionResult.to_dict()
+    """
+    event_logs = tx_result.event_logs
+    if event_logs is not None:
+        event_logs = [[v.score_address, v.indexed, v.data] for v in event_logs if isinstance(v, EventLog)]
+
+    logs_bloom = tx_result.logs_bloom
+    if isinstance(logs_bloom, BloomFilter):
+        logs_bloom = int(logs_bloom).to_bytes(256, byteorder=DATA_BYTE_ORDER)
+
+    failure = None
+    if tx_result.failure and tx_result.status == TransactionResult.FAILURE:
+        failure = [tx_result.failure.code, tx_result.failure.message]
+
+    for value in (tx_result.tx_hash, tx_result.block_height, tx_result.block_hash, tx_result.tx_index,
+                  tx_result.to, tx_result.score_address, tx_result.step_used, tx_result.step_price,
+                  tx_result.cumulative_step_used, event_logs, logs_bloom, tx_result.status, failure):
+        _encode_value(buf, value)
+
+
+def _encode_value(buf: bytearray, value: Any) -> None:
+    if value is None:
+        buf.append(_TAG_NONE)
+    elif value is True:
+        buf.append(_TAG_TRUE)
+    elif value is False:
+        buf.append(_TAG_FALSE)
+    elif isinstance(value, int):
+        length = byte_length_of_int(value)
+        if length <= _MAX_UINT8:
+            buf += _tag_uint8_struct.pack(_TAG_INT, length)
+        else:
+            buf += _tag_uint32_struct.pack(_TAG_BIG_INT, length)
+        buf += value.to_bytes(length, DATA_BYTE_ORDER, signed=True)
+    elif isinstance(value, bytes):
+        buf += _tag_uint32_struct.pack(_TAG_BYTES, len(value))
+        buf += value
+    elif isinstance(value, str):
+        encoded = value.encode('utf-8')
+        buf += _tag_uint32_struct.pack(_TAG_STR, len(encoded))
+        buf += encoded
+    elif isinstance(value, Address):
+        body = value.body
+        buf += _address_struct.pack(_TAG_ADDRESS, value.prefix, len(body))
+        buf += body
+    elif isinstance(value, list):
+        buf += _tag_uint32_struct.pack(_TAG_LIST, len(value))
+        for item in value:
+            _encode_value(buf, item)
+    else:
+        raise InvalidParamsException(f'Not supported type in binary response: {type(value)}')
+
+
+def _decode_value(view: memoryview, offset: int) -> Tuple[Any, int]:
+    tag = view[offset]
+    offset += 1
+
+    if tag == _TAG_NONE:
+        return None, offset
+    if tag == _TAG_TRUE:
+        return True, offset
+    if tag == _TAG_FALSE:
+        return False, offset
+    if tag == _TAG_INT:
+        length = view[offset]
+        offset += 1
+        end = offset + length
+        return int.from_bytes(view[offset:end], DATA_BYTE_ORDER, signed=True), end
+    if tag == _TAG_BIG_INT:
+        length, = _uint32_struct.unpack_from(view, offset)
+        offset += _uint32_struct.size
+        end = offset + length
+        return int.from_bytes(view[offset:end], DATA_BYTE_ORDER, signed=True), end
+    if tag == _TAG_BYTES or tag == _TAG_STR:
+        length, = _uint32_struct.unpack_from(view, offset)
+        offset += _uint32_struct.size
+        end = offset + length
+        value = view[offset:end].tobytes()
+        return (value if tag == _TAG_BYTES else value.decode('utf-8')), end
+    if tag == _TAG_ADDRESS:
+        prefix, length = view[offset], view[offset + 1]
+        offset += 2
+        end = offset + length
+        return Address(AddressPrefix(prefix), view[offset:end].tobytes(), ignore_length_validate=True), end
+    if tag == _TAG_LIST:
+        count, = _uint32_struct.unpack_from(view, offset)
+        offset += _uint32_struct.size
+        items = []
+        for _ in range(count):
+            item, offset = _decode_value(view, offset)
+            items.append(item)
+        return items, offset
+
+    raise InvalidParamsException(f'Invalid value tag in binary response: {tag}')
+
+
+def _to_event_log_dict(event_log: list) -> dict:
+    # Excludes properties which have `None` value like EventLog.to_dict()
+    return {key: value for key, value in zip(_EVENT_LOG_KEYS, event_log) if value is not None}
@@ -13,10 +13,11 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from collections import namedtuple
 from enum import Enum, auto
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Tuple
 
-from iconservice.utils import to_camel_case
+from iconservice.utils import to_camel_case, is_lowercase_hex_string, byte_length_of_int
 from ..base.exception import IconServiceBaseException, ExceptionCode
 
 if TYPE_CHECKING:
@@ -46,12 +47,22 @@ class StepType(AutoValueEnum):
     API_CALL = auto()
 
 
+# Every StepType has a small integer id which indexes a compiled step cost table.
+# It saves hashing an Enum member (Enum.__hash__) on every apply_step() call.
+for _step_type_id, _step_type in enumerate(StepType):
+    _step_type.id = _step_type_id
+del _step_type_id, _step_type
+
+_DEFAULT_STEP_TYPE_ID = StepType.DEFAULT.id
+
+
 class IconScoreStepCounterFactory(object):
     """Creates a step counter for the transaction
     """
 
     def __init__(self) -> None:
         self._step_cost_dict = {}
+        self._step_cost_table: tuple = self._compile_step_costs(self._step_cost_dict)
         self._step_price = 0
         self._max_step_limits = {}
 
@@ -61,10 +72,25 @@ class IconScoreStepCounterFactory(object):
     def set_step_cost(self, step_type: 'StepType', value: int):
         """Sets the step cost for specific action.
 
+        The step cost table is recompiled only when a cost is really changed
+
         :param step_type: specific action
         :param value: step cost
         """
+        if self._step_cost_dict.get(step_type) == value:
+            return
+
         self._step_cost_dict[step_type] = value
+        self._step_cost_table = self._compile_step_costs(self._step_cost_dict)
+
+    @staticmethod
+    def _compile_step_costs(step_cost_dict: dict) -> tuple:
+        """Makes an immutable step cost table indexed by StepType.id
+
+        :param step_cost_dict: step costs keyed by StepType
+        :return: step cost table
+        """
+        return tuple(step_cost_dict.get(step_type, 0) for step_type in StepType)
 
     def get_step_price(self):
         """Returns the step price
@@ -104,10 +130,10 @@ class IconScoreStepCounterFactory(object):
         :return: step counter
         """
 
-        # Copying a `dict` so as not to change step costs when processing a
-        # transaction.
+        # The step cost table is immutable, so it is shared by all step counters
+        # without copying and a transaction in progress never sees changed step costs.
         return IconScoreStepCounter(
-            self._step_cost_dict.copy(), step_limit, self._step_price)
+            self._step_cost_table, step_limit, self._step_price)
 
 
 class OutOfStepException(IconServiceBaseException):
@@ -169,21 +195,24 @@ class OutOfStepException(IconServiceBaseException):
 class IconScoreStepCounter(object):
     """ Counts steps in a transaction
     """
+    __slots__ = ('_step_cost_table', '_step_limit', '_step_price', '_step_used', '_min_step_used')
 
     def __init__(self,
-                 step_cost_dict: dict,
+                 step_cost_table: tuple,
                  step_limit: int,
                  step_price: int) -> None:
         """Constructor
 
-        :param step_cost_dict: a dict of base step costs
+        :param step_cost_table: base step costs indexed by StepType.id
         :param step_limit: step limit for the transaction
         :param step_price: step price
         """
-        self._step_cost_dict: dict = step_cost_dict
+        self._step_cost_table: tuple = step_cost_table
         self._step_limit: int = step_limit
         self._step_price = step_price
         self._step_used: int = 0
+        # A transaction uses at least the default steps
+        self._min_step_used: int = step_cost_table[_DEFAULT_STEP_TYPE_ID]
 
     @property
     def step_used(self) -> int:
@@ -191,8 +220,8 @@ class IconScoreStepCounter(object):
         Returns used steps in the transaction
         :return: used steps in the transaction
         """
-        return max(self._step_used,
-                   self._step_cost_dict.get(StepType.DEFAULT, 0))
+        step_used = self._step_used
+        return step_used if step_used > self._min_step_used else self._min_step_used
 
     @property
     def step_limit(self) -> int:
@@ -213,7 +242,7 @@ class IconScoreStepCounter(object):
     def apply_step(self, step_type: StepType, count: int) -> int:
         """ Increases steps for given step cost
         """
-        step_to_apply = self._step_cost_dict.get(step_type, 0) * count
+        step_to_apply = self._step_cost_table[step_type.id] * count
         if step_to_apply + self._step_used > self._step_limit:
             step_used = self._step_used
             self._step_used = self._step_limit
@@ -223,3 +252,70 @@ class IconScoreStepCounter(object):
         self._step_used += step_to_apply
 
         return self.step_used
+
+
+# Sizes of the data field in a transaction
+#   character_length: the number of characters in keys and string values (MAX_DATA_SIZE)
+#   byte_length: the size of values charged with StepType.INPUT
+#   content_byte_length: the size of data['content'] charged with StepType.CONTRACT_SET
+DataSize = namedtuple('DataSize', ('character_length', 'byte_length', 'content_byte_length'))
+
+
+def get_data_size(data: Any) -> 'DataSize':
+    """Computes all sizes of the data field in a transaction at once
+
+    Every sizes are computed while walking the data only one time
+    so that a big deploy content is not scanned repeatedly.
+
+    :param data: the data field in icx_sendTransaction params
+    :return: DataSize
+    """
+    if not isinstance(data, dict):
+        character_length, byte_length = _get_value_size(data)
+        return DataSize(character_length, byte_length, 0)
+
+    character_length = byte_length = content_byte_length = 0
+    for key, value in data.items():
+        value_character_length, value_byte_length = _get_value_size(value)
+        character_length += len(key) + value_character_length
+        byte_length += value_byte_length
+        if key == 'content':
+            content_byte_length = value_byte_length
+
+    return DataSize(character_length, byte_length, content_byte_length)
+
+
+def _get_value_size(data: Any) -> Tuple[int, int]:
+    """Returns the character length and the byte length of data
+
+    A hex string is counted as bytes, other string as utf-8 encoded bytes
+    and int (bool) as signed big-endian bytes
+
+    :param data: dict, list, str, int or bool
+    :return: (character length, byte length)
+    """
+    character_length = byte_length = 0
+    values = [data]
+
+    while values:
+        value = values.pop()
+        if not value:
+            continue
+
+        if isinstance(value, dict):
+            for k, v in value.items():
+                character_length += len(k)
+                values.append(v)
+        elif isinstance(value, list):
+            values.extend(value)
+        elif isinstance(value, str):
+            character_length += len(value)
+            body = value[2:] if value.startswith('0x') else value
+            if is_lowercase_hex_string(body):
+                byte_length += (len(body) + 1) // 2
+            else:
+                byte_length += len(value.encode('utf-8'))
+        elif isinstance(value, int):
+            byte_length += byte_length_of_int(value)
+
+    return character_length, byte_length
@@ -41,6 +41,7 @@ class Trace(object):
     }
 
     """
+    __slots__ = ('score_address', 'trace', 'data')
 
     def __init__(
             self,
@@ -64,7 +65,9 @@ class Trace(object):
         self.data: list = data
 
     def __str__(self) -> str:
-        return '\n'.join([f'{k}: {v}' for k, v in self.__dict__.items()])
+        return f'score_address: {self.score_address}\n' \
+            f'trace: {self.trace}\n' \
+            f'data: {self.data}'
 
     def to_dict(self, casing: Optional = None) -> dict:
         """
@@ -72,14 +75,14 @@ class Trace(object):
         :return: a dict
         """
         new_dict = {}
-        for key, value in self.__dict__.items():
-            if value is None:
-                # Excludes properties which have `None` value
-                continue
 
-            if isinstance(value, TraceType):
-                value = value.name
-
-            new_dict[casing(key) if casing else key] = value
+        # Excludes properties which have `None` value
+        if self.score_address is not None:
+            new_dict[casing('score_address') if casing else 'score_address'] = self.score_address
+        if self.trace is not None:
+            trace = self.trace.name if isinstance(self.trace, TraceType) else self.trace
+            new_dict[casing('trace') if casing else 'trace'] = trace
+        if self.data is not None:
+            new_dict[casing('data') if casing else 'data'] = self.data
 
         return new_dict
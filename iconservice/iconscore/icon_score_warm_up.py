@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from threading import Thread, Event
+from typing import TYPE_CHECKING, Optional
+
+from iconcommons.logger import Logger
+from .icon_score_context import ContextContainer, IconScoreContextType
+from .icon_score_mapper_object import IconScoreInfo
+from ..icon_constant import DEFAULT_BYTE_SIZE, ICON_LOADER_LOG_TAG
+
+if TYPE_CHECKING:
+    from .icon_score_context import IconScoreContextFactory
+    from .icon_score_mapper import IconScoreMapper
+    from ..deploy.icon_score_deploy_storage import IconScoreDeployStorage, IconScoreDeployInfo
+
+
+class IconScoreWarmUp(ContextContainer):
+    """Loads the active scores into IconScoreMapper on a background thread
+
+    Scores are otherwise loaded on their first access,
+    which makes the first blocks and queries after a restart slow.
+    A score which has been loaded in the meantime (or updated) is left as it is.
+    """
+
+    def __init__(self,
+                 context_factory: 'IconScoreContextFactory',
+                 deploy_storage: 'IconScoreDeployStorage',
+                 icon_score_mapper: 'IconScoreMapper') -> None:
+        """Constructor
+
+        :param context_factory:
+        :param deploy_storage: enumerates the active scores
+        :param icon_score_mapper: loaded scores are put into it
+        """
+        self._context_factory = context_factory
+        self._deploy_storage = deploy_storage
+        self._icon_score_mapper = icon_score_mapper
+        self._stop_event = Event()
+        self._thread: Optional['Thread'] = None
+        self._loaded_count = 0
+
+    @property
+    def loaded_count(self) -> int:
+        return self._loaded_count
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+
+        self._stop_event.clear()
+        self._thread = Thread(target=self.run, name='IconScoreWarmUp', daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stops warming up after the score being loaded
+        """
+        if self._thread is None:
+            return
+
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
+
+    def join(self) -> None:
+        if self._thread is not None:
+            self._thread.join()
+
+    def run(self) -> None:
+        context = self._context_factory.create(IconScoreContextType.QUERY)
+        context.step_counter = None
+
+        try:
+            self._push_context(context)
+            for deploy_info in self._deploy_storage.get_active_deploy_infos():
+                if self._stop_event.is_set():
+                    break
+                self._warm_up(deploy_info)
+        except BaseException as e:
+            Logger.warning(f'Failed to warm up scores: {e}', ICON_LOADER_LOG_TAG)
+        finally:
+            self._pop_context()
+            self._context_factory.destroy(context)
+
+        Logger.info(f'{self._loaded_count} scores are warmed up', ICON_LOADER_LOG_TAG)
+
+    def _warm_up(self, deploy_info: 'IconScoreDeployInfo') -> None:
+        address = deploy_info.score_address
+        if address in self._icon_score_mapper:
+            return
+
+        tx_hash = deploy_info.current_tx_hash
+        if tx_hash is None:
+            tx_hash = bytes(DEFAULT_BYTE_SIZE)
+
+        try:
+            score = self._icon_score_mapper.load_score(address, tx_hash)
+        except BaseException as e:
+            Logger.warning(f'Failed to warm up a score: {address} {e}', ICON_LOADER_LOG_TAG)
+            return
+
+        if self._icon_score_mapper.put_if_absent(address, IconScoreInfo(score, tx_hash)):
+            self._loaded_count += 1
@@ -14,10 +14,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import hashlib
 import importlib.util
-from os import walk
+import json
+import os
+import sys
+from os import walk, path
+from threading import local
 
+from iconcommons import Logger
 from ..base.exception import ServerErrorException
+from ..icon_constant import ICON_LOADER_LOG_TAG
 
 # cpython
 IMPORT_STAR = 84
@@ -39,25 +46,119 @@ WHITELIST_IMPORT = \
 
 BLACKLIST_RESERVED_KEYWORD = ['exec']
 
+# Bump it whenever the validation rules above change so that cached verdicts are discarded
+VALIDATOR_VERSION = 1
+
+VERDICT_FILE = '.validated'
+PYCACHE_DIR = '__pycache__'
+
 
 class ScorePackageValidator(object):
-    PREV_IMPORT_NAME = None
     PREV_LOAD_BUILD_CLASS = None
-    CUSTOM_IMPORT_LIST = []
+    # Validation state (prev_import_name, custom_import_list) of each thread.
+    # Packages are validated on both the invoke and validate threads without waiting for each other.
+    _state = local()
 
     @staticmethod
     def validator(pkg_root_path: str, pkg_import_root: str) -> callable:
-        ScorePackageValidator.PREV_IMPORT_NAME = None
+        state = ScorePackageValidator._state
+        state.prev_import_name = None
 
-        ScorePackageValidator.CUSTOM_IMPORT_LIST = ScorePackageValidator._make_custom_import_list(pkg_root_path)
+        state.custom_import_list = ScorePackageValidator._make_custom_import_list(pkg_root_path)
 
-        for imp in ScorePackageValidator.CUSTOM_IMPORT_LIST:
+        for imp in state.custom_import_list:
             full_name = ''.join((pkg_import_root, '.', imp))
             spec = importlib.util.find_spec(full_name)
             code = spec.loader.get_code(full_name)
-            ScorePackageValidator._validate_import_from_code(code)
-            ScorePackageValidator._validate_import_from_const(code.co_consts)
-            ScorePackageValidator._validate_blacklist_keyword_from_names(code.co_names)
+            ScorePackageValidator._validate_code(code)
+
+    @staticmethod
+    def validate_path(pkg_root_path: str) -> None:
+        """Validates a package which is not importable, compiling its files directly
+
+        :param pkg_root_path: package root directory
+        """
+        state = ScorePackageValidator._state
+        state.prev_import_name = None
+
+        state.custom_import_list = ScorePackageValidator._make_custom_import_list(pkg_root_path)
+
+        for imp in state.custom_import_list:
+            file_path = path.join(pkg_root_path, *imp.split('.')) + '.py'
+            with open(file_path, 'rb') as f:
+                code = compile(f.read(), file_path, 'exec', dont_inherit=True)
+            ScorePackageValidator._validate_code(code)
+
+    @staticmethod
+    def is_validated(pkg_root_path: str) -> bool:
+        """Returns whether the package passed validation
+        with the current validator and has not changed since
+
+        :param pkg_root_path: package root directory
+        """
+        try:
+            with open(path.join(pkg_root_path, VERDICT_FILE), 'r') as f:
+                verdict = json.load(f)
+        except (OSError, ValueError):
+            return False
+
+        return verdict == ScorePackageValidator._make_verdict(pkg_root_path)
+
+    @staticmethod
+    def save_verdict(pkg_root_path: str) -> None:
+        """Records that the package passed validation
+
+        The verdict is a cache, so a failure to write it is only logged.
+
+        :param pkg_root_path: package root directory
+        """
+        verdict_path = path.join(pkg_root_path, VERDICT_FILE)
+        tmp_path = f'{verdict_path}.tmp'
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump(ScorePackageValidator._make_verdict(pkg_root_path), f)
+            os.replace(tmp_path, verdict_path)
+        except OSError as e:
+            Logger.warning(f'Failed to save the validation verdict of {pkg_root_path}: {e}', ICON_LOADER_LOG_TAG)
+
+    @staticmethod
+    def _make_verdict(pkg_root_path: str) -> dict:
+        return {
+            'version': VALIDATOR_VERSION,
+            # bytecode differs between interpreters
+            'cacheTag': sys.implementation.cache_tag,
+            'treeHash': ScorePackageValidator._make_tree_hash(pkg_root_path)
+        }
+
+    @staticmethod
+    def _make_tree_hash(pkg_root_path: str) -> str:
+        """Hashes the relative paths and contents of the package files
+        except the verdict and the bytecode caches written by imports
+        """
+        tree_hash = hashlib.sha3_256()
+        for root_path, dirs, files in walk(pkg_root_path):
+            if PYCACHE_DIR in dirs:
+                dirs.remove(PYCACHE_DIR)
+            dirs.sort()
+
+            for file in sorted(files):
+                if root_path == pkg_root_path and file.startswith(VERDICT_FILE):
+                    continue
+                file_path = path.join(root_path, file)
+                tree_hash.update(path.relpath(file_path, pkg_root_path).encode())
+                tree_hash.update(b'\x00')
+                with open(file_path, 'rb') as f:
+                    data = f.read()
+                tree_hash.update(len(data).to_bytes(8, 'big'))
+                tree_hash.update(data)
+
+        return tree_hash.hexdigest()
+
+    @staticmethod
+    def _validate_code(code) -> None:
+        ScorePackageValidator._validate_import_from_code(code)
+        ScorePackageValidator._validate_import_from_const(code.co_consts)
+        ScorePackageValidator._validate_blacklist_keyword_from_names(code.co_names)
 
     @staticmethod
     def _make_custom_import_list(pkg_root_path: str) -> list:
@@ -110,31 +211,31 @@ class ScorePackageValidator(object):
 
         if key == IMPORT_NAME:
             import_name = co_names[value]
-            ScorePackageValidator.PREV_IMPORT_NAME = import_name
+            ScorePackageValidator._state.prev_import_name = import_name
             if import_name not in WHITELIST_IMPORT:
                 if not ScorePackageValidator._is_contain_custom_import(import_name):
                     raise ServerErrorException(f'invalid import '
                                                f'import_name: {import_name}')
         elif key == IMPORT_STAR:
-            if ScorePackageValidator.PREV_IMPORT_NAME not in WHITELIST_IMPORT:
-                if not ScorePackageValidator._is_contain_custom_import(ScorePackageValidator.PREV_IMPORT_NAME):
+            if ScorePackageValidator._state.prev_import_name not in WHITELIST_IMPORT:
+                if not ScorePackageValidator._is_contain_custom_import(ScorePackageValidator._state.prev_import_name):
                     raise ServerErrorException(f'invalid import '
-                                               f'import_name: {ScorePackageValidator.PREV_IMPORT_NAME}')
+                                               f'import_name: {ScorePackageValidator._state.prev_import_name}')
         elif key == IMPORT_FROM:
-            if ScorePackageValidator.PREV_IMPORT_NAME in WHITELIST_IMPORT:
-                from_list = WHITELIST_IMPORT[ScorePackageValidator.PREV_IMPORT_NAME]
+            if ScorePackageValidator._state.prev_import_name in WHITELIST_IMPORT:
+                from_list = WHITELIST_IMPORT[ScorePackageValidator._state.prev_import_name]
                 if co_names[value] not in from_list:
                     raise ServerErrorException(f'invalid import '
-                                               f'import_name: {ScorePackageValidator.PREV_IMPORT_NAME}')
-            elif ScorePackageValidator._is_contain_custom_import(ScorePackageValidator.PREV_IMPORT_NAME):
+                                               f'import_name: {ScorePackageValidator._state.prev_import_name}')
+            elif ScorePackageValidator._is_contain_custom_import(ScorePackageValidator._state.prev_import_name):
                 pass
             else:
                 raise ServerErrorException(f'invalid import '
-                                           f'import_name: {ScorePackageValidator.PREV_IMPORT_NAME}')
+                                           f'import_name: {ScorePackageValidator._state.prev_import_name}')
 
     @staticmethod
     def _is_contain_custom_import(import_name: str) -> bool:
-        for custom_import in ScorePackageValidator.CUSTOM_IMPORT_LIST:
+        for custom_import in ScorePackageValidator._state.custom_import_list:
             if import_name == custom_import:
                 return True
             else:
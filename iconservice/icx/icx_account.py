@@ -68,6 +68,7 @@ class Account(object):
     """Account class
     Contains information of the account indicated by address.
     """
+    __slots__ = ('_type', '_address', '_icx', '_locked', '_c_rep', '_installed')
 
     # leveldb account value structure (bigendian, 36 bytes)
     # version(1) | type(1) | flags(1) | reserved(1) |
@@ -14,6 +14,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from collections import OrderedDict
 from typing import TYPE_CHECKING, Optional
 
 from .icx_account import Account
@@ -22,12 +23,14 @@ from ..base.block import Block
 from ..icon_constant import DEFAULT_BYTE_SIZE, DATA_BYTE_ORDER
 
 if TYPE_CHECKING:
+    from ..database.batch import BlockBatch
     from ..database.db import ContextDatabase
     from ..iconscore.icon_score_context import IconScoreContext
 
 
 class IcxStorage(object):
     _LAST_BLOCK_KEY = b'last_block'
+    _SYNCED_BLOCK_KEY = b'synced_block'
 
     """Icx coin state manager embedding a state db wrapper
     """
@@ -39,6 +42,7 @@ class IcxStorage(object):
         """
         self._db = db
         self._last_block = None
+        self._synced_block = None
 
     @property
     def db(self) -> 'ContextDatabase':
@@ -52,16 +56,60 @@ class IcxStorage(object):
     def last_block(self) -> 'Block':
         return self._last_block
 
+    @property
+    def synced_block(self) -> Optional['Block']:
+        """The last block written with sync
+        """
+        return self._synced_block
+
     def load_last_block_info(self, context: Optional['IconScoreContext']) -> None:
+        block_bytes = self._db.get(context, self._SYNCED_BLOCK_KEY)
+        if block_bytes is not None:
+            self._synced_block = Block.from_bytes(block_bytes)
+
         block_bytes = self._db.get(context, self._LAST_BLOCK_KEY)
         if block_bytes is None:
             return
 
         self._last_block = Block.from_bytes(block_bytes)
 
-    def put_block_info(self, context: 'IconScoreContext', block: 'Block') -> None:
-        self._db.put(context, self._LAST_BLOCK_KEY, bytes(block))
+    def commit_block(self,
+                     context: 'IconScoreContext',
+                     block_batch: 'BlockBatch',
+                     sync: bool = True) -> None:
+        """Writes the states changed by a block and the block info in one atomic write
+
+        :param context:
+        :param block_batch: the states changed by block_batch.block
+        :param sync: whether to wait for the write to be flushed to the disk.
+            On write-behind, the blocks pending before are flushed as well,
+            and the failure of any of them is raised here
+        """
+        block = block_batch.block
+        # The only copy of block_batch, which write_batch takes over
+        states = OrderedDict(block_batch)
+        states[self._LAST_BLOCK_KEY] = bytes(block)
+        if sync:
+            states[self._SYNCED_BLOCK_KEY] = states[self._LAST_BLOCK_KEY]
+
+        self._db.write_batch(context, states, sync=sync)
         self._last_block = block
+        if sync:
+            self._synced_block = block
+
+    def sync_block_info(self, context: 'IconScoreContext') -> None:
+        """Writes the last block info again with sync
+        so that the blocks written without sync before are flushed to the disk as well
+
+        :param context:
+        """
+        if self._last_block is None:
+            return
+
+        block_bytes = bytes(self._last_block)
+        states = {self._LAST_BLOCK_KEY: block_bytes, self._SYNCED_BLOCK_KEY: block_bytes}
+        self._db.write_batch(context, states, sync=True)
+        self._synced_block = self._last_block
 
     def get_text(self, context: 'IconScoreContext', name: str) -> Optional[str]:
         """Return text format value from db
@@ -21,34 +21,93 @@ from .base.block import Block
 from .base.exception import ServerErrorException
 from .database.batch import BlockBatch
 from .iconscore.icon_score_mapper import IconScoreMapper
+from .utils import sha3_256
 
 
 class PrecommitData(object):
     def __init__(self,
                  block_batch: 'BlockBatch',
                  block_result: list,
-                 score_mapper: Optional['IconScoreMapper']=None):
+                 score_mapper: Optional['IconScoreMapper']=None,
+                 tx_digest: Optional[bytes]=None):
         """
 
         :param block_batch: changed states for a block
         :param block_result: tx_results made from transactions in a block
         :param score_mapper: newly deployed scores in a block
+        :param tx_digest: digest of the transactions in a block
         """
         self.block_batch = block_batch
         self.block_result = block_result
         self.score_mapper = score_mapper
         self.block = block_batch.block
+        self.tx_digest = tx_digest
+        self.state_root_hash: bytes = block_batch.digest()
+
+    def is_invoked_from(self, block: 'Block', tx_digest: bytes) -> bool:
+        """Returns whether it has been made from the same block and transactions
+
+        :param block: block to invoke
+        :param tx_digest: digest of the transactions to invoke
+        """
+        return self.tx_digest == tx_digest and \
+            self.block.hash == block.hash and \
+            self.block.height == block.height and \
+            self.block.prev_hash == block.prev_hash and \
+            self.block.timestamp == block.timestamp
+
+    def detach(self) -> None:
+        """Stops reading the states and the scores of the parent block
+        after the parent block has been committed
+        """
+        self.block_batch.prev_block_batch = None
+        if self.score_mapper is not None:
+            self.score_mapper.prev_mapper = None
 
 
 class PrecommitDataManager(object):
-    """Manages multiple precommit data made from next candidate block
+    """Manages multiple precommit data made from next candidate blocks
 
+    A block can be invoked on top of a precommitted block as well as the last block.
+    The precommit data make a tree whose root is the last block.
     """
 
     def __init__(self):
         self._lock = Lock()
         self._precommit_data_mapper = {}
         self._last_block: 'Block' = None
+        # The number of the invokes answered with the precommit data made before
+        self._reused_count = 0
+
+    @property
+    def reused_count(self) -> int:
+        return self._reused_count
+
+    @staticmethod
+    def make_tx_digest(tx_requests: list) -> bytes:
+        """Makes the digest of the transactions in a block with their hashes
+
+        :param tx_requests: transactions in a block
+        """
+        return sha3_256(b'|'.join(tx_request['params']['txHash'] for tx_request in tx_requests))
+
+    def get_invoked(self, block: 'Block', tx_digest: bytes) -> Optional['PrecommitData']:
+        """Returns the precommit data made from the same block and transactions
+        so that they are not invoked again
+
+        :param block: block to invoke
+        :param tx_digest: digest of the transactions to invoke
+        """
+        precommit_data = self._precommit_data_mapper.get(block.hash)
+        if precommit_data is None or not precommit_data.is_invoked_from(block, tx_digest):
+            return None
+
+        return precommit_data
+
+    def count_reused(self) -> None:
+        """Counts an invoke answered with the precommit data made before
+        """
+        self._reused_count += 1
 
     @property
     def last_block(self) -> 'Block':
@@ -73,16 +132,70 @@ class PrecommitDataManager(object):
         precommit_data = self._precommit_data_mapper.get(block_hash)
         return precommit_data
 
-    def commit(self, block: 'Block'):
+    def get_newest(self) -> Optional['PrecommitData']:
+        """Returns the precommit data of the highest block.
+        The latest invoked one is returned among the blocks at the same height
+
+        It can be called while a block is being committed or rolled back on another thread.
+        """
+        newest = None
+        for precommit_data in list(self._precommit_data_mapper.values()):
+            if newest is None or precommit_data.block.height >= newest.block.height:
+                newest = precommit_data
+
+        return newest
+
+    def get_parent(self, block: 'Block') -> Optional['PrecommitData']:
+        """Returns the precommit data of the parent block if it has not been committed yet
+
+        :param block: block to invoke
+        """
+        return self._precommit_data_mapper.get(block.prev_hash)
+
+    def commit(self, block: 'Block') -> list:
+        """Sets the last block and keeps only the precommit data which descend from it
+
+        :param block: committed block
+        :return: precommit data of the blocks which do not descend from the committed block
+        """
         with self._lock:
             self._last_block = block
 
-        # Clear remaining precommit data which have the same block height
-        self._precommit_data_mapper.clear()
+        descendants: set = self._get_descendants(block.hash)
+        discarded = []
+        for block_hash, precommit_data in list(self._precommit_data_mapper.items()):
+            if block_hash in descendants:
+                if precommit_data.block.prev_hash == block.hash:
+                    precommit_data.detach()
+            else:
+                del self._precommit_data_mapper[block_hash]
+                if block_hash != block.hash:
+                    discarded.append(precommit_data)
+
+        return discarded
+
+    def rollback(self, block: 'Block') -> list:
+        """Removes the precommit data of a block and its descendants
+
+        :param block: block to roll back
+        :return: precommit data removed
+        """
+        block_hashes: set = self._get_descendants(block.hash)
+        block_hashes.add(block.hash)
 
-    def rollback(self, block: 'Block'):
-        if block.hash in self._precommit_data_mapper:
-            del self._precommit_data_mapper[block.hash]
+        return [self._precommit_data_mapper.pop(block_hash) for block_hash in block_hashes
+                if block_hash in self._precommit_data_mapper]
+
+    def _get_descendants(self, block_hash: bytes) -> set:
+        descendants = set()
+        parents = {block_hash}
+        while parents:
+            children = {child_hash for child_hash, precommit_data in self._precommit_data_mapper.items()
+                        if precommit_data.block.prev_hash in parents and child_hash not in descendants}
+            descendants.update(children)
+            parents = children
+
+        return descendants
 
     def empty(self) -> bool:
         return len(self._precommit_data_mapper) == 0
@@ -92,10 +205,13 @@ class PrecommitDataManager(object):
 
         :param block: block to invoke
         """
-        if self._last_block is None:
+        parent = self.get_parent(block)
+        if parent is not None:
+            if block.height == parent.block.height + 1:
+                return
+        elif self._last_block is None:
             return
-
-        if block.prev_hash == self._last_block.hash and \
+        elif block.prev_hash == self._last_block.hash and \
                 block.height == self._last_block.height + 1:
             return
 
@@ -104,6 +220,19 @@ class PrecommitDataManager(object):
             f'last_block({self._last_block}) '
             f'block_to_invoke({block})')
 
+    def validate_block_to_rollback(self, block: 'Block'):
+        """Check if the block to roll back has been precommitted
+
+        Unlike commit, a block can be rolled back before its parent is committed
+
+        :param block: block to roll back
+        """
+        assert isinstance(block, Block)
+
+        if block.hash not in self._precommit_data_mapper:
+            raise ServerErrorException(
+                f'No precommit data: precommit_block({block})')
+
     def validate_precommit_block(self, precommit_block: 'Block'):
         """Check block validation
         before write_precommit_state() or remove_precommit_state()
@@ -36,6 +36,9 @@ def byte_length_of_int(n: int):
     return (n.bit_length() + 8) // 8
 
 
+_LOWERCASE_HEX_STRING_PATTERN = re.compile('[0-9a-f]+')
+
+
 def is_lowercase_hex_string(value: str) -> bool:
     """Check whether value is hexadecimal format or not
 
@@ -44,8 +47,7 @@ def is_lowercase_hex_string(value: str) -> bool:
     """
 
     try:
-        result = re.match('[0-9a-f]+', value)
-        return len(result.group(0)) == len(value)
+        return _LOWERCASE_HEX_STRING_PATTERN.fullmatch(value) is not None
     except:
         pass
 
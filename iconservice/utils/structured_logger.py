@@ -0,0 +1,280 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Structured logging for hot paths
+
+A record is an event name with keyword fields.
+Nothing is done for a record whose level is disabled for its tag.
+Enabled records are summarized (long strings and bytes truncated, long lists and dicts cut)
+and formatted into a string by a background writer thread.
+"""
+
+import logging
+import time
+from queue import Queue, Full
+from threading import Thread, Lock
+from typing import Any, Optional, Hashable
+
+from iconcommons.logger import Logger
+from iconcommons.logger.logger import icon_logger
+
+DEFAULT_MAX_FIELD_LENGTH = 256
+DEFAULT_MAX_ITEMS = 32
+DEFAULT_MAX_DEPTH = 8
+DEFAULT_QUEUE_SIZE = 10000
+DEFAULT_FAILURE_SAMPLE_INTERVAL = 60
+
+_LOG_TAG = 'StructuredLogger'
+
+_LOG_FUNCTIONS = {
+    logging.DEBUG: Logger.debug,
+    logging.INFO: Logger.info,
+    logging.WARNING: Logger.warning,
+    logging.ERROR: Logger.error,
+    logging.CRITICAL: Logger.error
+}
+
+
+def summarize(value: Any,
+              max_length: int = DEFAULT_MAX_FIELD_LENGTH,
+              max_items: int = DEFAULT_MAX_ITEMS,
+              max_depth: int = DEFAULT_MAX_DEPTH) -> Any:
+    """Returns a copy of value which is small enough to be logged
+
+    :param value: a log field
+    :param max_length: strings and bytes longer than this are truncated
+    :param max_items: lists and dicts longer than this are cut
+    :param max_depth: containers nested deeper than this are replaced with '...'
+    :return: summarized value
+    """
+    if isinstance(value, (str, bytes)):
+        if len(value) > max_length:
+            return f'{value[:max_length]}...({len(value)})'
+        return value
+
+    if isinstance(value, dict):
+        if max_depth <= 0:
+            return '{...}'
+        summary = {}
+        for i, (k, v) in enumerate(value.items()):
+            if i >= max_items:
+                summary['...'] = f'({len(value)} items)'
+                break
+            summary[k] = summarize(v, max_length, max_items, max_depth - 1)
+        return summary
+
+    if isinstance(value, (list, tuple)):
+        if max_depth <= 0:
+            return '[...]'
+        summary = [summarize(v, max_length, max_items, max_depth - 1) for v in value[:max_items]]
+        if len(value) > max_items:
+            summary.append(f'...({len(value)} items)')
+        return summary
+
+    return value
+
+
+def _level_from_name(name: Any) -> Optional[int]:
+    """Returns the level of a name like 'info'
+
+    :param name: level name or level
+    :return: None if it is not a known level
+    """
+    if isinstance(name, int):
+        return name
+
+    # getLevelName() returns 'Level <name>' for an unknown name
+    level = logging.getLevelName(str(name).upper())
+    if not isinstance(level, int):
+        Logger.warning(f'Unknown log level is ignored: {name}', _LOG_TAG)
+        return None
+    return level
+
+
+class StructuredLogger(object):
+    """Level-gated logger whose records are formatted and written on a background thread
+
+    Until start() is called, records are written on the caller's thread.
+    """
+
+    def __init__(self) -> None:
+        self._tag_levels = {}
+        self._max_length = DEFAULT_MAX_FIELD_LENGTH
+        self._max_items = DEFAULT_MAX_ITEMS
+        self._queue: Optional['Queue'] = None
+        self._thread: Optional['Thread'] = None
+        self._dropped = 0
+        # Records are logged on the invoke, query and validate threads
+        self._dropped_lock = Lock()
+
+    def load_config(self, config: dict) -> None:
+        """Applies the structured logging options of the log config
+
+        :param config: conf['log']
+        """
+        tag_levels = {}
+        for tag, name in config.get('tagLevels', {}).items():
+            level = _level_from_name(name)
+            if level is not None:
+                tag_levels[tag] = level
+        self._tag_levels = tag_levels
+        self._max_length = config.get('maxFieldLength', DEFAULT_MAX_FIELD_LENGTH)
+        self._max_items = config.get('maxItems', DEFAULT_MAX_ITEMS)
+
+    def set_level(self, tag: str, level: Any) -> None:
+        level = _level_from_name(level)
+        if level is not None:
+            self._tag_levels[tag] = level
+
+    def is_enabled_for(self, level: int, tag: str) -> bool:
+        tag_level = self._tag_levels.get(tag)
+        if tag_level is not None and level < tag_level:
+            return False
+        return icon_logger.isEnabledFor(level)
+
+    def start(self, queue_size: int = DEFAULT_QUEUE_SIZE) -> None:
+        if self._thread is not None:
+            return
+
+        self._queue = Queue(queue_size)
+        self._thread = Thread(target=self._run, name='StructuredLogWriter', daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Writes all queued records and stops the writer thread
+        """
+        if self._thread is None:
+            return
+
+        self._queue.put(None)
+        self._thread.join()
+        self._thread = None
+        self._queue = None
+
+    def flush(self) -> None:
+        if self._queue is not None:
+            self._queue.join()
+
+    @property
+    def dropped(self) -> int:
+        """The number of records dropped because the writer queue was full
+        """
+        return self._dropped
+
+    def debug(self, tag: str, event: str, **fields) -> None:
+        self.log(logging.DEBUG, tag, event, **fields)
+
+    def info(self, tag: str, event: str, **fields) -> None:
+        self.log(logging.INFO, tag, event, **fields)
+
+    def warning(self, tag: str, event: str, **fields) -> None:
+        self.log(logging.WARNING, tag, event, **fields)
+
+    def error(self, tag: str, event: str, **fields) -> None:
+        self.log(logging.ERROR, tag, event, **fields)
+
+    def log(self, level: int, tag: str, event: str, **fields) -> None:
+        if not self.is_enabled_for(level, tag):
+            return
+
+        # Summarizing copies the fields so they can be formatted on another thread
+        for key, value in fields.items():
+            fields[key] = summarize(value, self._max_length, self._max_items)
+        record = (level, tag, event, fields)
+
+        if self._queue is None:
+            self._write(record)
+            return
+
+        try:
+            self._queue.put_nowait(record)
+        except Full:
+            with self._dropped_lock:
+                self._dropped += 1
+
+    def _run(self) -> None:
+        queue = self._queue
+        while True:
+            record = queue.get()
+            try:
+                if record is None:
+                    return
+                self._write(record)
+            except BaseException:
+                pass
+            finally:
+                queue.task_done()
+
+    @staticmethod
+    def _write(record: tuple) -> None:
+        level, tag, event, fields = record
+        if fields:
+            msg = f'{event}: ' + ', '.join(f'{key}={value}' for key, value in fields.items())
+        else:
+            msg = event
+        log_function = _LOG_FUNCTIONS.get(level, Logger.error)
+        log_function(msg, tag)
+
+
+class FailureSampler(object):
+    """Counts repeated identical failures so that only some of them are logged
+
+    The first occurrence of a failure is logged.
+    Repeats are suppressed until interval seconds have passed,
+    then the next one is logged together with the number of suppressed repeats.
+    """
+
+    def __init__(self,
+                 interval: float = DEFAULT_FAILURE_SAMPLE_INTERVAL,
+                 max_keys: int = 1024) -> None:
+        self._interval = interval
+        self._max_keys = max_keys
+        # key: [last logged time, occurrences since then]
+        self._failures = {}
+        self._lock = Lock()
+
+    def sample(self, key: Hashable) -> int:
+        """Records an occurrence of a failure
+
+        :param key: identifies identical failures
+        :return: 0 if the occurrence should not be logged
+            otherwise the number of occurrences it stands for
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._failures.get(key)
+            if entry is None:
+                if len(self._failures) >= self._max_keys:
+                    self._failures.clear()
+                self._failures[key] = [now, 0]
+                return 1
+
+            entry[1] += 1
+            if now - entry[0] < self._interval:
+                return 0
+
+            count = entry[1]
+            entry[0] = now
+            entry[1] = 0
+            return count
+
+    def clear(self) -> None:
+        with self._lock:
+            self._failures.clear()
+
+
+structured_logger = StructuredLogger()
+failure_sampler = FailureSampler()
@@ -18,7 +18,8 @@ import unittest
 
 from iconservice.base.address import Address, AddressPrefix, \
     ICON_EOA_ADDRESS_PREFIX, ICON_CONTRACT_ADDRESS_PREFIX, \
-    ZERO_SCORE_ADDRESS, GOVERNANCE_SCORE_ADDRESS, is_icon_address_valid, split_icon_address, MalformedAddress
+    ZERO_SCORE_ADDRESS, GOVERNANCE_SCORE_ADDRESS, is_icon_address_valid, split_icon_address, MalformedAddress, \
+    _AddressInternTable
 from iconservice.base.exception import ExceptionCode
 from tests import create_address
 
@@ -151,6 +152,38 @@ class TestAddress(unittest.TestCase):
         self.assertEqual(e.exception.code, ExceptionCode.INVALID_PARAMS)
         self.assertEqual(e.exception.message, "Invalid address")
 
+    def test_interned_address(self):
+        addr1 = create_address()
+        addr2 = Address.from_string_interned(str(addr1))
+        self.assertEqual(addr1, addr2)
+        self.assertIs(addr2, Address.from_string_interned(str(addr1)))
+
+        addr3 = create_address(prefix=1)
+        self.assertIs(Address.from_bytes(addr3.to_bytes()), Address.from_bytes(addr3.to_bytes()))
+        # Buffers other than bytes are not interned and fail as they did before interning
+        for buf in (bytearray(addr3.to_bytes()), memoryview(addr3.to_bytes())):
+            with self.assertRaises(BaseException) as e:
+                Address.from_bytes(buf)
+            self.assertEqual(e.exception.code, ExceptionCode.INVALID_PARAMS)
+
+        with self.assertRaises(BaseException) as e:
+            Address.from_string_interned("hx123456")
+        self.assertEqual(e.exception.code, ExceptionCode.INVALID_PARAMS)
+
+        # The intern table is bounded
+        table = _AddressInternTable(2)
+        for i in range(3):
+            address = Address.from_prefix_and_int(AddressPrefix.EOA, i)
+            table.put(str(address), address)
+        self.assertEqual(1, len(table))
+
+    def test_address_is_immutable(self):
+        addr = create_address(prefix=1)
+        with self.assertRaises(AttributeError):
+            addr.foo = 1
+        self.assertEqual(hash(addr), hash(b'\x01' + addr.body))
+        self.assertEqual(b'\x01' + addr.body, addr.to_bytes())
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -599,6 +599,23 @@ class TestTypeConverter(unittest.TestCase):
         self.assertEqual(version, params_params[ConstantKeys.VERSION])
         self.assertEqual(addr1, params_params[ConstantKeys.ADDRESS])
 
+    def test_query_convert_pending(self):
+        addr1 = create_address()
+
+        request = {
+            ConstantKeys.METHOD: "icx_getBalance",
+            ConstantKeys.PARAMS: {
+                ConstantKeys.ADDRESS: str(addr1),
+                ConstantKeys.PENDING: hex(1)
+            }
+        }
+
+        ret_params = TypeConverter.convert(request, ParamType.QUERY)
+
+        params_params = ret_params[ConstantKeys.PARAMS]
+        self.assertEqual(addr1, params_params[ConstantKeys.ADDRESS])
+        self.assertIs(True, params_params[ConstantKeys.PENDING])
+
     def test_query_convert_icx_get_total_supply(self):
         method = "icx_getTotalSupply"
         version = 3
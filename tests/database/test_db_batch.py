@@ -122,3 +122,24 @@ class TestBatch(unittest.TestCase):
         block_batch[key2] = b''
         hash2 = block_batch.digest()
         self.assertNotEqual(hash1, hash2)
+
+    def test_keys_in_range(self):
+        block_batch = self.block_batch
+        block_batch[b'a|2'] = b'value0'
+        block_batch[b'b|1'] = b'value1'
+        block_batch[b'a|1'] = None
+        self.assertEqual([b'a|1', b'a|2'], block_batch.keys_in_range(prefix=b'a|'))
+
+        # The keys added later are merged into the sorted ones
+        block_batch[b'a|0'] = b'value2'
+        block_batch[b'a|2'] = b'value3'
+        self.assertEqual([b'a|0', b'a|1', b'a|2'], block_batch.keys_in_range(prefix=b'a|'))
+        self.assertEqual([b'a|1', b'a|2'], block_batch.keys_in_range(start=b'a|1', stop=b'b|1'))
+        self.assertEqual([b'a|0', b'a|1', b'a|2', b'b|1'], block_batch.sorted_keys())
+
+        del block_batch[b'a|1']
+        block_batch[b'c|0'] = b'value4'
+        self.assertEqual([b'a|0', b'a|2', b'b|1', b'c|0'], block_batch.sorted_keys())
+
+        block_batch.clear()
+        self.assertEqual([], block_batch.keys_in_range(prefix=b'a|'))
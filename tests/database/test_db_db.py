@@ -17,6 +17,7 @@
 
 import os
 import unittest
+from unittest.mock import Mock, patch
 
 from iconservice.base.address import Address, AddressPrefix
 from iconservice.base.exception import DatabaseException
@@ -25,7 +26,7 @@ from iconservice.database.db import ContextDatabase
 from iconservice.database.db import IconScoreDatabase
 from iconservice.database.db import KeyValueDatabase
 from iconservice.icon_constant import DATA_BYTE_ORDER
-from iconservice.iconscore.icon_score_context import IconScoreContextFactory
+from iconservice.iconscore.icon_score_context import ContextContainer, IconScoreContextFactory
 from iconservice.iconscore.icon_score_context import IconScoreContextType
 from iconservice.iconscore.icon_score_context import IconScoreFuncType
 from tests import rmtree
@@ -66,6 +67,26 @@ class TestKeyValueDatabase(unittest.TestCase):
         self.assertEqual(b'value1', db.get(b'key1'))
         self.assertEqual(b'value0', db.get(b'key0'))
 
+    def test_write_batch_with_sync(self):
+        db = self.db
+        db.put(b'key1', b'value1')
+
+        db.write_batch({b'key0': b'value0', b'key1': None}, sync=True)
+
+        self.assertEqual(b'value0', db.get(b'key0'))
+        self.assertIsNone(db.get(b'key1'))
+
+    def test_write_batch_with_empty_value(self):
+        db = self.db
+        db.put(b'key1', b'value1')
+        states = {b'key0': b'value0', b'key1': b''}
+
+        db.write_batch(states)
+
+        self.assertIsNone(db.get(b'key1'))
+        # The falsy value is normalized in place instead of copying states
+        self.assertEqual({b'key0': b'value0', b'key1': None}, states)
+
 
 class TestContextDatabaseOnWriteMode(unittest.TestCase):
     def setUp(self):
@@ -189,6 +210,98 @@ class TestContextDatabaseOnWriteMode(unittest.TestCase):
         self.assertEqual(0, len(tx_batch))
         self.assertIsNone(db.get(context, b'key0'))
 
+    def test_iterator(self):
+        context = self.context
+        db = self.context_db
+        db.key_value_db.write_batch({b'a|0': b'0', b'a|2': b'2', b'a|4': b'4', b'b|0': b'0'})
+
+        context.block_batch[b'a|1'] = b'1'
+        context.block_batch[b'a|2'] = b'block2'
+        context.block_batch[b'a|5'] = b'5'
+        context.tx_batch[b'a|2'] = b'tx2'
+        context.tx_batch[b'a|4'] = None
+        context.tx_batch[b'a|6'] = b'6'
+        context.tx_batch[b'b|1'] = b'1'
+
+        expected = [(b'a|0', b'0'), (b'a|1', b'1'), (b'a|2', b'tx2'), (b'a|5', b'5'), (b'a|6', b'6')]
+        self.assertEqual(expected, list(db.iterator(context, b'a|')))
+
+        # states in the batches are not seen out of invoke
+        self.assertEqual([(b'a|0', b'0'), (b'a|2', b'2'), (b'a|4', b'4')], list(db.iterator(None, b'a|')))
+
+        # the batches can be changed during iteration
+        for key, _ in db.iterator(context, b'a|'):
+            db.delete(context, key)
+        self.assertEqual([], list(db.iterator(context, b'a|')))
+
+    def test_prev_block_batch(self):
+        context = self.context
+        db = self.context_db
+        db.key_value_db.write_batch({b'a|0': b'0', b'a|1': b'1', b'a|2': b'2'})
+
+        grandparent_batch = BlockBatch()
+        grandparent_batch[b'a|1'] = b'11'
+        grandparent_batch[b'a|3'] = b'3'
+        parent_batch = BlockBatch(prev_block_batch=grandparent_batch)
+        parent_batch[b'a|1'] = b'111'
+        parent_batch[b'a|2'] = None
+        context.block_batch = BlockBatch(prev_block_batch=parent_batch)
+        context.block_batch[b'a|3'] = b'33'
+
+        self.assertEqual(b'0', db.get(context, b'a|0'))
+        self.assertEqual(b'111', db.get(context, b'a|1'))
+        self.assertIsNone(db.get(context, b'a|2'))
+        self.assertEqual(b'33', db.get(context, b'a|3'))
+        self.assertEqual([(b'a|0', b'0'), (b'a|1', b'111'), (b'a|3', b'33')],
+                         list(db.iterator(context, b'a|')))
+
+    def test_read_cache(self):
+        context = self.context
+        db = self.context_db
+        db.key_value_db.put(b'key0', b'value0')
+
+        db.key_value_db.get = Mock(wraps=db.key_value_db.get)
+        self.assertEqual(b'value0', db.get(context, b'key0'))
+        self.assertIsNone(db.get(context, b'key1'))
+        self.assertEqual(b'value0', db.get(context, b'key0'))
+        self.assertIsNone(db.get(context, b'key1'))
+        self.assertEqual(2, db.key_value_db.get.call_count)
+
+        # the batches take precedence
+        db.put(context, b'key0', b'value1')
+        self.assertEqual(b'value1', db.get(context, b'key0'))
+        context.block_batch[b'key1'] = b'value1'
+        self.assertEqual(b'value1', db.get(context, b'key1'))
+
+        context.tx_batch.clear()
+        self.assertEqual({}, context.tx_batch.read_cache)
+
+    def test_iterator_range(self):
+        context = self.context
+        db = self.context_db
+        db.key_value_db.write_batch({b'a|0': b'0', b'a|1': b'1', b'a|2': b'2', b'a|3': b'3'})
+        context.tx_batch[b'a|1'] = None
+        context.tx_batch[b'a|2'] = b''
+
+        expected = [(b'a|0', b'0'), (b'a|2', b'')]
+        self.assertEqual(expected, list(db.iterator(context, start=b'a|0', stop=b'a|3')))
+
+    def test_is_changed_in_range(self):
+        context = self.context
+        db = self.context_db
+        self.assertFalse(db.is_changed_in_range(context, b'a|0', b'a|5'))
+
+        context.block_batch.prev_block_batch = BlockBatch()
+        context.block_batch.prev_block_batch[b'a|3'] = b'3'
+        self.assertTrue(db.is_changed_in_range(context, b'a|0', b'a|5'))
+        self.assertFalse(db.is_changed_in_range(context, b'a|4', b'a|5'))
+
+        context.tx_batch[b'a|4'] = None
+        self.assertTrue(db.is_changed_in_range(context, b'a|4', b'a|5'))
+
+        # the batches are not readable out of invoke
+        self.assertFalse(db.is_changed_in_range(None, b'a|0', b'a|5'))
+
     def test_delete_on_readonly_exception(self):
         context = self.context
         db = self.context_db
@@ -240,3 +353,78 @@ class TestIconScoreDatabase(unittest.TestCase):
 
         db.put(key, value.to_bytes(32, DATA_BYTE_ORDER))
         self.assertEqual(value.to_bytes(32, DATA_BYTE_ORDER), db.get(key))
+
+    def test_hash_key(self):
+        address = self.address.to_bytes()
+        self.assertEqual(address + b'||key', self.db._hash_key(b'key'))
+
+        sub_db = self.db.get_sub_db(b'a').get_sub_db(b'b')
+        self.assertEqual(address + b'||a|b|key', sub_db._hash_key(b'key'))
+        self.assertEqual(address + b'|key', IconScoreDatabase(self.address, self.db._context_db)._hash_key(b'key'))
+
+    def test_iterator(self):
+        db = self.db
+        sub_db = db.get_sub_db(b'sub')
+        sub_db.put(b'b', b'1')
+        sub_db.put(b'a', b'0')
+        sub_db.put(b'ca', b'2')
+        sub_db.put(b'cb', b'3')
+        db.get_sub_db(b'other').put(b'a', b'4')
+
+        self.assertEqual([(b'a', b'0'), (b'b', b'1'), (b'ca', b'2'), (b'cb', b'3')], list(sub_db.iterator()))
+        self.assertEqual([(b'ca', b'2'), (b'cb', b'3')], list(sub_db.iterator(b'c')))
+
+        # The keys which contain the separator are returned, as are the keys of the sub dbs
+        sub_db.put(b'b|a', b'6')
+        sub_db.get_sub_db(b'c').put(b'a', b'5')
+        self.assertEqual([(b'a', b'5')], list(sub_db.get_sub_db(b'c').iterator()))
+        self.assertEqual([(b'a', b'0'), (b'b', b'1'), (b'b|a', b'6'), (b'ca', b'2'), (b'cb', b'3'), (b'c|a', b'5')],
+                         list(sub_db.iterator()))
+
+    def test_declare_container(self):
+        db = self.db
+        sub_db = db.declare_container(b'a', 1)
+        self.assertEqual(sub_db._hash_key(b'key'), db.get_sub_db(b'a')._hash_key(b'key'))
+        db.declare_container(b'a', 1)
+        db.get_sub_db(b'sub').declare_container(b'a', 2)
+
+        with self.assertRaises(DatabaseException):
+            db.declare_container(b'a', 2)
+        # The containers declared on the sub dbs are checked as well
+        with self.assertRaises(DatabaseException):
+            db.get_sub_db(b'sub').declare_container(b'a|b', 1)
+        with self.assertRaises(DatabaseException):
+            db.declare_container(b'sub', 1)
+        db.declare_container(b'ab', 1)
+
+    def test_get_many(self):
+        db = self.db
+        db.put(b'a0', b'0')
+        db.put(b'a1', b'1')
+        db.put(b'a2', b'2')
+
+        context = self.context_factory.create(IconScoreContextType.INVOKE)
+        context.block_batch = BlockBatch()
+        context.tx_batch = TransactionBatch()
+        ContextContainer._push_context(context)
+        try:
+            self.assertEqual([b'0', b'1', None], list(db.get_many([b'a0', b'a1', b'a3'])))
+
+            # The values are read one by one if the range has been changed in the batches
+            db.put(b'a1', b'11')
+            with patch.object(db._context_db, 'get', wraps=db._context_db.get) as get:
+                self.assertEqual([b'0', b'11', None], list(db.get_many([b'a0', b'a1', b'a3'])))
+            self.assertEqual(3, get.call_count)
+
+            # A value read ahead is not returned if it is changed through another db before it is consumed
+            context.tx_batch = TransactionBatch()
+            other = IconScoreDatabase(self.address, context_db=db._context_db, prefix=b'')
+            values = db.get_many([b'a0', b'a1', b'a2', b'a3'])
+            self.assertEqual(b'0', next(values))
+            other.put(b'a2', b'22')
+            other.put(b'a3', b'3')
+            self.assertEqual([b'1', b'22', b'3'], list(values))
+        finally:
+            ContextContainer._pop_context()
+            self.context_factory.destroy(context)
+
@@ -81,3 +81,15 @@ class TestDatabaseObserver(unittest.TestCase):
         args, _ = self._observer.on_delete.call_args
         self.assertEqual(self.key_, args[1])
         self.assertEqual(self.last_value, args[2])
+
+    def test_iterator(self):
+        prefix = self._icon_score_database.address.to_bytes() + b'|'
+        self._icon_score_database._context_db.iterator = \
+            Mock(return_value=iter([(prefix + b'key1', b'value1'), (prefix + b'key2', b'value2')]))
+
+        items = list(self._icon_score_database.iterator())
+        self.assertEqual([(b'key1', b'value1'), (b'key2', b'value2')], items)
+        self.assertEqual(2, self._observer.on_get.call_count)
+        args, _ = self._observer.on_get.call_args
+        self.assertEqual(b'key2', args[1])
+        self.assertEqual(b'value2', args[2])
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+from unittest.mock import patch
+
+from iconservice.database.sync_policy import DatabaseSyncPolicy
+
+
+class TestDatabaseSyncPolicy(unittest.TestCase):
+    def test_sync_every_block(self):
+        policy = DatabaseSyncPolicy(interval_blocks=1)
+        for _ in range(3):
+            self.assertTrue(policy.is_sync_required())
+            policy.on_write(True)
+            self.assertEqual(0, policy.unsynced_blocks)
+
+    def test_sync_every_n_blocks(self):
+        policy = DatabaseSyncPolicy(interval_blocks=3)
+        syncs = []
+        for _ in range(6):
+            sync = policy.is_sync_required()
+            policy.on_write(sync)
+            syncs.append(sync)
+
+        self.assertEqual([False, False, True, False, False, True], syncs)
+
+    def test_sync_interval_ms(self):
+        with patch('iconservice.database.sync_policy.time.monotonic', return_value=100.0) as monotonic:
+            policy = DatabaseSyncPolicy(interval_blocks=0, interval_ms=500)
+            self.assertFalse(policy.is_sync_required())
+            policy.on_write(False)
+            self.assertEqual(1, policy.unsynced_blocks)
+
+            monotonic.return_value = 100.5
+            self.assertTrue(policy.is_sync_required())
+            policy.on_write(True)
+            self.assertEqual(0, policy.unsynced_blocks)
+            self.assertFalse(policy.is_sync_required())
+
+    def test_never_sync(self):
+        policy = DatabaseSyncPolicy()
+        for _ in range(3):
+            self.assertFalse(policy.is_sync_required())
+            policy.on_write(False)
+        self.assertEqual(3, policy.unsynced_blocks)
+
+    def test_unsynced_blocks_before(self):
+        policy = DatabaseSyncPolicy(interval_blocks=3, unsynced_blocks=2)
+        self.assertEqual(2, policy.unsynced_blocks)
+        self.assertTrue(policy.is_sync_required())
@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import unittest
+from threading import Event
+from unittest.mock import patch
+
+from iconservice.base.exception import DatabaseException
+from iconservice.database.db import KeyValueDatabase
+from iconservice.database.write_behind import BlockBatchWriter
+from tests import rmtree
+
+
+class TestBlockBatchWriter(unittest.TestCase):
+    def setUp(self):
+        self.written = []
+        self.resume = Event()
+        self.writer = BlockBatchWriter(self._write, max_queue_size=2)
+        self.writer.start()
+
+    def tearDown(self):
+        self.resume.set()
+        self.writer.stop()
+
+    def _write(self, states: dict, sync: bool):
+        self.resume.wait()
+        if b'error' in states:
+            raise IOError('disk error')
+        self.written.append((states, sync))
+
+    def test_lookup_pending_states(self):
+        self.writer.submit({b'key0': b'value0', b'key1': b'value1'})
+        self.writer.submit({b'key0': b'value2', b'key1': None}, sync=True)
+
+        self.assertEqual((True, b'value2'), self.writer.lookup(b'key0'))
+        self.assertEqual((True, None), self.writer.lookup(b'key1'))
+        self.assertEqual((False, None), self.writer.lookup(b'key2'))
+        self.assertEqual({b'key0': b'value2', b'key1': None}, self.writer.pending_states())
+        self.assertEqual({b'key1': None}, self.writer.pending_states(prefix=b'key1'))
+        self.assertEqual({b'key0': b'value2'}, self.writer.pending_states(start=b'key', stop=b'key1'))
+        self.assertEqual(2, self.writer.queue_depth)
+
+        self.resume.set()
+        self.writer.flush()
+
+        self.assertEqual(0, self.writer.queue_depth)
+        self.assertEqual((False, None), self.writer.lookup(b'key0'))
+        self.assertEqual([({b'key0': b'value0', b'key1': b'value1'}, False),
+                          ({b'key0': b'value2', b'key1': None}, True)], self.written)
+        self.assertEqual(2, self.writer.metrics['writtenCount'])
+
+    def test_write_error(self):
+        self.writer.submit({b'error': b''})
+        self.writer.submit({b'key0': b'value0'})
+        self.resume.set()
+
+        with self.assertRaises(DatabaseException):
+            self.writer.flush()
+        with self.assertRaises(DatabaseException):
+            self.writer.submit({b'key1': b'value1'})
+
+        # Nothing is written after the failure and the pending states are still visible
+        self.assertEqual([], self.written)
+        self.assertEqual((True, b'value0'), self.writer.lookup(b'key0'))
+
+
+class TestKeyValueDatabaseWriteBehind(unittest.TestCase):
+    def setUp(self):
+        self.state_db_root_path = 'state_db'
+        rmtree(self.state_db_root_path)
+        os.mkdir(self.state_db_root_path)
+
+        self.db = KeyValueDatabase.from_path(self.state_db_root_path, True)
+        self.db.write_batch({b'a|0': b'0', b'a|1': b'1', b'a|2': b'2'})
+        self.db.start_write_behind(max_queue_size=4)
+
+    def tearDown(self):
+        self.db.close()
+        rmtree(self.state_db_root_path)
+
+    def test_read_your_writes(self):
+        db = self.db
+        db.write_batch({b'a|1': b'', b'a|3': b'3'})
+        db.put(b'a|4', b'4')
+        db.delete(b'a|0')
+
+        self.assertIsNone(db.get(b'a|0'))
+        self.assertIsNone(db.get(b'a|1'))
+        self.assertEqual(b'3', db.get(b'a|3'))
+        self.assertEqual([(b'a|2', b'2'), (b'a|3', b'3'), (b'a|4', b'4')],
+                         list(db.iterator(prefix=b'a|')))
+
+        db.writer.flush()
+        self.assertEqual([(b'a|2', b'2'), (b'a|3', b'3'), (b'a|4', b'4')],
+                         list(db.iterator(prefix=b'a|')))
+
+    def test_close(self):
+        self.db.put(b'a|3', b'3')
+        self.db.close()
+
+        self.db = KeyValueDatabase.from_path(self.state_db_root_path, True)
+        self.assertEqual(b'3', self.db.get(b'a|3'))
+        self.assertIsNone(self.db.writer)
+
+    def test_sync_write_batch_flushes_pending_states(self):
+        db = self.db
+        db.write_batch({b'a|3': b'3'})
+        db.write_batch({b'a|4': b'4'}, sync=True)
+        self.assertEqual(0, db.writer.queue_depth)
+        self.assertEqual(2, db.writer.metrics['writtenCount'])
+
+    def test_sync_write_batch_raises_write_error(self):
+        db = self.db
+        db.stop_write_behind()
+        with patch.object(db, '_write_states', side_effect=IOError('disk error')):
+            db.start_write_behind(max_queue_size=4)
+            db.write_batch({b'a|3': b'3'})
+            with self.assertRaises(DatabaseException):
+                db.write_batch({b'a|4': b'4'}, sync=True)
+            with self.assertRaises(DatabaseException):
+                db.stop_write_behind()
+
+        self.assertEqual(b'0', db.get(b'a|0'))
+        self.assertIsNone(db.get(b'a|3'))
@@ -15,12 +15,14 @@
 # limitations under the License.
 
 import unittest
+from unittest.mock import Mock
 
 from iconservice import Address
-from iconservice.database.db import ContextDatabase, IconScoreDatabase
+from iconservice.database.batch import BlockBatch, TransactionBatch
+from iconservice.database.db import ContextDatabase, IconScoreDatabase, DatabaseObserver
 from iconservice.iconscore.icon_score_context import IconScoreContextType
 from iconservice.base.address import AddressPrefix
-from iconservice.base.exception import ContainerDBException
+from iconservice.base.exception import ContainerDBException, DatabaseException
 from iconservice.iconscore.icon_container_db import ContainerUtil, DictDB, ArrayDB, VarDB
 from iconservice.iconscore.icon_score_context import ContextContainer, IconScoreContextFactory
 from tests import create_address
@@ -123,6 +125,54 @@ class TestIconContainerDB(unittest.TestCase):
         self.assertEqual(test_dict['a'][addr1], 1)
         self.assertEqual(test_dict['a'][addr2], 2)
 
+    def test_dict_db_keys_and_items(self):
+        test_dict = DictDB('test_dict', self.db, value_type=int, key_type=str)
+        test_dict['b'] = 2
+        test_dict['a'] = 1
+        test_dict['c'] = 3
+        del test_dict['c']
+        DictDB('test_dict2', self.db, value_type=int)['a'] = 4
+
+        self.assertEqual(['a', 'b'], list(test_dict.keys()))
+        self.assertEqual([('a', 1), ('b', 2)], list(test_dict.items()))
+
+        # The name of a dict can't be reused at another depth or as the start of another name
+        with self.assertRaises(DatabaseException):
+            DictDB('test_dict', self.db, value_type=int, depth=2)
+        with self.assertRaises(DatabaseException):
+            DictDB('test_dict|a', self.db, value_type=int)
+        self.assertEqual([('a', 1), ('b', 2)], list(test_dict.items()))
+
+        test_dict3 = DictDB('test_dict3', self.db, value_type=int, depth=2)
+        with self.assertRaises(ContainerDBException):
+            test_dict3.items()
+        test_dict3['a']['x'] = 5
+        self.assertEqual([(b'x', 5)], list(test_dict3['a'].items()))
+
+    def test_dict_db_items_with_separator_in_key(self):
+        int_dict = DictDB('int_dict', self.db, value_type=int, key_type=int)
+        int_dict[1] = 1
+        int_dict[5] = 5
+        self.assertEqual([(1, 1), (5, 5)], list(int_dict.items()))
+
+        # 124 and 0x7c00 are encoded with b'|'
+        int_dict[124] = 124
+        int_dict[0x7c00] = 0x7c00
+        self.assertEqual([(1, 1), (5, 5), (124, 124), (0x7c00, 0x7c00)], list(int_dict.items()))
+
+        str_dict = DictDB('str_dict', self.db, value_type=int, key_type=str)
+        str_dict['a|b'] = 1
+        str_dict['a'] = 2
+        self.assertEqual(['a', 'a|b'], list(str_dict.keys()))
+
+        address = Address(AddressPrefix.EOA, b'|' * 20)
+        self.assertIn(b'|', address.to_bytes())
+        address_dict = DictDB('address_dict', self.db, value_type=int, key_type=Address)
+        address_dict[address] = 1
+        address_dict[create_address()] = 2
+        self.assertIn((address, 1), list(address_dict.items()))
+        self.assertEqual(2, len(list(address_dict.items())))
+
     def test_success_dict_depth2(self):
         name = 'test_dict'
         test_dict = DictDB(name, self.db, depth=3, value_type=int)
@@ -137,6 +187,19 @@ class TestIconContainerDB(unittest.TestCase):
 
         self.assertEqual(test_dict['a']['b']['c'], 1)
 
+    def test_dict_db_nested_views(self):
+        test_dict = DictDB('test_dict', self.db, depth=3, value_type=int)
+        test_dict['a'][b'b']['c'] = 1
+
+        self.assertIs(test_dict['a'], test_dict[b'a'])
+        self.assertIs(test_dict['a']['b'], test_dict['a'][b'b'])
+        self.assertEqual(1, test_dict['a']['b']['c'])
+        self.assertEqual(1, DictDB('test_dict', self.db, depth=3, value_type=int)['a']['b']['c'])
+
+        for i in range(DictDB.MAX_CACHED_VIEWS + 1):
+            self.assertEqual(0, test_dict[f'key{i}']['b']['c'])
+        self.assertEqual(1, test_dict['a']['b']['c'])
+
     def test_success_array1(self):
         test_array = ArrayDB('test_array', self.db, value_type=int)
 
@@ -226,6 +289,70 @@ class TestIconContainerDB(unittest.TestCase):
         self.assertEqual(5, testarray.pop())
         self.assertEqual(2, len(testarray))
 
+    def test_array_db_bulk_read(self):
+        observer = Mock(spec=DatabaseObserver)
+        self.db.set_observer(observer)
+        test_array = ArrayDB('test_array', self.db, value_type=int)
+        size = ArrayDB.BULK_READ_SIZE * 2 + 10
+        for i in range(size):
+            test_array.put(i * 2)
+
+        observer.reset_mock()
+        self.assertEqual([test_array[i] for i in range(size)], [i * 2 for i in range(size)])
+        expected_calls = observer.on_get.call_args_list
+
+        # iteration reads in bulk but charges the same gets
+        observer.reset_mock()
+        self.assertEqual([i * 2 for i in range(size)], list(test_array))
+        self.assertEqual(expected_calls, observer.on_get.call_args_list)
+
+        # only the elements up to the found one are charged
+        observer.reset_mock()
+        self.assertTrue(200 in test_array)
+        self.assertEqual(expected_calls[:101], observer.on_get.call_args_list)
+        self.assertFalse(1 in test_array)
+
+    def test_array_db_write_during_iteration(self):
+        test_array = ArrayDB('test_array', self.db, value_type=int)
+        for i in range(5):
+            test_array.put(i)
+
+        values = []
+        for value in test_array:
+            values.append(value)
+            if value == 1:
+                test_array[2] = 20
+                test_array.put(5)
+        self.assertEqual([0, 1, 20, 3, 4, 5], values)
+
+    def test_array_db_write_through_another_array_during_iteration(self):
+        def iterate(test_array: 'ArrayDB', other: 'ArrayDB') -> list:
+            values = []
+            for value in test_array:
+                values.append(value)
+                if value == 1:
+                    other[3] = 99
+            return values
+
+        test_array = ArrayDB('test_array', self.db, value_type=int)
+        for i in range(5):
+            test_array.put(i)
+        other = ArrayDB('test_array', self.db, value_type=int)
+        self.assertEqual([0, 1, 2, 99, 4], iterate(test_array, other))
+        test_array[3] = 3
+
+        # The values read ahead on invoke are looked up in the batches before they are returned
+        context = self._factory.create(IconScoreContextType.INVOKE)
+        context.block_batch = BlockBatch()
+        context.tx_batch = TransactionBatch()
+        ContextContainer._push_context(context)
+        try:
+            test_array = ArrayDB('test_array', self.db, value_type=int)
+            other = ArrayDB('test_array', self.db, value_type=int)
+            self.assertEqual([0, 1, 2, 99, 4], iterate(test_array, other))
+        finally:
+            ContextContainer._pop_context()
+
     def test_container_util(self):
         prefix: bytes = ContainerUtil.create_db_prefix(ArrayDB, 'a')
         self.assertEqual(b'\x00|a', prefix)
@@ -24,6 +24,7 @@ from iconservice.deploy.icon_score_deploy_storage import IconScoreDeployStorage
 from iconservice.deploy.icon_score_manager import IconScoreManager
 from iconservice.icon_constant import MAX_DATA_SIZE, FIXED_FEE
 from iconservice.iconscore.icon_pre_validator import IconPreValidator
+from iconservice.iconscore.icon_score_step import DataSize, get_data_size
 from iconservice.icx.icx_engine import IcxEngine
 from tests import create_address
 
@@ -100,18 +101,19 @@ class TestTransactionValidator(unittest.TestCase):
         self.validator._check_from_can_charge_fee_v3.assert_called_once()
 
     def test_check_data_size(self):
-        self.validator._get_character_length = Mock()
         self.validator._check_data_size({})
 
-        self.validator._get_character_length = Mock(return_value=MAX_DATA_SIZE - 1)
-        self.validator._check_data_size({"data": ANY})
+        self.validator._check_data_size({"data": ANY}, DataSize(MAX_DATA_SIZE - 1, 0, 0))
 
-        self.validator._get_character_length = Mock(return_value=MAX_DATA_SIZE + 1)
         with self.assertRaises(InvalidRequestException) as e:
-            self.validator._check_data_size({"data": ANY})
+            self.validator._check_data_size({"data": ANY}, DataSize(MAX_DATA_SIZE + 1, 0, 0))
         self.assertEqual(e.exception.code, ExceptionCode.INVALID_REQUEST)
         self.assertEqual(e.exception.message, "The data field is too big")
 
+        # data_size is computed if not given
+        with self.assertRaises(InvalidRequestException):
+            self.validator._check_data_size({"data": {"content": "a" * MAX_DATA_SIZE}})
+
     def test_get_character_length(self):
         KEYS = [f"key{i}" for i in range(8)]
         VALUES = [f"value{i}" for i in range(9)]
@@ -138,7 +140,7 @@ class TestTransactionValidator(unittest.TestCase):
         for value in VALUES:
             data_len += len(value)
 
-        ret = self.validator._get_character_length(data)
+        ret = get_data_size(data).character_length
         self.assertEqual(data_len, ret)
 
     def test_check_from_can_charge_fee_v2(self):
@@ -164,7 +166,7 @@ class TestTransactionValidator(unittest.TestCase):
         _from = create_address()
         params = {"fee": fee, "from": _from}
         self.validator._check_from_can_charge_fee_v2(params)
-        self.validator._check_balance.assert_called_once_with(_from, 0, fee)
+        self.validator._check_balance.assert_called_once_with(_from, 0, fee, None)
 
         self.validator._check_balance.reset_mock()
         fee = FIXED_FEE
@@ -172,7 +174,7 @@ class TestTransactionValidator(unittest.TestCase):
         value = 12345
         params = {"fee": fee, "from": _from, "value": value}
         self.validator._check_from_can_charge_fee_v2(params)
-        self.validator._check_balance.assert_called_once_with(_from, value, fee)
+        self.validator._check_balance.assert_called_once_with(_from, value, fee, None)
 
     def test_validate_transaction_v2(self):
         self.validator._check_from_can_charge_fee_v2 = Mock()
@@ -272,7 +274,7 @@ class TestTransactionValidator(unittest.TestCase):
         _from = create_address()
         params = {'from': _from}
         self.validator._check_from_can_charge_fee_v3(params, step_price)
-        self.validator._check_balance.assert_called_once_with(_from, 0, 0)
+        self.validator._check_balance.assert_called_once_with(_from, 0, 0, None)
 
         self.validator._check_balance.reset_mock()
         _from = create_address()
@@ -281,7 +283,7 @@ class TestTransactionValidator(unittest.TestCase):
         fee = step_limit * step_price
         params = {'from': _from, 'value': value, 'stepLimit': step_limit}
         self.validator._check_from_can_charge_fee_v3(params, step_price)
-        self.validator._check_balance.assert_called_once_with(_from, value, fee)
+        self.validator._check_balance.assert_called_once_with(_from, value, fee, None)
 
     def test_validate_call_transaction(self):
         self.validator._is_inactive_score = Mock()
@@ -20,13 +20,14 @@ import shutil
 import unittest
 
 from iconservice.base.address import AddressPrefix, MalformedAddress
+from iconservice.base.block import Block
 from iconservice.database.batch import BlockBatch, TransactionBatch
 from iconservice.database.db import ContextDatabase
 from iconservice.iconscore.icon_score_context import IconScoreContextFactory
 from iconservice.iconscore.icon_score_context import IconScoreContextType
 from iconservice.icx.icx_account import Account
 from iconservice.icx.icx_storage import IcxStorage
-from tests import create_address
+from tests import create_address, create_block_hash
 
 
 class TestIcxStorage(unittest.TestCase):
@@ -77,6 +78,42 @@ class TestIcxStorage(unittest.TestCase):
         self.assertFalse(ret)
 
 
+    def test_commit_block(self):
+        context = self.context
+        block = Block(block_height=1, block_hash=create_block_hash(), timestamp=0, prev_hash=None)
+        block_batch = BlockBatch(block)
+        block_batch[b'key0'] = b'value0'
+        block_batch[b'key1'] = None
+        self.storage.db.key_value_db.put(b'key1', b'value1')
+
+        self.storage.commit_block(context, block_batch, sync=False)
+
+        self.assertEqual(bytes(block), bytes(self.storage.last_block))
+        self.assertIsNone(self.storage.synced_block)
+        self.assertEqual(b'value0', self.storage.db.get(context, b'key0'))
+        self.assertIsNone(self.storage.db.get(context, b'key1'))
+        # The block info is not written in block_batch
+        self.assertEqual(2, len(block_batch))
+
+        self.storage._last_block = None
+        self.storage.load_last_block_info(context)
+        self.assertEqual(bytes(block), bytes(self.storage.last_block))
+
+        self.assertIsNone(self.storage.synced_block)
+
+        self.storage.sync_block_info(context)
+        self.storage._synced_block = None
+        self.storage.load_last_block_info(context)
+        self.assertEqual(bytes(block), bytes(self.storage.last_block))
+        self.assertEqual(bytes(block), bytes(self.storage.synced_block))
+
+        block2 = Block(block_height=2, block_hash=create_block_hash(), timestamp=1, prev_hash=block.hash)
+        self.storage.commit_block(context, BlockBatch(block2), sync=True)
+        self.storage._synced_block = None
+        self.storage.load_last_block_info(context)
+        self.assertEqual(bytes(block2), bytes(self.storage.synced_block))
+
+
 class TestIcxStorageForMalformedAddress(unittest.TestCase):
     def setUp(self):
         empty_address = MalformedAddress.from_string('')
@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Invoke of a block on top of a precommitted block
+"""
+
+import unittest
+from unittest.mock import patch
+
+from iconservice.base.address import ZERO_SCORE_ADDRESS
+from iconservice.base.block import Block
+from iconservice.base.exception import ExceptionCode
+from tests import create_block_hash
+from tests.integrate_test import create_timestamp
+from tests.integrate_test.test_integrate_base import TestIntegrateBase
+
+
+class TestIntegrateChainedInvoke(TestIntegrateBase):
+
+    def _invoke_child(self, parent: 'Block', tx_list: list) -> tuple:
+        block = Block(parent.height + 1, create_block_hash(), create_timestamp(), parent.hash)
+        tx_results, _ = self.icon_service_engine.invoke(block, tx_list)
+        return block, tx_results
+
+    def _get_balance(self, address) -> int:
+        return self._query({"address": address}, 'icx_getBalance')
+
+    def test_invoke_on_precommitted_block(self):
+        value1 = 3 * self._icx_factor
+        tx1 = self._make_icx_send_tx(self._genesis, self._addr_array[0], value1)
+        block1, tx_results = self._make_and_req_block([tx1])
+        self.assertEqual(tx_results[0].status, int(True))
+
+        # addr_array[0] receives icx in block1 which is not committed yet
+        value2 = 2 * self._icx_factor
+        tx2 = self._make_icx_send_tx(self._addr_array[0], self._addr_array[1], value2, disable_pre_validate=True)
+        block2, tx_results = self._invoke_child(block1, [tx2])
+        self.assertEqual(tx_results[0].status, int(True))
+        self.assertEqual(0, self._get_balance(self._addr_array[0]))
+
+        self._write_precommit_state(block1)
+        self.assertEqual(value1, self._get_balance(self._addr_array[0]))
+        self.assertIsNotNone(self.icon_service_engine._precommit_data_manager.get(block2.hash))
+
+        self._write_precommit_state(block2)
+        self.assertEqual(value1 - value2, self._get_balance(self._addr_array[0]))
+        self.assertEqual(value2, self._get_balance(self._addr_array[1]))
+
+    def test_commit_drops_siblings(self):
+        value = 1 * self._icx_factor
+        tx1 = self._make_icx_send_tx(self._genesis, self._addr_array[0], value)
+        block1, _ = self._make_and_req_block([tx1])
+
+        tx2 = self._make_icx_send_tx(self._genesis, self._addr_array[1], value)
+        block2, _ = self._invoke_child(block1, [tx2])
+        tx3 = self._make_icx_send_tx(self._genesis, self._addr_array[2], value)
+        sibling2, _ = self._invoke_child(block1, [tx3])
+        tx4 = self._make_icx_send_tx(self._genesis, self._addr_array[3], value)
+        sibling3, _ = self._invoke_child(sibling2, [tx4])
+
+        precommit_data_manager = self.icon_service_engine._precommit_data_manager
+        self._write_precommit_state(block1)
+        self._write_precommit_state(block2)
+
+        self.assertIsNone(precommit_data_manager.get(sibling2.hash))
+        self.assertIsNone(precommit_data_manager.get(sibling3.hash))
+        self.assertTrue(precommit_data_manager.empty())
+
+        self.assertEqual(value, self._get_balance(self._addr_array[1]))
+        self.assertEqual(0, self._get_balance(self._addr_array[2]))
+        self.assertEqual(0, self._get_balance(self._addr_array[3]))
+
+    def test_rollback_with_descendants(self):
+        value = 1 * self._icx_factor
+        tx1 = self._make_icx_send_tx(self._genesis, self._addr_array[0], value)
+        block1, _ = self._make_and_req_block([tx1])
+        tx2 = self._make_icx_send_tx(self._genesis, self._addr_array[1], value)
+        block2, _ = self._invoke_child(block1, [tx2])
+
+        self._remove_precommit_state(block1)
+
+        precommit_data_manager = self.icon_service_engine._precommit_data_manager
+        self.assertTrue(precommit_data_manager.empty())
+
+        with self.assertRaises(BaseException) as e:
+            self._write_precommit_state(block2)
+        self.assertEqual(e.exception.code, ExceptionCode.SERVER_ERROR)
+
+    def test_commit_child_before_parent(self):
+        value = 1 * self._icx_factor
+        tx1 = self._make_icx_send_tx(self._genesis, self._addr_array[0], value)
+        block1, _ = self._make_and_req_block([tx1])
+        tx2 = self._make_icx_send_tx(self._genesis, self._addr_array[1], value)
+        block2, _ = self._invoke_child(block1, [tx2])
+
+        with self.assertRaises(BaseException) as e:
+            self._write_precommit_state(block2)
+        self.assertEqual(e.exception.code, ExceptionCode.SERVER_ERROR)
+        self.assertIn("Invalid precommit block", e.exception.message)
+
+    def test_call_score_deployed_in_precommitted_block(self):
+        value1 = 1 * self._icx_factor
+        tx1 = self._make_deploy_tx("test_deploy_scores",
+                                   "install/test_score",
+                                   self._addr_array[0],
+                                   ZERO_SCORE_ADDRESS,
+                                   deploy_params={'value': hex(value1)})
+        block1, tx_results = self._make_and_req_block([tx1])
+        self.assertEqual(tx_results[0].status, int(True))
+        score_addr1 = tx_results[0].score_address
+
+        # The score is not deployed in StateDB yet
+        value2 = 2 * self._icx_factor
+        with patch.object(self.icon_service_engine, 'validate_transaction'):
+            tx2 = self._make_score_call_tx(self._addr_array[0],
+                                           score_addr1,
+                                           'set_value',
+                                           {"value": hex(value2)})
+        block2, tx_results = self._invoke_child(block1, [tx2])
+        self.assertEqual(tx_results[0].status, int(True))
+
+        self._write_precommit_state(block1)
+        self._write_precommit_state(block2)
+
+        query_request = {
+            "version": self._version,
+            "from": self._admin,
+            "to": score_addr1,
+            "dataType": "call",
+            "data": {
+                "method": "get_value",
+                "params": {}
+            }
+        }
+        self.assertEqual(value2, self._query(query_request))
+
+
+if __name__ == '__main__':
+    unittest.main()
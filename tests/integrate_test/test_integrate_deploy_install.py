@@ -17,11 +17,17 @@
 """IconScoreEngine testcase
 """
 
+import os
 import unittest
+from copy import deepcopy
+from unittest.mock import patch
 
 from iconservice.base.address import ZERO_SCORE_ADDRESS
 from iconservice.base.exception import ExceptionCode
-from tests import raise_exception_start_tag, raise_exception_end_tag
+from iconservice.icon_constant import ConfigKey
+from iconservice.icon_service_engine import IconServiceEngine
+from iconservice.iconscore.icon_score_step import StepType, get_data_size
+from tests import raise_exception_start_tag, raise_exception_end_tag, create_tx_hash
 from tests.integrate_test.test_integrate_base import TestIntegrateBase
 
 
@@ -69,6 +75,98 @@ class TestIntegrateDeployInstall(TestIntegrateBase):
         response = self._query(query_request)
         self.assertEqual(response, value2)
 
+    def test_score_staged_on_validate(self):
+        value1 = 1 * self._icx_factor
+        tx1 = self._make_deploy_tx("test_deploy_scores",
+                                   "install/test_score",
+                                   self._addr_array[0],
+                                   ZERO_SCORE_ADDRESS,
+                                   deploy_params={'value': hex(value1)})
+
+        staging = self.icon_service_engine._icon_score_package_staging
+        staged_paths = os.listdir(staging.staging_path)
+        self.assertEqual(1, len(staged_paths))
+
+        # The staged package is installed instead of extracting the zip again
+        with patch('iconservice.deploy.icon_score_deployer.IconScoreDeployer.deploy') as deploy:
+            prev_block, tx_results = self._make_and_req_block([tx1])
+            deploy.assert_not_called()
+        self._write_precommit_state(prev_block)
+
+        self.assertEqual(tx_results[0].status, int(True))
+        self.assertEqual([], os.listdir(staging.staging_path))
+
+        query_request = {
+            "version": self._version,
+            "from": self._admin,
+            "to": tx_results[0].score_address,
+            "dataType": "call",
+            "data": {
+                "method": "get_value",
+                "params": {}
+            }
+        }
+        self.assertEqual(value1, self._query(query_request))
+
+    def test_score_staged_if_step_limit_covers_deploy(self):
+        tx1 = self._make_deploy_tx("test_deploy_scores",
+                                   "install/test_score",
+                                   self._addr_array[0],
+                                   ZERO_SCORE_ADDRESS,
+                                   deploy_params={'value': hex(1 * self._icx_factor)})
+        staging = self.icon_service_engine._icon_score_package_staging
+        self.assertFalse(staging.is_stageable(tx1['params']['txHash']))
+
+        step_counter_factory = self.icon_service_engine._step_counter_factory
+        data_size = get_data_size(tx1['params']['data'])
+        deploy_step = step_counter_factory.get_step_cost(StepType.DEFAULT) + \
+            step_counter_factory.get_step_cost(StepType.INPUT) * data_size.byte_length + \
+            step_counter_factory.get_step_cost(StepType.CONTRACT_CREATE) + \
+            step_counter_factory.get_step_cost(StepType.CONTRACT_SET) * data_size.content_byte_length
+
+        # The package is not staged for a deploy which would run out of step on invoke
+        for step_limit, staged in ((deploy_step - 1, False), (deploy_step, True)):
+            tx2 = deepcopy(tx1)
+            tx2['params']['txHash'] = create_tx_hash()
+            tx2['params']['stepLimit'] = step_limit
+            self.icon_service_engine.validate_transaction(tx2)
+            self.assertEqual(staged, not staging.is_stageable(tx2['params']['txHash']))
+
+    def test_score_warm_up_on_open(self):
+        value1 = 1 * self._icx_factor
+        tx1 = self._make_deploy_tx("test_deploy_scores",
+                                   "install/test_score",
+                                   self._addr_array[0],
+                                   ZERO_SCORE_ADDRESS,
+                                   deploy_params={'value': hex(value1)})
+
+        prev_block, tx_results = self._make_and_req_block([tx1])
+        self._write_precommit_state(prev_block)
+        self.assertEqual(tx_results[0].status, int(True))
+        score_addr1 = tx_results[0].score_address
+
+        conf = self.icon_service_engine._conf
+        conf.update_conf({ConfigKey.SCORE_WARM_UP: True})
+        self.icon_service_engine.close()
+        self.icon_service_engine = IconServiceEngine()
+        self.icon_service_engine.open(conf)
+        self.icon_service_engine._icon_score_warm_up.join()
+
+        icon_score_info = self.icon_service_engine._icon_score_mapper.get(score_addr1)
+        self.assertEqual(tx1['params']['txHash'], icon_score_info.tx_hash)
+
+        query_request = {
+            "version": self._version,
+            "from": self._admin,
+            "to": score_addr1,
+            "dataType": "call",
+            "data": {
+                "method": "get_value",
+                "params": {}
+            }
+        }
+        self.assertEqual(value1, self._query(query_request))
+
     def test_score_address_already_in_use(self):
         timestamp = 1
         value1 = 1 * self._icx_factor
@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Queries on the states of the newest precommitted block
+"""
+
+import unittest
+from threading import Timer
+from unittest.mock import patch
+
+from iconservice.base.address import ZERO_SCORE_ADDRESS
+from iconservice.base.block import Block
+from iconservice.base.exception import ExceptionCode
+from tests import create_block_hash
+from tests.integrate_test import create_timestamp
+from tests.integrate_test.test_integrate_base import TestIntegrateBase
+
+
+class TestIntegratePendingQuery(TestIntegrateBase):
+
+    def _get_balance(self, address, pending: bool = False) -> int:
+        return self._query({"address": address, "pending": pending}, 'icx_getBalance')
+
+    def test_get_balance(self):
+        value1 = 3 * self._icx_factor
+        tx1 = self._make_icx_send_tx(self._genesis, self._addr_array[0], value1)
+        block1, tx_results = self._make_and_req_block([tx1])
+        self.assertEqual(int(True), tx_results[0].status)
+
+        self.assertEqual(0, self._get_balance(self._addr_array[0]))
+        self.assertEqual(value1, self._get_balance(self._addr_array[0], pending=True))
+
+        # The newest one is read on top of its uncommitted parent
+        value2 = 1 * self._icx_factor
+        tx2 = self._make_icx_send_tx(self._addr_array[0], self._addr_array[1], value2, disable_pre_validate=True)
+        block2 = Block(block1.height + 1, create_block_hash(), create_timestamp(), block1.hash)
+        self.icon_service_engine.invoke(block2, [tx2])
+
+        self.assertEqual(value1 - value2, self._get_balance(self._addr_array[0], pending=True))
+        self.assertEqual(value2, self._get_balance(self._addr_array[1], pending=True))
+
+        self._write_precommit_state(block1)
+        self.assertEqual(value1, self._get_balance(self._addr_array[0]))
+        self.assertEqual(value1 - value2, self._get_balance(self._addr_array[0], pending=True))
+
+        self._remove_precommit_state(block2)
+        self.assertEqual(value1, self._get_balance(self._addr_array[0], pending=True))
+        self.assertEqual(0, self._get_balance(self._addr_array[1], pending=True))
+
+    def test_call_score_deployed_in_precommitted_block(self):
+        value = 1 * self._icx_factor
+        tx1 = self._make_deploy_tx("test_deploy_scores",
+                                   "install/test_score",
+                                   self._addr_array[0],
+                                   ZERO_SCORE_ADDRESS,
+                                   deploy_params={'value': hex(value)})
+        _, tx_results = self._make_and_req_block([tx1])
+        self.assertEqual(int(True), tx_results[0].status)
+        score_addr1 = tx_results[0].score_address
+
+        query_request = {
+            "version": self._version,
+            "from": self._admin,
+            "to": score_addr1,
+            "dataType": "call",
+            "data": {
+                "method": "get_value",
+                "params": {}
+            },
+            "pending": True
+        }
+        self.assertEqual(value, self._query(query_request))
+
+        query_request['pending'] = False
+        with self.assertRaises(BaseException):
+            self._query(query_request)
+
+    def test_query_again_after_commit(self):
+        value = 3 * self._icx_factor
+        tx = self._make_icx_send_tx(self._genesis, self._addr_array[0], value)
+        self._make_and_req_block([tx])
+
+        engine = self.icon_service_engine
+        query = engine._query
+        calls = []
+
+        def query_during_commit(*args):
+            calls.append(args)
+            if len(calls) == 1:
+                # As if a block were committed while the query is made
+                engine._state_version += 2
+            return query(*args)
+
+        with patch.object(engine, '_query', side_effect=query_during_commit):
+            self.assertEqual(value, self._get_balance(self._addr_array[0], pending=True))
+        self.assertEqual(2, len(calls))
+
+        def query_during_commits(*args):
+            engine._state_version += 2
+            return query(*args)
+
+        with patch.object(engine, '_query', side_effect=query_during_commits):
+            with self.assertRaises(BaseException) as e:
+                self._get_balance(self._addr_array[0], pending=True)
+        self.assertEqual(ExceptionCode.SERVER_ERROR, e.exception.code)
+
+    def test_query_during_commit(self):
+        value = 3 * self._icx_factor
+        tx = self._make_icx_send_tx(self._genesis, self._addr_array[0], value)
+        self._make_and_req_block([tx])
+
+        engine = self.icon_service_engine
+        # As if a block were being written to StateDB
+        engine._state_version += 1
+
+        # The query waits for the block being written
+        timer = Timer(0.02, self._finish_commit)
+        timer.start()
+        try:
+            self.assertEqual(value, self._get_balance(self._addr_array[0], pending=True))
+        finally:
+            timer.join()
+
+        # Waiting is counted as a retry
+        engine._PENDING_QUERY_WAIT_TIMEOUT = 0.01
+        engine._state_version += 1
+        with patch.object(engine, '_query') as query:
+            with self.assertRaises(BaseException) as e:
+                self._get_balance(self._addr_array[0], pending=True)
+        self.assertEqual(ExceptionCode.SERVER_ERROR, e.exception.code)
+        query.assert_not_called()
+        self._finish_commit()
+
+    def _finish_commit(self):
+        engine = self.icon_service_engine
+        with engine._state_condition:
+            engine._state_version += 1
+            engine._state_condition.notify_all()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -21,6 +21,7 @@ import unittest
 
 from iconservice.base.address import MalformedAddress
 from iconservice.base.exception import ExceptionCode
+from iconservice.icon_constant import ConfigKey
 from tests.integrate_test.test_integrate_base import TestIntegrateBase
 
 
@@ -168,5 +169,34 @@ class TestIntegrateSimpleInvoke(TestIntegrateBase):
         self.assertEqual(response, value1)
 
 
+class TestIntegrateSimpleInvokeWriteBehind(TestIntegrateSimpleInvoke):
+    """Runs the same tests with committed blocks written on a writer thread
+    """
+
+    def _make_init_config(self) -> dict:
+        return {ConfigKey.DB_WRITE_BEHIND_QUEUE_SIZE: 2}
+
+    def test_db_writer_status(self):
+        value = 3 * self._icx_factor
+        for i in range(3):
+            tx = self._make_icx_send_tx(self._genesis, self._addr_array[i], value)
+            prev_block, tx_results = self._make_and_req_block([tx])
+            self._write_precommit_state(prev_block)
+            self.assertEqual(tx_results[0].status, int(True))
+
+        # The states committed are read whether they are written or not
+        for i in range(3):
+            response = self._query({"address": self._addr_array[i]}, 'icx_getBalance')
+            self.assertEqual(response, value)
+
+        response = self._query({}, 'ise_getStatus')
+        self.assertEqual(response['lastBlock']['blockHeight'], 3)
+        db_writer = response['dbWriter']
+        self.assertLessEqual(db_writer['queueDepth'], 2)
+        self.assertIn('writtenCount', db_writer)
+        self.assertIn('lastWriteLatencyMs', db_writer)
+        self.assertIn('maxWriteLatencyMs', db_writer)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -40,8 +40,10 @@ class MockPlyvelDB(object):
     def get_sub_db(self, key: bytes):
         return MockPlyvelDB(self.make_db())
 
-    def iterator(self) -> iter:
-        return iter(self._db)
+    def iterator(self, prefix: bytes = None, start: bytes = None, stop: bytes = None, *args, **kwargs) -> iter:
+        prefix = prefix or b''
+        return ((key, self._db[key]) for key in sorted(self._db)
+                if key.startswith(prefix) and (start is None or key >= start) and (stop is None or key < stop))
 
     def prefixed_db(self, bytes_prefix) -> 'MockPlyvelDB':
         return MockPlyvelDB(MockPlyvelDB.make_db())
@@ -14,11 +14,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import io
 import os
 import unittest
+import zipfile
 
 from iconservice.base.address import AddressPrefix
-from iconservice.base.exception import ExceptionCode
+from iconservice.base.exception import ExceptionCode, ScoreInstallExtractException
 from iconservice.deploy.icon_score_deployer import IconScoreDeployer
 from tests import create_address, create_tx_hash
 
@@ -48,8 +50,8 @@ class TestIconScoreDeployer(unittest.TestCase):
         self.deployer.deploy(self.address, self.read_zipfile_as_byte(self.archive_path), tx_hash1)
         converted_tx_hash = f'0x{bytes.hex(tx_hash1)}'
         install_path = os.path.join(self.score_root_path, converted_tx_hash)
-        zip_file_info_gen = self.deployer._extract_files_gen(self.read_zipfile_as_byte(self.archive_path))
-        file_path_list = [name for name, info, parent_dir in zip_file_info_gen]
+        with zipfile.ZipFile(io.BytesIO(self.read_zipfile_as_byte(self.archive_path))) as memory_zip:
+            file_path_list = [file_path for _, file_path, _ in self.deployer._get_entries(memory_zip)]
 
         installed_contents = []
         for directory, dirs, filename in os.walk(install_path):
@@ -61,7 +63,7 @@ class TestIconScoreDeployer(unittest.TestCase):
                 else:
                     installed_contents.append(f'{parent_dir_name}/{file}')
         self.assertEqual(True, os.path.exists(install_path))
-        self.assertTrue(installed_contents.sort() == file_path_list.sort())
+        self.assertEqual(sorted(file_path_list), sorted(installed_contents))
 
         # Case when the user install SCORE second time.
         with self.assertRaises(BaseException) as e:
@@ -98,6 +100,47 @@ class TestIconScoreDeployer(unittest.TestCase):
         self.deployer.remove_existing_score(install_path)
         self.assertFalse(os.path.exists(install_path))
 
+    @staticmethod
+    def make_zip(files: dict) -> bytes:
+        buf = io.BytesIO()
+        with zipfile.ZipFile(buf, 'w', zipfile.ZIP_DEFLATED) as zip_file:
+            for name, contents in files.items():
+                zip_file.writestr(name, contents)
+        return buf.getvalue()
+
+    def test_extract_in_chunks(self):
+        files = {'score/package.json': b'{}',
+                 'score/__init__.py': b'',
+                 'score/a/b/big.py': os.urandom(IconScoreDeployer.CHUNK_SIZE * 3 + 1),
+                 'score/a/c.py': b'c'}
+        tx_hash = create_tx_hash()
+        self.deployer.deploy(self.address, self.make_zip(files), tx_hash)
+
+        install_path = os.path.join(self.score_root_path, f'0x{bytes.hex(tx_hash)}')
+        for name, contents in files.items():
+            with open(os.path.join(install_path, name[len('score/'):]), 'rb') as f:
+                self.assertEqual(contents, f.read())
+
+    def test_size_limits(self):
+        # 4MB of zeros is compressed to a few KB
+        data = self.make_zip({'score/__init__.py': b'', 'score/bomb.py': bytes(4 * 1024 * 1024)})
+        self.assertLess(len(data), 64 * 1024)
+
+        deployers = [IconScoreDeployer('./', max_file_size=1024 * 1024),
+                     IconScoreDeployer('./', max_package_size=1024 * 1024)]
+        for deployer in deployers:
+            tx_hash = create_tx_hash()
+            with self.assertRaises(ScoreInstallExtractException) as e:
+                deployer.deploy(self.address, data, tx_hash)
+            self.assertEqual(e.exception.code, ExceptionCode.INVALID_PARAMS)
+            self.assertFalse(os.path.exists(os.path.join(self.score_root_path, f'0x{bytes.hex(tx_hash)}')))
+
+        # The size declared in the zip is not trusted
+        deployer = IconScoreDeployer('./', max_file_size=1024 * 1024)
+        deployer._check_declared_sizes = lambda entries: None
+        with self.assertRaises(ScoreInstallExtractException):
+            deployer.deploy(self.address, data, create_tx_hash())
+
     def tearDown(self):
         IconScoreDeployer.remove_existing_score(self.score_root_path)
 
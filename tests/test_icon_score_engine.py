@@ -114,14 +114,8 @@ class TestIconScoreEngine(unittest.TestCase):
 
     @staticmethod
     def __unpack_zip_file(install_path: str, data: bytes):
-        file_info_generator = IconScoreDeployer._extract_files_gen(data)
-        for name, file_info, parent_directory in file_info_generator:
-            if not os.path.exists(os.path.join(install_path, parent_directory)):
-                os.makedirs(os.path.join(install_path, parent_directory))
-            with file_info as file_info_context,\
-                    open(os.path.join(install_path, name), 'wb') as dest:
-                contents = file_info_context.read()
-                dest.write(contents)
+        os.makedirs(install_path, exist_ok=True)
+        IconScoreDeployer(install_path).extract(data, install_path)
         return True
 
     @staticmethod
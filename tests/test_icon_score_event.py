@@ -39,7 +39,7 @@ class TestEventlog(unittest.TestCase):
     def setUp(self):
         address = Address.from_data(AddressPrefix.CONTRACT, b'address')
         db = Mock(spec=IconScoreDatabase)
-        db.attach_mock(address, 'address')
+        db.address = address
         context = IconScoreContext()
         event_logs = Mock(spec=list)
         traces = Mock(spec=list)
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import importlib
+import os
+import sys
+import tempfile
+import unittest
+from shutil import rmtree
+
+from iconservice.base.address import AddressPrefix
+from iconservice.iconscore.icon_score_importer import install_score_finder
+from tests import create_address, create_tx_hash
+
+
+class TestIconScoreImporter(unittest.TestCase):
+
+    def setUp(self):
+        self.score_root_path = tempfile.mkdtemp()
+        install_score_finder(self.score_root_path)
+        self.address = create_address(AddressPrefix.CONTRACT)
+
+    def tearDown(self):
+        rmtree(self.score_root_path)
+
+    def _make_package(self, value: int) -> str:
+        tx_hash = f'0x{create_tx_hash().hex()}'
+        package_path = os.path.join(self.score_root_path, self.address.to_bytes().hex(), tx_hash)
+        os.makedirs(os.path.join(package_path, 'sub'))
+        with open(os.path.join(package_path, '__init__.py'), 'w') as f:
+            f.write('')
+        with open(os.path.join(package_path, 'score.py'), 'w') as f:
+            f.write(f'from .sub.util import value\nVALUE = value + {value}\n')
+        with open(os.path.join(package_path, 'sub', 'util.py'), 'w') as f:
+            f.write('value = 100\n')
+        return f'{self.address.to_bytes().hex()}.{tx_hash}'
+
+    def test_import(self):
+        pkg_root_import = self._make_package(1)
+        mod = importlib.import_module('.score', pkg_root_import)
+        self.assertEqual(101, mod.VALUE)
+        self.assertNotIn(self.score_root_path, sys.path)
+        if not sys.dont_write_bytecode:
+            self.assertTrue(os.path.isdir(os.path.join(os.path.dirname(mod.__file__), '__pycache__')))
+
+        # a package added after the address package was imported is found without invalidating caches
+        pkg_root_import = self._make_package(2)
+        mod = importlib.import_module('.score', pkg_root_import)
+        self.assertEqual(102, mod.VALUE)
+
+    def test_not_found(self):
+        self._make_package(1)
+        with self.assertRaises(ImportError):
+            importlib.import_module(f'.score', f'{self.address.to_bytes().hex()}.0x{create_tx_hash().hex()}')
+
+
+if __name__ == '__main__':
+    unittest.main()
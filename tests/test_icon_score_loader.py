@@ -15,8 +15,12 @@
 # limitations under the License.
 
 
+import gc
 import inspect
+import sys
+import tempfile
 import unittest
+import weakref
 from os import path, makedirs, symlink
 from time import sleep
 
@@ -27,6 +31,7 @@ from iconservice.iconscore.icon_score_base import IconScoreBase
 from iconservice.iconscore.icon_score_context import ContextContainer, \
     IconScoreContextFactory, IconScoreContextType
 from iconservice.iconscore.icon_score_context import IconScoreContext
+from iconservice.base.address import AddressPrefix
 from iconservice.iconscore.icon_score_loader import IconScoreLoader
 from tests import create_address, create_tx_hash, rmtree
 
@@ -96,3 +101,78 @@ class TestIconScoreLoader(unittest.TestCase):
         loader = IconScoreLoader(score_root_path, 0)
         import_name: str = loader._make_pkg_root_import(score_path)
         self.assertEqual(import_name, expected_import_name)
+
+
+class TestIconScoreLoaderUnload(unittest.TestCase):
+
+    def setUp(self):
+        self._score_root_path = tempfile.mkdtemp()
+        self._loader = IconScoreLoader(self._score_root_path, 0)
+        self._address = create_address(AddressPrefix.CONTRACT)
+
+    def tearDown(self):
+        rmtree(self._score_root_path)
+
+    def _install(self, score_file: str = None) -> bytes:
+        tx_hash = create_tx_hash()
+        score_path = self._loader.make_score_path(self._address, tx_hash)
+        makedirs(score_path)
+        files = {
+            '__init__.py': '',
+            'package.json': '{"main_file": "score", "main_score": "Score"}',
+            'score.py': 'from .util import VALUE\n\n\nclass Score(object):\n    value = VALUE\n',
+            'util.py': 'VALUE = 1\n'
+        }
+        if score_file is not None:
+            files['score.py'] = score_file
+        for name, data in files.items():
+            with open(path.join(score_path, name), 'w') as f:
+                f.write(data)
+        return tx_hash
+
+    def _get_score_modules(self) -> list:
+        return [name for name in sys.modules if name.startswith(self._address.to_bytes().hex())]
+
+    def test_unload_score(self):
+        tx_hash1 = self._install()
+        tx_hash2 = self._install()
+        self._loader.load_score(self._loader.make_score_path(self._address, tx_hash1))
+        self._loader.load_score(self._loader.make_score_path(self._address, tx_hash2))
+        self.assertEqual(7, len(self._get_score_modules()))
+
+        self._loader.unload_score(self._address, tx_hash1)
+        address_module = sys.modules[self._address.to_bytes().hex()]
+        self.assertFalse(hasattr(address_module, f'0x{tx_hash1.hex()}'))
+        self.assertEqual(4, len(self._get_score_modules()))
+        self.assertEqual(1, len(self._loader.loaded_packages))
+
+        self._loader.unload_score(self._address)
+        self.assertEqual([], self._get_score_modules())
+        self.assertEqual(set(), self._loader.loaded_packages)
+
+    def test_failed_load(self):
+        score_path = self._loader.make_score_path(self._address, self._install('from .util import VALUE\nraise ValueError\n'))
+        with self.assertRaises(ValueError):
+            self._loader.load_score(score_path)
+
+        self.assertEqual(set(), self._loader.loaded_packages)
+        self.assertEqual([], self._get_score_modules())
+
+    def test_update_cycles(self):
+        score_class = self._loader.load_score(self._loader.make_score_path(self._address, self._install()))
+        score_class_ref = weakref.ref(score_class)
+        del score_class
+        modules_count = len(sys.modules)
+
+        prev_tx_hash = None
+        for _ in range(50):
+            tx_hash = self._install()
+            self._loader.load_score(self._loader.make_score_path(self._address, tx_hash))
+            if prev_tx_hash is not None:
+                self._loader.unload_score(self._address, prev_tx_hash)
+            prev_tx_hash = tx_hash
+        self._loader.unload_score(self._address)
+
+        gc.collect()
+        self.assertLessEqual(len(sys.modules), modules_count)
+        self.assertIsNone(score_class_ref())
@@ -23,7 +23,7 @@ from iconservice.deploy.icon_score_deploy_storage import IconScoreDeployStorage
 from iconservice.iconscore.icon_score_base import IconScoreBase
 from iconservice.iconscore.icon_score_context import IconScoreContext
 from iconservice.iconscore.icon_score_loader import IconScoreLoader
-from iconservice.iconscore.icon_score_mapper import IconScoreMapper
+from iconservice.iconscore.icon_score_mapper import IconScoreMapper, IconScoreInfo
 from tests import create_address, create_tx_hash
 
 
@@ -42,6 +42,43 @@ class TestIconScoreMapper(unittest.TestCase):
         self.icon_score_mapper.load_score = Mock(return_value=TestScore())
         self.icon_score_mapper.get_icon_score(create_address(AddressPrefix.CONTRACT), tx_hash)
 
+    def test_unload_superseded_score(self):
+        address = create_address(AddressPrefix.CONTRACT)
+        tx_hash1, tx_hash2, tx_hash3 = create_tx_hash(), create_tx_hash(), create_tx_hash()
+        unload_score = IconScoreMapper.icon_score_loader.unload_score
+
+        self.icon_score_mapper.put_score_info(address, TestScore(), tx_hash1)
+        self.icon_score_mapper.put_score_info(address, TestScore(), tx_hash1)
+        unload_score.assert_not_called()
+
+        new_icon_score_mapper = IconScoreMapper()
+        new_icon_score_mapper.put_score_info(address, TestScore(), tx_hash2)
+        self.icon_score_mapper.update(new_icon_score_mapper)
+        unload_score.assert_called_once_with(address, tx_hash1)
+
+        # a mapper of a block which is not committed
+        new_icon_score_mapper = IconScoreMapper()
+        new_icon_score_mapper.put_score_info(address, TestScore(), tx_hash3)
+        self.icon_score_mapper.discard(new_icon_score_mapper)
+        unload_score.assert_called_with(address, tx_hash3)
+        self.assertEqual(tx_hash2, self.icon_score_mapper.get(address).tx_hash)
+
+    def test_put_if_absent(self):
+        address = create_address(AddressPrefix.CONTRACT)
+        tx_hash1, tx_hash2 = create_tx_hash(), create_tx_hash()
+        unload_score = IconScoreMapper.icon_score_loader.unload_score
+
+        self.assertTrue(self.icon_score_mapper.put_if_absent(address, IconScoreInfo(TestScore(), tx_hash1)))
+
+        # The same package is shared with the score in the mapper
+        self.assertFalse(self.icon_score_mapper.put_if_absent(address, IconScoreInfo(TestScore(), tx_hash1)))
+        unload_score.assert_not_called()
+
+        # The package loaded for a score which is not put is unloaded
+        self.assertFalse(self.icon_score_mapper.put_if_absent(address, IconScoreInfo(TestScore(), tx_hash2)))
+        unload_score.assert_called_once_with(address, tx_hash2)
+        self.assertEqual(tx_hash1, self.icon_score_mapper.get(address).tx_hash)
+
 
 class TestScore(IconScoreBase):
 
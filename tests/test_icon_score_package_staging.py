@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+import os
+import tempfile
+import unittest
+import zipfile
+from shutil import rmtree
+from unittest.mock import patch
+
+from iconservice.base.address import AddressPrefix
+from iconservice.base.exception import ServerErrorException
+from iconservice.deploy.icon_score_deployer import IconScoreDeployer
+from iconservice.deploy.icon_score_package_staging import IconScorePackageStaging
+from iconservice.utils import sha3_256
+from tests import create_address, create_tx_hash
+
+
+def make_zip(files: dict) -> bytes:
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, 'w', zipfile.ZIP_DEFLATED) as zip_file:
+        for name, contents in files.items():
+            zip_file.writestr(name, contents)
+    return buf.getvalue()
+
+
+class TestIconScorePackageStaging(unittest.TestCase):
+
+    def setUp(self):
+        self.score_root_path = tempfile.mkdtemp()
+        self.deployer = IconScoreDeployer(self.score_root_path)
+        self.content = make_zip({'score/package.json': b'{}', 'score/score.py': b'from iconservice import *\n'})
+        # 28 bytes are extracted from a package
+        self.package_size = 28
+        self.staging = IconScorePackageStaging(self.score_root_path, self.deployer, True,
+                                               max_bytes=self.package_size * 2, max_bytes_per_second=1024)
+
+    def tearDown(self):
+        rmtree(self.score_root_path)
+
+    def test_stage_and_install(self):
+        content_hash = self.staging.stage(self.content)
+        self.assertEqual(sha3_256(self.content), content_hash)
+        self.assertEqual(content_hash, self.staging.stage(self.content))
+        self.assertEqual([content_hash.hex()], os.listdir(self.staging.staging_path))
+
+        install_path = self.deployer.make_install_path(create_address(AddressPrefix.CONTRACT), create_tx_hash())
+        self.assertTrue(self.staging.install(content_hash, install_path))
+        self.assertEqual(['package.json', 'score.py'], sorted(os.listdir(install_path)))
+        self.assertFalse(self.staging.is_staged(content_hash))
+
+        # validated once while staged
+        self.assertTrue(self.staging.pop_validated(install_path))
+        self.assertFalse(self.staging.pop_validated(install_path))
+
+        # not staged any more
+        other_path = self.deployer.make_install_path(create_address(AddressPrefix.CONTRACT), create_tx_hash())
+        self.assertFalse(self.staging.install(content_hash, other_path))
+        self.assertFalse(self.staging.install(None, other_path))
+
+    def test_installed_directory_mode(self):
+        content_hash = self.staging.stage(self.content)
+        install_path = self.deployer.make_install_path(create_address(AddressPrefix.CONTRACT), create_tx_hash())
+        self.assertTrue(self.staging.install(content_hash, install_path))
+
+        # the same mode as a package extracted on invoke
+        extracted_path = os.path.join(self.score_root_path, 'extracted')
+        os.makedirs(extracted_path)
+        self.assertEqual(os.stat(extracted_path).st_mode, os.stat(install_path).st_mode)
+
+    def test_install_path_exists(self):
+        content_hash = self.staging.stage(self.content)
+        install_path = self.deployer.make_install_path(create_address(AddressPrefix.CONTRACT), create_tx_hash())
+        os.makedirs(install_path)
+
+        self.assertFalse(self.staging.install(content_hash, install_path))
+        self.assertTrue(self.staging.is_staged(content_hash))
+
+    def test_invalid_package(self):
+        content = make_zip({'score/package.json': b'{}', 'score/score.py': b'import os\n'})
+        with self.assertRaises(ServerErrorException):
+            self.staging.stage(content)
+        self.assertEqual([], os.listdir(self.staging.staging_path))
+
+    def test_evict(self):
+        contents = [make_zip({'score/package.json': b'{}', f'score/score{i}.py': b'#' * 26}) for i in range(3)]
+        content_hashes = [self.staging.stage(content) for content in contents]
+
+        self.assertFalse(self.staging.is_staged(content_hashes[0]))
+        self.assertTrue(self.staging.is_staged(content_hashes[1]))
+        self.assertTrue(self.staging.is_staged(content_hashes[2]))
+        self.assertEqual(2, len(os.listdir(self.staging.staging_path)))
+
+    def test_stage_by_tx_hash(self):
+        tx_hash = create_tx_hash()
+        self.assertTrue(self.staging.is_stageable(tx_hash))
+        content_hash = self.staging.stage(self.content, tx_hash)
+        self.assertFalse(self.staging.is_stageable(tx_hash))
+        self.assertTrue(self.staging.is_stageable(create_tx_hash()))
+
+        # The tx can stage its package again after the package is installed
+        install_path = self.deployer.make_install_path(create_address(AddressPrefix.CONTRACT), tx_hash)
+        self.assertTrue(self.staging.install(content_hash, install_path))
+        self.assertTrue(self.staging.is_stageable(tx_hash))
+
+    def test_extract_rate(self):
+        with patch('iconservice.deploy.icon_score_package_staging.time.monotonic', return_value=100.0) as monotonic:
+            staging = IconScorePackageStaging(self.score_root_path, self.deployer, True,
+                                              max_bytes_per_second=self.package_size)
+            content_hash = staging.stage(self.content)
+            self.assertIsNotNone(content_hash)
+            # A staged package is not extracted again
+            self.assertEqual(content_hash, staging.stage(self.content))
+
+            other_content = make_zip({'score/package.json': b'{}', 'score/score.py': b'#' * 26})
+            self.assertFalse(staging.is_stageable(create_tx_hash()))
+            self.assertIsNone(staging.stage(other_content))
+
+            monotonic.return_value = 100.5
+            self.assertTrue(staging.is_stageable(create_tx_hash()))
+            self.assertIsNotNone(staging.stage(other_content))
+            self.assertFalse(staging.is_stageable(create_tx_hash()))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -21,12 +21,13 @@ from unittest.mock import Mock
 from iconservice.base.address import Address, AddressPrefix
 from iconservice.base.address import ZERO_SCORE_ADDRESS
 from iconservice.base.block import Block
-from iconservice.base.exception import IconServiceBaseException
+from iconservice.base.exception import IconServiceBaseException, ExceptionCode
 from iconservice.base.transaction import Transaction
 from iconservice.base.type_converter import TypeConverter
 from iconservice.database.batch import TransactionBatch
 from iconservice.database.db import IconScoreDatabase
 from iconservice.deploy.icon_score_deploy_engine import IconScoreDeployEngine
+from iconservice.icon_constant import ResponseFormat
 from iconservice.iconscore.icon_pre_validator import IconPreValidator
 from iconservice.iconscore.icon_score_base import IconScoreBase, eventlog, \
     external
@@ -34,6 +35,7 @@ from iconservice.iconscore.icon_score_context import IconScoreContext, \
     ContextContainer
 from iconservice.iconscore.icon_score_engine import IconScoreEngine
 from iconservice.iconscore.icon_score_event_log import EventLog
+from iconservice.iconscore.icon_score_result_codec import decode_invoke_response
 from iconservice.iconscore.icon_score_step import IconScoreStepCounterFactory
 from iconservice.utils import to_camel_case
 from iconservice.utils.bloom import BloomFilter
@@ -190,7 +192,6 @@ class TestTransactionResult(unittest.TestCase):
         tx_result.logs_bloom.add(b'1')
         tx_result.logs_bloom.add(b'2')
         tx_result.logs_bloom.add(b'3')
-        tx_result.block = Block(123, hashlib.sha256(b'block').digest(), 1, None)
 
         camel_dict = tx_result.to_dict(to_camel_case)
 
@@ -264,6 +265,35 @@ class TestTransactionResult(unittest.TestCase):
 
         clear_inner_task()
 
+    def test_request_binary_response(self):
+        inner_task = generate_inner_task()
+        inner_task._icon_service_engine._icon_score_engine.invoke = Mock()
+        inner_task._icon_service_engine._validate_score_blacklist = Mock()
+
+        response = inner_task._negotiate_response_format({'formats': ['unknown', ResponseFormat.BINARY_V1]})
+        self.assertEqual({'format': ResponseFormat.BINARY_V1}, response)
+
+        from_ = create_address(AddressPrefix.EOA, b'from')
+        to_ = create_address(AddressPrefix.CONTRACT, b'score')
+        tx_hash = bytes.hex(create_tx_hash(b'tx1'))
+
+        request = create_request([ReqData(tx_hash, from_, to_, 'call', {})])
+        response = inner_task._invoke(request)
+        self.assertIsInstance(response, bytes)
+
+        result = TypeConverter.convert_type_reverse(decode_invoke_response(response))
+        self.assertEqual('0x1', result['txResults'][tx_hash]['status'])
+        self.assertEqual(tx_hash, result['txResults'][tx_hash]['txHash'])
+
+        # Falls back to JSON if no format is supported
+        response = inner_task._negotiate_response_format({'formats': ['unknown']})
+        self.assertEqual({'format': ResponseFormat.JSON}, response)
+
+        response = inner_task._negotiate_response_format({'formats': None})
+        self.assertEqual(ExceptionCode.INVALID_PARAMS, response['error']['code'])
+
+        clear_inner_task()
+
 
 # noinspection PyPep8Naming
 class SampleScore(IconScoreBase):
@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+import unittest
+
+from iconservice.base.address import Address, AddressPrefix, MalformedAddress
+from iconservice.base.block import Block
+from iconservice.base.exception import ExceptionCode, InvalidParamsException
+from iconservice.base.transaction import Transaction
+from iconservice.base.type_converter import TypeConverter
+from iconservice.iconscore.icon_score_event_log import EventLog
+from iconservice.iconscore.icon_score_result import TransactionResult
+from iconservice.icon_inner_service import MakeResponse
+from iconservice.iconscore.icon_score_result_codec import encode_invoke_response, decode_invoke_response, \
+    make_invoke_json_response
+from iconservice.utils import sha3_256
+from iconservice.utils import to_camel_case
+from iconservice.utils.bloom import BloomFilter
+from tests import create_block_hash, create_tx_hash, create_address
+
+RECORDED_RESPONSE_PATH = os.path.join(os.path.dirname(__file__), 'sample', 'invoke_response.json')
+
+
+def create_recorded_tx_results() -> list:
+    """Creates the same transaction results as the recorded response
+    """
+    block = Block(0x1234, sha3_256(b'block'), 0x1234567890, sha3_256(b'prev_block'))
+    score_address = Address.from_data(AddressPrefix.CONTRACT, b'score')
+    to = Address.from_data(AddressPrefix.EOA, b'to')
+
+    tx_results = []
+    for i in range(3):
+        tx = Transaction(sha3_256(i.to_bytes(1, 'big')), i, Address.from_data(AddressPrefix.EOA, b'from'))
+        tx_result = TransactionResult(tx, block, to if i != 2 else None, score_address if i == 1 else None,
+                                      step_used=i * 1000, step_price=10 ** 10, cumulative_step_used=i * 2000)
+        tx_result.event_logs = []
+        tx_result.traces = []
+        tx_result.logs_bloom = BloomFilter()
+        tx_result.status = TransactionResult.SUCCESS if i != 1 else TransactionResult.FAILURE
+        tx_result.failure = TransactionResult.Failure(ExceptionCode.SCORE_ERROR, f'error {i}')
+        tx_results.append(tx_result)
+
+    tx_results[0].event_logs.append(EventLog(
+        score_address,
+        ['Transfer(Address,int,bool,bytes,str)', to, -0x1234, True],
+        [False, b'\x00\x01data', '한글', 2 ** 300, None, MalformedAddress.from_string('hx1234')]))
+    tx_results[0].event_logs.append(EventLog(score_address, None, []))
+    tx_results[0].logs_bloom.add(b'Transfer')
+    tx_results[0].logs_bloom.add(to.body)
+
+    return tx_results
+
+
+class TestIconScoreResultCodec(unittest.TestCase):
+    def setUp(self):
+        block = Block(10, create_block_hash(), 0x1234567890, create_block_hash())
+        score_address = create_address(AddressPrefix.CONTRACT)
+
+        self.tx_results = []
+        for i in range(4):
+            tx = Transaction(create_tx_hash(), i, create_address(AddressPrefix.EOA))
+            tx_result = TransactionResult(tx, block, score_address, step_used=100 * i,
+                                          step_price=10 ** 10, cumulative_step_used=1000 * i)
+            tx_result.event_logs = [
+                EventLog(score_address,
+                         ['Transfer(Address,int,bool,bytes,str)', create_address(AddressPrefix.EOA), -1],
+                         [True, False, b'data', '한글', 2 ** 4000, None]),
+                EventLog(score_address, None, [MalformedAddress.from_string('hx1234')])
+            ]
+            tx_result.logs_bloom = BloomFilter()
+            tx_result.logs_bloom.add(bytes([i]))
+            tx_result.traces = []
+            tx_result.failure = TransactionResult.Failure(ExceptionCode.SCORE_ERROR, f'error {i}')
+            tx_result.status = i % 2
+            self.tx_results.append(tx_result)
+
+        self.state_root_hash = create_block_hash()
+
+    def test_decode_is_identical_to_json(self):
+        json_response = TypeConverter.convert_type_reverse({
+            'txResults': {bytes.hex(r.tx_hash): r.to_dict(to_camel_case) for r in self.tx_results},
+            'stateRootHash': bytes.hex(self.state_root_hash)
+        })
+
+        binary_response = encode_invoke_response(self.tx_results, self.state_root_hash)
+        self.assertIsInstance(binary_response, bytes)
+
+        decoded = TypeConverter.convert_type_reverse(decode_invoke_response(binary_response))
+        self.assertEqual(json_response, decoded)
+        self.assertEqual(list(json_response['txResults']), list(decoded['txResults']))
+
+    def test_empty_block(self):
+        decoded = decode_invoke_response(encode_invoke_response([], self.state_root_hash))
+        self.assertEqual({'txResults': {}, 'stateRootHash': bytes.hex(self.state_root_hash)}, decoded)
+
+    def test_invalid_response(self):
+        binary_response = bytearray(encode_invoke_response(self.tx_results, self.state_root_hash))
+
+        binary_response[4] = 0xff
+        with self.assertRaises(InvalidParamsException):
+            decode_invoke_response(bytes(binary_response))
+
+        binary_response[0] = 0
+        with self.assertRaises(InvalidParamsException):
+            decode_invoke_response(bytes(binary_response))
+
+    def test_not_supported_type(self):
+        self.tx_results[0].event_logs[0].data.append(1.5)
+        with self.assertRaises(InvalidParamsException):
+            encode_invoke_response(self.tx_results, self.state_root_hash)
+
+
+class TestIconScoreResultJsonResponse(unittest.TestCase):
+    def setUp(self):
+        self.tx_results = create_recorded_tx_results()
+        self.state_root_hash = sha3_256(b'state_root_hash')
+
+        with open(RECORDED_RESPONSE_PATH, 'r', encoding='utf-8') as f:
+            self.recorded_response = json.load(f)
+
+    def test_identical_to_recorded_response(self):
+        response = make_invoke_json_response(self.tx_results, self.state_root_hash)
+
+        self.assertEqual(self.recorded_response, response)
+        self.assertEqual(json.dumps(self.recorded_response), json.dumps(response))
+
+    def test_identical_to_to_dict(self):
+        response = make_invoke_json_response(self.tx_results, self.state_root_hash)
+
+        expected = MakeResponse.make_response({
+            'txResults': {bytes.hex(r.tx_hash): r.to_dict(to_camel_case) for r in create_recorded_tx_results()},
+            'stateRootHash': bytes.hex(self.state_root_hash)
+        })
+        self.assertEqual(json.dumps(expected), json.dumps(response))
+
+    def test_results_are_not_modified(self):
+        make_invoke_json_response(self.tx_results, self.state_root_hash)
+
+        self.assertEqual(-0x1234, self.tx_results[0].event_logs[0].indexed[2])
+        self.assertEqual(b'\x00\x01data', self.tx_results[0].event_logs[0].data[1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -26,7 +26,7 @@ from iconservice.iconscore.icon_score_base import \
     IconScoreBase, eventlog, external, sha3_256
 from iconservice.iconscore.icon_score_context import ContextContainer
 from iconservice.iconscore.icon_score_step import \
-    StepType, IconScoreStepCounter, IconScoreStepCounterFactory
+    StepType, IconScoreStepCounter, IconScoreStepCounterFactory, get_data_size
 from tests import create_tx_hash, create_address
 from tests.mock_generator import generate_inner_task, create_request, ReqData, clear_inner_task
 
@@ -407,18 +407,18 @@ class TestIconScoreStepCounter(unittest.TestCase):
             governance.STEP_TYPE_EVENT_LOG: 10,
             governance.STEP_TYPE_API_CALL: 0
         }
-        step_costs = {}
+        step_counter_factory = IconScoreStepCounterFactory()
 
         factory = self._inner_task._icon_service_engine._step_counter_factory
 
         for key, value in raw_step_costs.items():
             try:
-                step_costs[StepType(key)] = value
+                step_counter_factory.set_step_cost(StepType(key), value)
             except ValueError:
                 # Pass the unknown step type
                 pass
 
-        self.step_counter = IconScoreStepCounter(step_costs, 100, 0)
+        self.step_counter = step_counter_factory.create(100)
         factory.create = Mock(return_value=self.step_counter)
 
         self._inner_task._icon_service_engine._icon_score_mapper.get_icon_score = Mock(return_value=None)
@@ -477,6 +477,58 @@ class TestIconScoreStepCounter(unittest.TestCase):
         self.assertEqual(
             10, step_counter_factory.get_step_cost(StepType.EVENT_LOG))
 
+    def test_step_cost_table(self):
+        step_counter_factory = IconScoreStepCounterFactory()
+        step_counter_factory.set_step_cost(StepType.DEFAULT, 100)
+        step_counter_factory.set_step_cost(StepType.SET, 20)
+
+        step_counter = step_counter_factory.create(1000)
+        # A transaction uses at least the default steps
+        self.assertEqual(100, step_counter.step_used)
+        self.assertEqual(100, step_counter.apply_step(StepType.SET, 3))
+        self.assertEqual(120, step_counter.apply_step(StepType.SET, 3))
+        # An unset step type costs nothing
+        self.assertEqual(120, step_counter.apply_step(StepType.GET, 10))
+
+        # Setting the same cost again does not recompile the table
+        step_cost_table = step_counter_factory._step_cost_table
+        step_counter_factory.set_step_cost(StepType.SET, 20)
+        self.assertIs(step_cost_table, step_counter_factory._step_cost_table)
+        self.assertIs(step_cost_table, step_counter_factory.create(1000)._step_cost_table)
+
+        # Changed step costs do not affect the step counter already created
+        step_counter_factory.set_step_cost(StepType.SET, 50)
+        self.assertIsNot(step_cost_table, step_counter_factory._step_cost_table)
+        self.assertEqual(180, step_counter.apply_step(StepType.SET, 3))
+        self.assertEqual(150, step_counter_factory.create(1000).apply_step(StepType.SET, 3))
+
+    def test_get_data_size(self):
+        content = '0x' + 'ab' * 100
+        data = {
+            'contentType': 'application/zip',
+            'content': content,
+            'params': {
+                'hex': '0x123',
+                'text': '가나',
+                'list': ['0x', 'ab', 256, True, None, ''],
+                'zero': 0
+            }
+        }
+
+        data_size = get_data_size(data)
+        character_length = \
+            len('contentType') + len('application/zip') + len('content') + len(content) + \
+            len('params') + len('hex') + len('0x123') + len('text') + len('가나') + \
+            len('list') + len('0x') + len('ab') + len('zero')
+        byte_length = \
+            len('application/zip') + 100 + 2 + len('가나'.encode('utf-8')) + len('0x') + 1 + 2 + 1
+        self.assertEqual(character_length, data_size.character_length)
+        self.assertEqual(byte_length, data_size.byte_length)
+        self.assertEqual(100, data_size.content_byte_length)
+
+        self.assertEqual((0, 0, 0), get_data_size(None))
+        self.assertEqual((5, 5, 0), get_data_size('hello'))
+
 
 # noinspection PyPep8Naming
 class SampleScore(IconScoreBase):
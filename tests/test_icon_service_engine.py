@@ -28,7 +28,7 @@ from iconservice.base.block import Block
 from iconservice.base.type_converter import TypeConverter
 from iconservice.base.type_converter_templates import ParamType
 from iconservice.base.exception import ExceptionCode, ServerErrorException, \
-    RevertException
+    RevertException, DatabaseException
 from iconservice.base.message import Message
 from iconservice.base.transaction import Transaction
 from iconservice.database.batch import BlockBatch, TransactionBatch
@@ -685,6 +685,90 @@ class TestIconServiceEngine(unittest.TestCase):
         self._engine.rollback(block)
         self.assertIsNone(self._engine._precommit_data_manager.get(block))
 
+    def test_invoke_same_block_again(self):
+        block = Block(
+            block_height=1,
+            block_hash=create_block_hash(),
+            timestamp=0,
+            prev_hash=self.genesis_block.hash)
+        precommit_data_manager = self._engine._precommit_data_manager
+
+        block_result, state_root_hash = self._engine.invoke(block, [])
+        precommit_data = precommit_data_manager.get(block.hash)
+
+        # The results made before are returned without invoking the block again
+        block_result2, state_root_hash2 = self._engine.invoke(block, [])
+        self.assertIs(block_result, block_result2)
+        self.assertEqual(state_root_hash, state_root_hash2)
+        self.assertIs(precommit_data, precommit_data_manager.get(block.hash))
+        self.assertEqual(1, precommit_data_manager.reused_count)
+
+        # The block is invoked again if it differs
+        block = Block(
+            block_height=1,
+            block_hash=block.hash,
+            timestamp=1,
+            prev_hash=self.genesis_block.hash)
+        self._engine.invoke(block, [])
+        self.assertIsNot(precommit_data, precommit_data_manager.get(block.hash))
+        self.assertEqual(1, precommit_data_manager.reused_count)
+        precommit_data = precommit_data_manager.get(block.hash)
+
+        # The block is invoked again if its transactions differ
+        tx_v3 = {
+            'method': 'icx_sendTransaction',
+            'params': {
+                'version': 3,
+                'from': self._genesis_address,
+                'to': self._to,
+                'value': 1 * 10 ** 18,
+                'stepLimit': 200000000,
+                'timestamp': 1234567890,
+                'txHash': create_tx_hash()
+            }
+        }
+        block_result, state_root_hash = self._engine.invoke(block, [tx_v3])
+        self.assertEqual(1, len(block_result))
+        self.assertIsNot(precommit_data, precommit_data_manager.get(block.hash))
+        self.assertEqual(1, precommit_data_manager.reused_count)
+
+        block_result2, state_root_hash2 = self._engine.invoke(block, [tx_v3])
+        self.assertIs(block_result, block_result2)
+        self.assertEqual(state_root_hash, state_root_hash2)
+        self.assertEqual(2, precommit_data_manager.reused_count)
+
+        response = self._engine.query('ise_getStatus', {})
+        self.assertEqual(2, response['precommitReusedCount'])
+
+    def test_check_last_block(self):
+        storage = self._engine._icx_storage
+
+        # The genesis block has been written without sync
+        response = self._engine.query('ise_getStatus', {})
+        self.assertEqual(1, response['dbUnsyncedBlocks'])
+        self.assertIsNone(storage.synced_block)
+        self.assertEqual(1, self._engine._check_last_block())
+
+        storage._synced_block = self.genesis_block
+        self.assertEqual(0, self._engine._check_last_block())
+
+        storage._synced_block = Block(
+            block_height=1,
+            block_hash=create_block_hash(),
+            timestamp=0,
+            prev_hash=self.genesis_block.hash)
+        with self.assertRaises(DatabaseException):
+            self._engine._check_last_block()
+
+        storage._synced_block = Block(
+            block_height=0,
+            block_hash=create_block_hash(),
+            timestamp=0,
+            prev_hash=None)
+        with self.assertRaises(DatabaseException):
+            self._engine._check_last_block()
+        storage._synced_block = None
+
     def test_invoke_v2_with_malformed_to_address_and_type_converter(self):
         to = ''
         to_address = MalformedAddress.from_string(to)
@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import tempfile
+import unittest
+from shutil import rmtree
+from threading import Event, Thread, current_thread
+from unittest.mock import patch
+
+from iconservice.base.exception import ServerErrorException
+from iconservice.icon_constant import IconScoreLoaderFlag
+from iconservice.iconscore import score_package_validator
+from iconservice.iconscore.icon_score_loader import IconScoreLoader
+from iconservice.iconscore.score_package_validator import ScorePackageValidator
+
+
+class TestScorePackageValidatorVerdict(unittest.TestCase):
+
+    def setUp(self):
+        self.pkg_root_path = tempfile.mkdtemp()
+        os.makedirs(os.path.join(self.pkg_root_path, 'sub'))
+        self._write('package.json', b'{}')
+        self._write('score.py', b'from iconservice import *\nfrom .sub.util import f\n')
+        self._write('sub/util.py', b'def f():\n    return 1\n')
+
+    def tearDown(self):
+        rmtree(self.pkg_root_path)
+
+    def _write(self, name: str, data: bytes):
+        with open(os.path.join(self.pkg_root_path, name), 'wb') as f:
+            f.write(data)
+
+    def test_verdict(self):
+        self.assertFalse(ScorePackageValidator.is_validated(self.pkg_root_path))
+
+        ScorePackageValidator.validate_path(self.pkg_root_path)
+        ScorePackageValidator.save_verdict(self.pkg_root_path)
+        self.assertTrue(ScorePackageValidator.is_validated(self.pkg_root_path))
+
+        # bytecode caches written by imports do not invalidate the verdict
+        os.makedirs(os.path.join(self.pkg_root_path, '__pycache__'))
+        self._write('__pycache__/score.cpython-36.pyc', b'pyc')
+        self.assertTrue(ScorePackageValidator.is_validated(self.pkg_root_path))
+
+        with patch.object(score_package_validator, 'VALIDATOR_VERSION', score_package_validator.VALIDATOR_VERSION + 1):
+            self.assertFalse(ScorePackageValidator.is_validated(self.pkg_root_path))
+
+        self._write('sub/util.py', b'import os\n')
+        self.assertFalse(ScorePackageValidator.is_validated(self.pkg_root_path))
+
+    def test_broken_verdict(self):
+        self._write(score_package_validator.VERDICT_FILE, b'{')
+        self.assertFalse(ScorePackageValidator.is_validated(self.pkg_root_path))
+
+    def test_validate_on_threads(self):
+        other_path = tempfile.mkdtemp()
+        with open(os.path.join(other_path, 'score.py'), 'wb') as f:
+            f.write(b'import os\n')
+
+        validate_code = ScorePackageValidator._validate_code
+        paused, resume = Event(), Event()
+        errors = {}
+
+        def pause(code):
+            if current_thread() is paused_thread:
+                paused.set()
+                resume.wait()
+            validate_code(code)
+
+        def validate(pkg_root_path: str):
+            try:
+                ScorePackageValidator.validate_path(pkg_root_path)
+            except BaseException as e:
+                errors[pkg_root_path] = e
+
+        paused_thread = Thread(target=validate, args=(self.pkg_root_path,))
+        other_thread = Thread(target=validate, args=(other_path,))
+        try:
+            with patch.object(ScorePackageValidator, '_validate_code', side_effect=pause):
+                paused_thread.start()
+                self.assertTrue(paused.wait(5))
+
+                # Another package is validated while the first one is in the middle of validation
+                other_thread.start()
+                other_thread.join(5)
+                self.assertFalse(other_thread.is_alive())
+
+                resume.set()
+                paused_thread.join()
+        finally:
+            resume.set()
+            rmtree(other_path)
+
+        self.assertNotIn(self.pkg_root_path, errors)
+        self.assertIsInstance(errors[other_path], ServerErrorException)
+
+    def test_loader_uses_verdict(self):
+        loader = IconScoreLoader(os.path.dirname(self.pkg_root_path),
+                                 IconScoreLoaderFlag.ENABLE_SCORE_PACKAGE_VALIDATOR)
+
+        with patch.object(ScorePackageValidator, 'validator') as validator:
+            loader._validate_package(self.pkg_root_path, 'pkg')
+            loader._validate_package(self.pkg_root_path, 'pkg')
+            validator.assert_called_once_with(self.pkg_root_path, 'pkg')
+
+            self._write('score.py', b'from iconservice import *\n')
+            loader._validate_package(self.pkg_root_path, 'pkg')
+            self.assertEqual(2, validator.call_count)
+
+
+if __name__ == '__main__':
+    unittest.main()
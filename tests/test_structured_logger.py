@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+import unittest
+from threading import Event, Thread
+from unittest.mock import Mock, patch
+
+from iconcommons.logger.logger import icon_logger
+
+from iconservice.utils import structured_logger as structured_logger_module
+from iconservice.utils.structured_logger import StructuredLogger, FailureSampler, summarize
+
+TAG = 'TestTag'
+
+
+class TestSummarize(unittest.TestCase):
+    def test_truncate(self):
+        self.assertEqual('abc', summarize('abc', max_length=3))
+        self.assertEqual('abc...(5)', summarize('abcde', max_length=3))
+        self.assertEqual("b'ab'...(4)", summarize(b'abcd', max_length=2))
+
+    def test_cut_containers(self):
+        value = {'transactions': [{'data': '0x' + '00' * 100} for _ in range(5)], 'block': {'height': 1}}
+        summary = summarize(value, max_length=8, max_items=2)
+
+        self.assertEqual(['0x000000...(202)', '0x000000...(202)'],
+                         [tx['data'] for tx in summary['transactions'][:2]])
+        self.assertEqual('...(5 items)', summary['transactions'][2])
+        self.assertEqual({'height': 1}, summary['block'])
+        # the original value is not modified
+        self.assertEqual(5, len(value['transactions']))
+
+    def test_max_depth(self):
+        self.assertEqual({'a': {'b': '{...}'}}, summarize({'a': {'b': {'c': 1}}}, max_depth=2))
+
+
+class TestStructuredLogger(unittest.TestCase):
+    def setUp(self):
+        self.level = icon_logger.level
+        icon_logger.setLevel(logging.DEBUG)
+
+        self.write = Mock()
+        patcher = patch.dict(structured_logger_module._LOG_FUNCTIONS,
+                             {level: self.write for level in structured_logger_module._LOG_FUNCTIONS})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.logger = StructuredLogger()
+
+    def tearDown(self):
+        self.logger.stop()
+        icon_logger.setLevel(self.level)
+
+    def test_write(self):
+        self.logger.info(TAG, 'invoke request', request={'data': 'a' * 300})
+
+        expected = f"invoke request: request={{'data': '{'a' * 256}...(300)'}}"
+        self.write.assert_called_once_with(expected, TAG)
+
+    def test_tag_level(self):
+        self.logger.load_config({'tagLevels': {TAG: 'warning'}})
+        value = Mock(spec=dict)
+
+        self.logger.info(TAG, 'invoke request', request=value)
+        self.logger.debug(TAG, 'invoke request', request=value)
+        self.write.assert_not_called()
+        # fields of a disabled record are not even looked at
+        value.items.assert_not_called()
+
+        self.logger.warning(TAG, 'invoke request')
+        self.write.assert_called_once_with('invoke request', TAG)
+
+        self.logger.info('OtherTag', 'query request')
+        self.write.assert_called_with('query request', 'OtherTag')
+
+    def test_unknown_tag_level(self):
+        with patch.object(structured_logger_module.Logger, 'warning') as warning:
+            self.logger.load_config({'tagLevels': {TAG: 'trace', 'OtherTag': 'warning'}})
+            self.logger.set_level('ThirdTag', 'verbose')
+        self.assertEqual(2, warning.call_count)
+
+        # The tag with an unknown level is logged as if it had no level
+        self.logger.info(TAG, 'invoke request')
+        self.write.assert_called_once_with('invoke request', TAG)
+
+        self.logger.info('OtherTag', 'query request')
+        self.write.assert_called_once_with('invoke request', TAG)
+
+    def test_critical_and_custom_level(self):
+        self.logger.start()
+        self.logger.log(logging.CRITICAL, TAG, 'commit failed')
+        with patch.object(structured_logger_module.Logger, 'error') as error:
+            self.logger.log(logging.WARNING + 5, TAG, 'write stalled')
+            self.logger.flush()
+
+        self.write.assert_called_once_with('commit failed', TAG)
+        error.assert_called_once_with('write stalled', TAG)
+
+    def test_background_writer(self):
+        self.logger.start()
+        for i in range(10):
+            self.logger.info(TAG, 'query request', index=i)
+        self.logger.flush()
+
+        self.assertEqual(10, self.write.call_count)
+        self.assertEqual(('query request: index=9', TAG), self.write.call_args[0])
+        self.assertEqual(0, self.logger.dropped)
+
+        self.logger.stop()
+        self.logger.info(TAG, 'query response')
+        self.write.assert_called_with('query response', TAG)
+
+    def test_dropped_on_threads(self):
+        writing = Event()
+        resume = Event()
+
+        def write(msg: str, tag: str):
+            writing.set()
+            resume.wait()
+
+        self.write.side_effect = write
+        self.logger.start(queue_size=1)
+        self.logger.info(TAG, 'invoke request')
+        writing.wait()
+        # The writer is blocked and the queue is full, so the following records are dropped
+        self.logger.info(TAG, 'invoke request')
+
+        def log():
+            for _ in range(1000):
+                self.logger.info(TAG, 'query request')
+
+        threads = [Thread(target=log) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(4000, self.logger.dropped)
+        resume.set()
+
+
+class TestFailureSampler(unittest.TestCase):
+    def test_sample(self):
+        sampler = FailureSampler(interval=3600)
+
+        self.assertEqual(1, sampler.sample(('ScoreErrorException', 32000, 'error')))
+        for _ in range(10):
+            self.assertEqual(0, sampler.sample(('ScoreErrorException', 32000, 'error')))
+        self.assertEqual(1, sampler.sample(('ScoreErrorException', 32000, 'other error')))
+
+    def test_sample_after_interval(self):
+        sampler = FailureSampler(interval=0)
+
+        self.assertEqual(1, sampler.sample('error'))
+        self.assertEqual(1, sampler.sample('error'))
+
+        sampler = FailureSampler(interval=3600)
+        sampler.sample('error')
+        sampler.sample('error')
+        sampler.sample('error')
+        with patch.object(structured_logger_module.time, 'monotonic', return_value=10 ** 9):
+            self.assertEqual(3, sampler.sample('error'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -73,3 +73,19 @@ class TestTransactionResult(unittest.TestCase):
 
         print(d)
         print(hex(tx_result.failure.code))
+
+    def test_to_dict_keys(self):
+        tx_result = self.tx_result
+        tx_result.traces = []
+
+        d = tx_result.to_dict()
+        self.assertEqual(
+            ['tx_hash', 'block_height', 'block_hash', 'tx_index', 'to', 'step_used',
+             'step_price', 'cumulative_step_used', 'event_logs', 'status', 'failure'],
+            list(d.keys()))
+        self.assertEqual(
+            {'code': ExceptionCode.SERVER_ERROR, 'message': 'Server error'}, d['failure'])
+
+    def test_slots(self):
+        with self.assertRaises(AttributeError):
+            self.tx_result.unknown = None
@@ -0,0 +1,313 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Step cost calibration benchmark
+
+Measures how long each step-charged operation takes on this machine
+through the real iconservice code paths and reports nanoseconds per step.
+An operation with a high ns/step ratio (or no step charge at all) is
+underpriced and may be abused as a DoS vector.
+
+usage: PYTHONPATH=. python tools/step_calibration.py [-n 5000] [--sizes 1,32,1024] [--json]
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from contextlib import redirect_stdout
+from shutil import rmtree
+from typing import Callable, List, Optional
+
+from iconservice.base.address import Address, AddressPrefix
+from iconservice.base.block import Block
+from iconservice.base.message import Message
+from iconservice.base.transaction import Transaction
+from iconservice.database.batch import BlockBatch, TransactionBatch
+from iconservice.database.db import ContextDatabase, IconScoreDatabase, DatabaseObserver
+from iconservice.iconscore.icon_score_base import IconScoreBase, sha3_256
+from iconservice.iconscore.icon_score_context import IconScoreContext, IconScoreContextType, ContextContainer
+from iconservice.iconscore.icon_score_event_log import EventLogEmitter
+from iconservice.iconscore.icon_score_step import IconScoreStepCounterFactory, StepType, get_data_size
+from iconservice.iconscore.internal_call import InternalCall
+from iconservice.icx.icx_account import Account
+from iconservice.icx.icx_engine import IcxEngine
+from iconservice.icx.icx_storage import IcxStorage
+from iconservice.utils.bloom import BloomFilter
+
+# Same values as Governance._set_initial_step_costs()
+DEFAULT_STEP_COSTS = {
+    StepType.DEFAULT: 1_000_000,
+    StepType.CONTRACT_CALL: 15_000,
+    StepType.CONTRACT_CREATE: 200_000,
+    StepType.CONTRACT_UPDATE: 80_000,
+    StepType.CONTRACT_DESTRUCT: -70_000,
+    StepType.CONTRACT_SET: 30_000,
+    StepType.GET: 0,
+    StepType.SET: 200,
+    StepType.REPLACE: 50,
+    StepType.DELETE: -150,
+    StepType.INPUT: 200,
+    StepType.EVENT_LOG: 100,
+    StepType.API_CALL: 0
+}
+
+DEFAULT_SIZES = [1, 32, 256, 1024, 4096]
+DEFAULT_ITERATIONS = 5000
+STEP_LIMIT = 2 ** 63
+
+
+class _StepRecorder(object):
+    """Wraps a step counter and records the steps charged per StepType
+
+    It is only used in the untimed pass which figures out steps per operation.
+    """
+
+    def __init__(self, factory: 'IconScoreStepCounterFactory') -> None:
+        self._factory = factory
+        self._step_counter = factory.create(STEP_LIMIT)
+        self.steps = defaultdict(int)
+
+    def apply_step(self, step_type: 'StepType', count: int) -> int:
+        self.steps[step_type] += self._factory.get_step_cost(step_type) * count
+        return self._step_counter.apply_step(step_type, count)
+
+    def __getattr__(self, name: str):
+        return getattr(self._step_counter, name)
+
+
+class StepCalibration(object):
+    """Runs microbenchmarks for each step type against a temporary state db
+    """
+
+    def __init__(self, db_path: str, step_costs: dict, iterations: int) -> None:
+        self._iterations = iterations
+
+        self._factory = IconScoreStepCounterFactory()
+        for step_type, cost in step_costs.items():
+            self._factory.set_step_cost(step_type, cost)
+
+        self._context_db = ContextDatabase.from_path(db_path)
+        self._score_address = Address.from_data(AddressPrefix.CONTRACT, b'calibration')
+        self._from = Address.from_data(AddressPrefix.EOA, b'from')
+        self._to = Address.from_data(AddressPrefix.EOA, b'to')
+
+        storage = IcxStorage(self._context_db)
+        self._icx_engine = IcxEngine()
+        self._icx_engine.open(storage)
+        storage.put_account(None, self._from, Account(address=self._from, icx=10 ** 30))
+        InternalCall.icx_engine = self._icx_engine
+
+        self._context = self._create_context()
+        self._score_db = IconScoreDatabase(self._score_address, self._context_db)
+        self._score_db.set_observer(DatabaseObserver(
+            getattr(IconScoreBase, '_IconScoreBase__on_db_get'),
+            getattr(IconScoreBase, '_IconScoreBase__on_db_put'),
+            getattr(IconScoreBase, '_IconScoreBase__on_db_delete')))
+
+    def close(self) -> None:
+        InternalCall.icx_engine = None
+        self._icx_engine.close()
+
+    def _create_context(self) -> 'IconScoreContext':
+        block = Block(1, bytes(32), int(time.time() * 10 ** 6), bytes(32))
+
+        context = IconScoreContext(IconScoreContextType.INVOKE)
+        context.block = block
+        context.block_batch = BlockBatch(block)
+        context.tx_batch = TransactionBatch()
+        context.tx = Transaction(tx_hash=bytes(32), origin=self._from, timestamp=block.timestamp)
+        context.msg = Message(sender=self._from)
+        context.current_address = self._score_address
+        self._reset_context(context)
+        return context
+
+    def _reset_context(self, context: 'IconScoreContext') -> None:
+        context.tx_batch.clear()
+        context.event_logs = []
+        context.logs_bloom = BloomFilter()
+        context.traces = []
+        context.step_counter = self._factory.create(STEP_LIMIT)
+
+    def run(self, sizes: List[int]) -> List[dict]:
+        ContextContainer._push_context(self._context)
+        try:
+            results = []
+            for size in sizes:
+                results.append(self._measure_get(size))
+                results.append(self._measure_set(size))
+                results.append(self._measure_replace(size))
+                results.append(self._measure_delete(size))
+                results.append(self._measure_event_log(size))
+                results.append(self._measure_sha3_256(size))
+                results.append(self._measure_input(size))
+            results.append(self._measure_contract_call())
+            return results
+        finally:
+            ContextContainer._pop_context()
+
+    def _measure(self,
+                 name: str,
+                 step_type: 'StepType',
+                 size: int,
+                 op: Callable[[int], None],
+                 prepare: Optional[Callable[[], None]] = None) -> dict:
+        """Times op(i) for every i in range(iterations)
+
+        :param prepare: called before both the untimed and the timed pass
+        """
+        context = self._context
+
+        # Untimed pass to learn how many steps a single operation charges
+        if prepare:
+            prepare()
+        self._reset_context(context)
+        recorder = _StepRecorder(self._factory)
+        context.step_counter = recorder
+        op(0)
+        steps = recorder.steps[step_type]
+
+        if prepare:
+            prepare()
+        self._reset_context(context)
+        start = time.perf_counter()
+        for i in range(self._iterations):
+            op(i)
+        elapsed_ns = (time.perf_counter() - start) * 10 ** 9
+
+        ns_per_op = elapsed_ns / self._iterations
+        return {
+            'op': name,
+            'stepType': step_type.value,
+            'size': size,
+            'nsPerOp': ns_per_op,
+            'stepsPerOp': steps,
+            'nsPerStep': ns_per_op / steps if steps > 0 else None
+        }
+
+    def _prefill(self, size: int) -> None:
+        value = b'\xab' * size
+        states = {self._score_db._hash_key(self._key(i)): value for i in range(self._iterations)}
+        self._context_db.write_batch(None, states)
+
+    @staticmethod
+    def _key(i: int) -> bytes:
+        return i.to_bytes(8, 'big')
+
+    def _measure_get(self, size: int) -> dict:
+        return self._measure('IconScoreDatabase.get', StepType.GET, size,
+                             lambda i: self._score_db.get(self._key(i)),
+                             lambda: self._prefill(size))
+
+    def _measure_set(self, size: int) -> dict:
+        value = b'\xcd' * size
+        return self._measure('IconScoreDatabase.put(new)', StepType.SET, size,
+                             lambda i: self._score_db.put(b'new' + self._key(i), value))
+
+    def _measure_replace(self, size: int) -> dict:
+        value = b'\xcd' * size
+        return self._measure('IconScoreDatabase.put(replace)', StepType.REPLACE, size,
+                             lambda i: self._score_db.put(self._key(i), value),
+                             lambda: self._prefill(size))
+
+    def _measure_delete(self, size: int) -> dict:
+        return self._measure('IconScoreDatabase.delete', StepType.DELETE, size,
+                             lambda i: self._score_db.delete(self._key(i)),
+                             lambda: self._prefill(size))
+
+    def _measure_event_log(self, size: int) -> dict:
+        arguments = [b'\xef' * size]
+        return self._measure('EventLogEmitter.emit_event_log', StepType.EVENT_LOG, size,
+                             lambda i: EventLogEmitter.emit_event_log(
+                                 self._context, self._score_address, 'Calibrate(bytes)', arguments, 1))
+
+    def _measure_sha3_256(self, size: int) -> dict:
+        data = b'\x12' * size
+        return self._measure('sha3_256', StepType.API_CALL, size, lambda i: sha3_256(data))
+
+    def _measure_input(self, size: int) -> dict:
+        data = {'method': 'calibrate', 'params': {'value': f'0x{"34" * size}'}}
+        context = self._context
+
+        # The input steps are charged on the size computed, as on invoke
+        return self._measure('get_data_size', StepType.INPUT, size,
+                             lambda i: context.step_counter.apply_step(
+                                 StepType.INPUT, get_data_size(data).byte_length))
+
+    def _measure_contract_call(self) -> dict:
+        internal_call = self._context.internal_call
+
+        # The ICXTransfer event emitted by each call prints its arguments to stdout
+        with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+            return self._measure('InternalCall._call', StepType.CONTRACT_CALL, 0,
+                                 lambda i: internal_call.icx_transfer_call(self._from, self._to, 1))
+
+
+def _print_table(results: List[dict]) -> None:
+    header = f'{"operation":<36}{"stepType":<14}{"size":>8}{"ns/op":>14}{"steps/op":>12}{"ns/step":>12}'
+    print(header)
+    print('-' * len(header))
+    for r in results:
+        if r['nsPerStep'] is not None:
+            ns_per_step = f'{r["nsPerStep"]:.2f}'
+        else:
+            ns_per_step = 'REFUND' if r['stepsPerOp'] < 0 else 'UNPRICED'
+        print(f'{r["op"]:<36}{r["stepType"]:<14}{r["size"]:>8}'
+              f'{r["nsPerOp"]:>14.1f}{r["stepsPerOp"]:>12}{ns_per_step:>12}')
+
+
+def _load_step_costs(path: Optional[str]) -> dict:
+    step_costs = dict(DEFAULT_STEP_COSTS)
+    if path:
+        with open(path, 'r') as f:
+            for key, value in json.load(f).items():
+                step_costs[StepType(key)] = value
+    return step_costs
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(prog='step_calibration.py',
+                                     description='Measure nanoseconds per step for each step type')
+    parser.add_argument('-n', '--iterations', type=int, default=DEFAULT_ITERATIONS,
+                        help='operations per measurement')
+    parser.add_argument('--sizes', type=str, default=','.join(str(s) for s in DEFAULT_SIZES),
+                        help='comma separated value sizes in bytes')
+    parser.add_argument('--step-costs', type=str, default=None,
+                        help='json file of step costs as returned by getStepCosts()')
+    parser.add_argument('--json', action='store_true', help='print results as json')
+    args = parser.parse_args(argv)
+
+    sizes = [int(size) for size in args.sizes.split(',')]
+    db_path = tempfile.mkdtemp(prefix='step_calibration_')
+    calibration = StepCalibration(db_path, _load_step_costs(args.step_costs), args.iterations)
+    try:
+        results = calibration.run(sizes)
+    finally:
+        calibration.close()
+        rmtree(db_path, ignore_errors=True)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        _print_table(results)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))